@@ -15,6 +15,7 @@ from core.domain.comment.comment_model import Comment
 from core.domain.feed.feed_like_model import FeedLike
 from core.domain.feed.feed_model import Feed
 from core.domain.pairing.pairing_model import Pairing
+from core.domain.ranking.like_rollup_query_function import delete_feed_likes
 from core.domain.report.report_model import Report, ReportStatus
 from core.domain.user.user_model import User, UserStatus
 from core.dto.comment_dto import (
@@ -35,6 +36,8 @@ from core.dto.user_dto import (
     UserAdminStatusUpdateRequest,
     UserAdminNicknameUpdateRequest,
 )
+from core.util.autocomplete import keyword_autocomplete_store
+from core.util.cache import pairing_cache_store, user_cache_store
 from core.util.jwt import build_token
 
 router = APIRouter(
@@ -138,6 +141,8 @@ async def get_pairings(request: Request):
 async def create_pairing(request: Request, form: PairingCreateRequest):
     form = form.model_dump()
     pairing = Pairing.create(**form)
+    pairing_cache_store.put(pairing)
+    keyword_autocomplete_store.add_pairing(pairing.name)
     return JSONResponse(
         status_code=status.HTTP_200_OK,
         content=PairingAdminResponse.from_orm(pairing).model_dump(),
@@ -155,6 +160,14 @@ async def update_pairing(request: Request, pairing_id: int, form: PairingUpdateR
         .where(Pairing.id == pairing_id)
         .execute()
     )
+
+    old_pairing = pairing_cache_store.get_or_none(pairing_id)
+    if old_pairing is not None:
+        keyword_autocomplete_store.remove_pairing(old_pairing.name)
+    updated_pairing = Pairing.get_by_id(pairing_id)
+    pairing_cache_store.put(updated_pairing)
+    if not updated_pairing.is_deleted:
+        keyword_autocomplete_store.add_pairing(updated_pairing.name)
     return JSONResponse(status_code=status.HTTP_200_OK, content={})
 
 
@@ -261,6 +274,8 @@ async def update_user_status(
             User.update(status=UserStatus.ACTIVE.value).where(
                 User.id == user_id
             ).execute()
+    for user_id in user_ids:
+        user_cache_store.evict(user_id)
 
 
 @router.put("/users/{user_id}/nickname", dependencies=[Depends(transactional)])
@@ -269,6 +284,7 @@ async def update_user_nickname(
     request: Request, user_id: int, request_body: UserAdminNicknameUpdateRequest
 ):
     User.update(nickname=request_body.nickname).where(User.id == user_id).execute()
+    user_cache_store.evict(user_id)
 
 
 """
@@ -322,9 +338,14 @@ async def delete_feed(
     feed_id: int,
     hard_delete: bool = False,
 ):
+    feed = Feed.get_or_none(Feed.id == feed_id)
+    # 이미 삭제된 피드의 태그는 삭제할 때 자동완성에서 빠졌으므로 다시 빼지 않는다
+    if feed is not None and not feed.is_deleted:
+        keyword_autocomplete_store.remove_tags(feed.user_tags)
+
     if hard_delete:
+        delete_feed_likes(FeedLike.feed == feed_id)
         Feed.delete().where(Feed.id == feed_id).execute()
-        FeedLike.delete().where(FeedLike.feed == feed_id).execute()
         Comment.delete().where(Comment.feed == feed_id).execute()
     else:
         Feed.update(is_deleted=True).where(Feed.id == feed_id).execute()
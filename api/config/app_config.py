@@ -1,26 +1,32 @@
 import importlib
 import logging
 import os
-from asyncio import create_task
-from datetime import datetime
 
 from fastapi import Request
-from fastapi.responses import RedirectResponse, FileResponse
+from fastapi.responses import RedirectResponse, FileResponse, PlainTextResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi_events.handlers.local import local_handler
-from fastapi_events.middleware import EventHandlerASGIMiddleware
 from starlette.middleware.cors import CORSMiddleware
-from starlette.responses import Response, JSONResponse
-from starlette.types import Message
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 
 # Routers
 from admin.router import router as admim_router
-from api.config.middleware import EnhancedTrustedHostMiddleware
+from api.config.middleware import (
+    EnhancedTrustedHostMiddleware,
+    MetricsMiddleware,
+    RequestResponseLoggingMiddleware,
+    admin,
+)
 from app import app
-from core.util.slack import send_slack_message
+from core.client.oauth_client import OAuthClient
+from core.event.outbox_dispatcher import outbox_dispatcher
+from core.util.combination_util import pairing_cooccurrence_store
+from core.util.feed_pool_store import alcohol_feed_pool_store
+from core.util.feed_recommend import feed_recommend_store
+from core.util.image_util import image_process_pool
+from core.util.metrics import http_metrics
+from core.util.ranking_store import ranking_window_store
+from core.util.slack import slack_log_shipper
 
-# from core.event.push_event_handler import handle_create_comment_send_push_handler
 
 app.include_router(admim_router)
 
@@ -47,7 +53,6 @@ app.add_middleware(
     ],
 )
 app.add_middleware(ProxyHeadersMiddleware, trusted_hosts=["*"])
-app.add_middleware(EventHandlerASGIMiddleware, handlers=[local_handler])
 
 origins = [
     # "http://localhost",
@@ -64,91 +69,27 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-
-async def set_body(request: Request, body: bytes):
-    async def receive() -> Message:
-        return {"type": "http.request", "body": body}
-
-    request._receive = receive
-
-
-logging_paths = [
-    "/admin",
-    "/auth",
-    "/feeds",
-    "/pairings",
-    "/ranks",
-    "/reports",
-    "/users",
-]
-
-
-@app.middleware("http")
-async def request_response_logging_middleware(request: Request, call_next):
-    if not request.url.path.startswith(tuple(logging_paths)):
-        return await call_next(request)
-
-    req_body = await request.body()
-    await set_body(request, req_body)
-    try:
-        response = await call_next(request)
-        res_body = b""
-        async for chunk in response.body_iterator:
-            res_body += chunk
-
-        message = f"""
-        ##################################################################
-        [{datetime.now()}] status_code: {response.status_code}
-        {request.method} {str(request.url)}
-        request : {req_body.decode()}
-        response : {res_body.decode()}
-        """
-
-        if not str(response.status_code).startswith("2"):
-            channel = "#error-logs"
-        else:
-            channel = "#api-logs"
-
-        create_task(
-            send_slack_message(
-                channel=channel,
-                icon_emoji=":collision:",
-                sender_name="API 요청 알리미",
-                message=message,
-            )
-        )
-        return Response(
-            status_code=response.status_code,
-            headers=response.headers,
-            content=res_body.decode(),
-            media_type=response.media_type,
-        )
-    except Exception as e:
-        message = f"""
-        ##################################################################
-        [{datetime.now()}] {request.method} {str(request.url)} - (예상치 못한 에러 발생) Exception: {e} - 
-        """
-        create_task(
-            send_slack_message(
-                channel="#error-logs",
-                icon_emoji=":collision:",
-                sender_name="예상치못한예외발생알리미",
-                message=message,
-            )
-        )
-        return JSONResponse(
-            status_code=500,
-            content={
-                "error": "Unexpected Error",
-                "message": str(e),
-                "detail": "예상치 못한 에러가 발생했습니다. 서버 관리자에게 문의해주세요.",
-            },
-            media_type="application/json",
-        )
+# 로깅할 path prefix: 샘플링 비율
+logging_paths = {
+    "/admin": 1.0,
+    "/auth": 1.0,
+    "/feeds": 1.0,
+    "/pairings": 1.0,
+    "/ranks": 1.0,
+    "/reports": 1.0,
+    "/users": 1.0,
+}
+app.add_middleware(
+    RequestResponseLoggingMiddleware,
+    logging_paths=logging_paths,
+    max_body_size=4096,
+)
+# 가장 바깥에서 응답 시간을 측정하기 위해 마지막에 등록
+app.add_middleware(MetricsMiddleware, access_log_sample_rate=0.01)
 
 
 @app.on_event("startup")
-def on_startup():
+async def on_startup():
     from core.config.var_config import IS_PROD
 
     if not IS_PROD:
@@ -156,12 +97,40 @@ def on_startup():
         logger.addHandler(logging.StreamHandler())
         logger.setLevel(logging.DEBUG)
 
+    slack_log_shipper.start()
+    image_process_pool.start()
+    outbox_dispatcher.start()
+    ranking_window_store.start()
+    pairing_cooccurrence_store.start()
+    alcohol_feed_pool_store.start()
+    feed_recommend_store.start()
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    await feed_recommend_store.stop()
+    await alcohol_feed_pool_store.stop()
+    await pairing_cooccurrence_store.stop()
+    await ranking_window_store.stop()
+    await outbox_dispatcher.stop()
+    await slack_log_shipper.stop()
+    await OAuthClient.close()
+    image_process_pool.stop()
+
 
 @app.get("/", include_in_schema=False)
 async def redirect_to_docs(request: Request):
     return RedirectResponse("/docs")
 
 
+@app.get("/metrics", include_in_schema=False)
+@admin
+async def metrics(request: Request):
+    return PlainTextResponse(
+        http_metrics.render(), media_type="text/plain; version=0.0.4"
+    )
+
+
 # Exception handlers
 
 # static path config
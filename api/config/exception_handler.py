@@ -1,5 +1,4 @@
 import traceback
-from asyncio import create_task
 from datetime import datetime
 
 from fastapi import status, Request, HTTPException
@@ -50,13 +49,11 @@ async def handle_unexpected_exceptions(
     {trace_info}
     """
     logger.error(error_message)
-    create_task(
-        send_slack_message(
-            channel="#error-logs",
-            icon_emoji=":collision:",
-            sender_name="님들오류남빨리안고치면인생망함",
-            message=error_message + "<!channel>",
-        )
+    send_slack_message(
+        channel="#error-logs",
+        icon_emoji=":collision:",
+        sender_name="님들오류남빨리안고치면인생망함",
+        message=error_message + "<!channel>",
     )
 
     return JSONResponse(
@@ -1,4 +1,8 @@
+import json
+import random
+import time
 import typing
+from datetime import datetime
 from functools import wraps
 from ipaddress import IPv4Address, IPv4Network
 
@@ -12,10 +16,13 @@ from starlette.responses import (
     Response,
     JSONResponse,
 )
-from starlette.types import ASGIApp, Receive, Scope, Send
+from starlette.types import ASGIApp, Receive, Scope, Send, Message
 
 from api.config.exceptions import UnauthorizedException
 from core.util.jwt import decode_token
+from core.util.logger import logger
+from core.util.metrics import http_metrics
+from core.util.slack import send_slack_message
 
 ENFORCE_DOMAIN_WILDCARD = "Domain wildcard patterns must be like '*.example.com'."
 
@@ -86,6 +93,218 @@ class EnhancedTrustedHostMiddleware:
             await response(scope, receive, send)
 
 
+class RequestResponseLoggingMiddleware:
+    """
+    요청/응답 로깅 미들웨어 (pure ASGI)
+    - 요청, 응답 body는 그대로 흘려보내면서 앞부분(max_body_size)만 복사해서 로깅한다
+    - logging_paths : 로깅할 path prefix별 샘플링 비율 (0.0 ~ 1.0)
+    - 2xx가 아닌 응답은 샘플링과 상관없이 로깅한다
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        logging_paths: typing.Dict[str, float],
+        max_body_size: int = 4096,
+    ) -> None:
+        self.app = app
+        self.logging_paths = sorted(
+            logging_paths.items(), key=lambda item: len(item[0]), reverse=True
+        )
+        self.max_body_size = max_body_size
+
+    def get_sample_rate(self, path: str) -> typing.Optional[float]:
+        for prefix, sample_rate in self.logging_paths:
+            if path.startswith(prefix):
+                return sample_rate
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        sample_rate = self.get_sample_rate(scope["path"])
+        if sample_rate is None:
+            await self.app(scope, receive, send)
+            return
+
+        is_sampled = random.random() < sample_rate
+        request_body = BodyPrefix(self.max_body_size)
+        response_body = BodyPrefix(self.max_body_size)
+        response_status = {"code": None}
+
+        async def logging_receive() -> Message:
+            message = await receive()
+            if message["type"] == "http.request":
+                request_body.append(message.get("body", b""))
+            return message
+
+        async def logging_send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_status["code"] = message["status"]
+            elif message["type"] == "http.response.body":
+                response_body.append(message.get("body", b""))
+            await send(message)
+
+        request = Request(scope)
+        try:
+            await self.app(scope, logging_receive, logging_send)
+        except Exception as e:
+            message = f"""
+        ##################################################################
+        [{datetime.now()}] {request.method} {str(request.url)} - (예상치 못한 에러 발생) Exception: {e} - 
+        """
+            send_slack_message(
+                channel="#error-logs",
+                icon_emoji=":collision:",
+                sender_name="예상치못한예외발생알리미",
+                message=message,
+            )
+            if response_status["code"] is not None:
+                raise e
+
+            response = JSONResponse(
+                status_code=500,
+                content={
+                    "error": "Unexpected Error",
+                    "message": str(e),
+                    "detail": "예상치 못한 에러가 발생했습니다. 서버 관리자에게 문의해주세요.",
+                },
+                media_type="application/json",
+            )
+            await response(scope, receive, send)
+            return
+
+        is_success = str(response_status["code"]).startswith("2")
+        if not is_sampled and is_success:
+            return
+
+        message = f"""
+        ##################################################################
+        [{datetime.now()}] status_code: {response_status["code"]}
+        {request.method} {str(request.url)}
+        request : {request_body.decode()}
+        response : {response_body.decode()}
+        """
+        send_slack_message(
+            channel="#api-logs" if is_success else "#error-logs",
+            icon_emoji=":collision:",
+            sender_name="API 요청 알리미",
+            message=message,
+        )
+
+
+class MetricsMiddleware:
+    """
+    요청 메트릭 수집 미들웨어 (pure ASGI)
+    - route(path 템플릿), method, status 별 요청 수, 응답 시간, 요청/응답 크기, 처리중인 요청 수를 기록한다
+    - access_log_sample_rate : 구조화된(json) access 로그를 남길 비율 (0.0 ~ 1.0), 5xx 응답은 항상 남긴다
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        access_log_sample_rate: float = 0.0,
+        excluded_paths: typing.Sequence[str] = ("/metrics",),
+    ) -> None:
+        self.app = app
+        self.access_log_sample_rate = access_log_sample_rate
+        self.excluded_paths = set(excluded_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        sizes = {"request": 0, "response": 0}
+        response_status = {"code": 500}
+
+        async def metrics_receive() -> Message:
+            message = await receive()
+            if message["type"] == "http.request":
+                sizes["request"] += len(message.get("body", b""))
+            return message
+
+        async def metrics_send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_status["code"] = message["status"]
+            elif message["type"] == "http.response.body":
+                sizes["response"] += len(message.get("body", b""))
+            await send(message)
+
+        http_metrics.requests_in_flight.inc()
+        start_time = time.perf_counter()
+        try:
+            await self.app(scope, metrics_receive, metrics_send)
+        finally:
+            duration = time.perf_counter() - start_time
+            http_metrics.requests_in_flight.dec()
+
+            route = get_route_path(scope)
+            http_metrics.observe(
+                route=route,
+                method=scope["method"],
+                status=response_status["code"],
+                duration=duration,
+                request_size=sizes["request"],
+                response_size=sizes["response"],
+            )
+
+            if (
+                response_status["code"] >= 500
+                or random.random() < self.access_log_sample_rate
+            ):
+                logger.info(
+                    json.dumps(
+                        {
+                            "type": "access",
+                            "method": scope["method"],
+                            "route": route,
+                            "path": scope["path"],
+                            "status": response_status["code"],
+                            "duration_ms": round(duration * 1000, 3),
+                            "request_size": sizes["request"],
+                            "response_size": sizes["response"],
+                        },
+                        ensure_ascii=False,
+                    )
+                )
+
+
+def get_route_path(scope: Scope) -> str:
+    """
+    라우팅된 path 템플릿 (ex. /feeds/{feed_id}), 매칭되는 라우트가 없으면 <unmatched>
+    """
+    route = scope.get("route")
+    if route is not None and hasattr(route, "path"):
+        return route.path
+    return "<unmatched>"
+
+
+class BodyPrefix:
+    """
+    body 청크를 max_size 까지만 복사해두는 버퍼
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.buffer = bytearray()
+        self.total_size = 0
+
+    def append(self, chunk: bytes):
+        self.total_size += len(chunk)
+        remaining = self.max_size - len(self.buffer)
+        if remaining > 0:
+            self.buffer.extend(chunk[:remaining])
+
+    def decode(self) -> str:
+        text = self.buffer.decode(errors="replace")
+        if self.total_size > len(self.buffer):
+            text += f" ...(truncated, total {self.total_size} bytes)"
+        return text
+
+
 invalid_token_response = JSONResponse(
     status_code=status.HTTP_400_BAD_REQUEST,
     content={"error": "InvalidTokenException", "message": "Invalid token type"},
@@ -187,7 +406,7 @@ def admin(call_next: RequestResponseEndpoint):
                 return invalid_token_response
 
             login_user = decode_token(token)
-            if "is_admin_token" in login_user and login_user["is_admin_token"] != True:
+            if login_user.get("is_admin_token") != True:
                 raise UnauthorizedException()
 
             request.state.admin = login_user
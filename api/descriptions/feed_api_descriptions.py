@@ -85,14 +85,17 @@ GET_FEEDS_ORDER_BY_FEED_LIKE = """
 - 정렬된 3개의 피드를 조회합니다.
 - 피드 대표사진 포함 데이터 및 작성자 간략 정보를 포함합니다
 - order_by_popular 쿼리 파라미터로 좋아요 많은 조합 피드, 색다른 조합 피드를 조회합니다
+- 랭킹 배치에서 집계한 조합 기준으로 조회합니다. (좋아요 수는 실시간 반영)
 """
 
 GET_FEEDS_BY_PREFERENCES_DESC = """
-취향 기반으로 피드 랜덤 추천 조회
+취향 기반 피드 추천 조회
 
-- 로그인 되어있지 않으면 랜덤 피드 5개를 조회합니다.
-- 로그인되어 있으면 선택한 취향을 포함하는 랜덤 피드 5개를 조회합니다.
-- 만약 선택한 취향을 포함하는 피드가 없거나, 취향기반으로 조회한 피드가 5개보다 적으면, 랜덤피드로 5개를 채워서 조회합니다.
+- 로그인한 유저의 취향(술, 안주)과 겹치는 페어링이 많은 피드부터, 같으면 최신이고 좋아요가 많은 피드 순으로 size개를 조회합니다.
+- 취향과 겹치는 피드가 size개보다 적으면 최신이고 좋아요가 많은 피드로 채워서 조회합니다.
+- exclude_feed_ids로 이미 본 피드를 넘기면 제외하고 조회합니다. (ex. ?exclude_feed_ids=1&exclude_feed_ids=2)
+- 차단한 유저의 피드는 제외합니다.
+- 추천 목록은 5분마다 갱신됩니다.
 """
 
 GET_FEEDS_BY_ALCOHOLS_DESC = """
@@ -105,7 +108,18 @@ FEED_LIKE_DESC = """
 
 SEARCH_FEED_DESC = """
 비로그인 - 피드 검색
-- 키워드는 앞뒤 공백 제거합니다.
-- 키워드 포함 피드는 최대 15개씩 조회 됩니다.
-- 제목, 내용에 키워드 포함을 검색합니다.
+- 키워드는 앞뒤 공백 제거합니다. 공백으로 구분된 단어가 모두 포함된 피드를 검색합니다.
+- 제목, 내용, 유저 태그, 술/안주 이름에서 검색합니다.
+- 제목 > 태그(유저 태그, 술/안주 이름) > 내용 순으로 매칭된 피드가 먼저 조회됩니다.
+- 키워드 포함 피드는 기본 15개(size)씩 조회 됩니다.
+- 다음 페이지는 응답의 next_cursor를 cursor로 넣어주세요. (최초 조회는 비워서 요청)
+- highlights : 제목(title), 내용(content)에서 키워드가 등장하는 [start, end) 위치
+"""
+
+AUTOCOMPLETE_FEED_KEYWORD_DESC = """
+피드 검색어 자동완성
+
+- keyword로 시작하는 술/안주 이름(pairing), 유저 태그(tag)를 조회합니다.
+- 공백, '#'은 무시하고 비교합니다. (ex. "참이" -> 참이슬, "#소" -> #소맥)
+- 술/안주 이름이 먼저, 그 다음 많이 쓰인 태그 순으로 최대 size개 조회됩니다.
 """
@@ -2,5 +2,34 @@ UPLOAD_FILE_DESC = """
 파일 업로드
 
 - 디렉토리 : images
+- 지원 형식 : png, jpeg, gif, webp, heic (파일 내용으로 판별)
 - 별도 로그인 필요 없음
+- 응답 : url(원본), thumbnail_url(400px 썸네일), webp_url(webp 변환본)
+- heic 등 변환할 수 없는 이미지는 thumbnail_url, webp_url이 null
+"""
+
+UPLOAD_FILES_DESC = """
+파일 여러개 업로드
+
+- 디렉토리 : images
+- 지원 형식 : png, jpeg, gif, webp, heic (파일 내용으로 판별)
+- 한번에 최대 10개, 요청한 순서대로 files 리스트 반환 (각 항목은 단일 업로드 응답과 동일)
+"""
+
+CREATE_PRESIGNED_UPLOAD_DESC = """
+S3 직접 업로드용 presigned POST 발급 (API 서버를 거치지 않고 업로드)
+
+- content_type : image/png, image/jpeg, image/gif, image/webp, image/heic
+- 응답 : url, fields, key, file_url
+- 클라이언트는 url에 fields의 값들과 file(마지막 필드)을 multipart/form-data로 POST
+- 10분 안에 업로드해야 하고, 파일 크기는 8MB 이하
+- 업로드 후 /files/presigned-post/confirm 에 key를 보내야 등록됨
+"""
+
+CONFIRM_PRESIGNED_UPLOAD_DESC = """
+presigned POST로 업로드한 파일 등록
+
+- key : presigned POST 발급 시 받은 key (본인이 발급받은 key만 등록 가능)
+- 파일 내용이 이미지가 아니거나 크기가 맞지 않으면 삭제 후 400
+- 응답 : url(원본), thumbnail_url, webp_url (직접 업로드한 파일은 변환 이미지가 없어 null)
 """
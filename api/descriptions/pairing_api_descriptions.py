@@ -5,3 +5,11 @@ MVP에서는 안주만 등록 요청 가능합니다.
 type: 술, 안주
 subtype: 술 종류, 안주 종류 (ex. 마른안주, 육류)
 """
+
+GET_PAIRING_RECOMMENDATIONS_DESC = """
+술, 안주 추천 조회 - 술이면 잘 어울리는 안주, 안주면 잘 어울리는 술을 조회합니다.
+
+- 같은 피드에 함께 태그된 횟수 + 그 피드들이 받은 좋아요 수가 많은 순입니다 (score)
+- size: 조회 개수 (default: 10, 최대 50)
+- 1분마다 갱신됩니다
+"""
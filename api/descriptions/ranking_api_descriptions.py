@@ -21,3 +21,25 @@ GET_TAGS_RELATED_FEEDS_DESC = """
 - tags는 classify_tags를 의미합니다.
 - tags는 한글로 입력해주세요
 """
+
+GET_COMBINATION_WINDOW_RANKING_DESC = """
+기간별 조합 랭킹 조회
+
+- window: 24h | 7d | 30d | all | trending (default: 7d)
+  - 24h, 7d, 30d : 최근 기간 동안 받은 좋아요 수 (일 단위 집계라 경계 날짜는 지난 시간 비율만큼 반영)
+  - all : 전체 기간 좋아요 수
+  - trending : 최근 좋아요일수록 가중치가 높은 점수 (3일마다 가중치 절반)
+- size: 조회 개수 (default: 3, 최대 50)
+- 랭킹은 5분마다 갱신되며 updated_at은 마지막 갱신 시간입니다
+"""
+
+GET_ALCOHOL_WINDOW_RANKING_DESC = """
+기간별 술 랭킹 조회
+
+- window: 24h | 7d | 30d | all | trending (default: 7d)
+  - 24h, 7d, 30d : 최근 기간 동안 받은 좋아요 수 (일 단위 집계라 경계 날짜는 지난 시간 비율만큼 반영)
+  - all : 전체 기간 좋아요 수
+  - trending : 최근 좋아요일수록 가중치가 높은 점수 (3일마다 가중치 절반)
+- size: 조회 개수 (default: 10, 최대 50)
+- 랭킹은 5분마다 갱신되며 updated_at은 마지막 갱신 시간입니다
+"""
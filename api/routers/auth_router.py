@@ -24,7 +24,7 @@ router = APIRouter(
 async def sign_in_with_google(
     request: Request, google_credentials: GoogleCredentialsRequest
 ):
-    user_info = OAuthClient.verify_google_token(google_credentials)
+    user_info = await OAuthClient.verify_google_token(google_credentials)
 
     user = User.get_or_none(
         User.uid == user_info["email"],
@@ -56,7 +56,7 @@ async def sign_in_with_google(
 async def sign_in_with_kakao(
     request: Request, kakao_credentials: KakaoCredentialsRequest
 ):
-    user_info = OAuthClient.verify_kakao_token(kakao_credentials)
+    user_info = await OAuthClient.verify_kakao_token(kakao_credentials)
     print(user_info)
     user = User.get_or_none(
         User.uid == user_info["kakao_account"]["email"],
@@ -89,7 +89,7 @@ async def sign_in_with_kakao(
 async def sign_in_with_apple(
     request: Request, apple_credentials: AppleCredentialsRequest
 ):
-    user_info = OAuthClient.verify_apple_token(apple_credentials)
+    user_info = await OAuthClient.verify_apple_token(apple_credentials)
 
     user = User.get_or_none(
         User.social_type == "apple",
@@ -7,6 +7,7 @@ from api.descriptions.responses_dict import NOT_FOUND_RESPONSE, UNAUTHORIZED_RES
 from core.config.orm_config import read_only, transactional
 from core.domain.comment.comment_model import Comment
 from core.domain.feed.feed_model import Feed
+from core.domain.outbox.outbox_event_query_function import save_outbox_event
 from core.domain.user.user_model import User
 from core.dto.comment_dto import (
     CommentResponse,
@@ -15,7 +16,13 @@ from core.dto.comment_dto import (
     CommentUpdateRequest,
     CommentDto,
 )
-from core.util.auth_util import get_login_user_id, AuthRequired, AuthOptional
+from core.util.auth_util import (
+    get_login_user_id,
+    get_login_user_or_raise,
+    AuthRequired,
+    AuthOptional,
+)
+from core.event.events import CommentEvents, CreateCommentPayload
 from core.util.comment_util import CommentBuilder
 
 router = APIRouter(
@@ -36,9 +43,10 @@ async def create_comment(
     feed = Feed.get_or_raise(feed_id)
     request_body.validate_input()
 
-    login_user = User.get_or_raise(get_login_user_id(request))
+    login_user = get_login_user_or_raise(request)
+    parent_comment = None
     if request_body.parent_comment_id is not None:
-        Comment.get_or_raise(request_body.parent_comment_id)
+        parent_comment = Comment.get_or_raise(request_body.parent_comment_id)
         comment = Comment.create(
             user=login_user,
             feed=feed_id,
@@ -52,6 +60,19 @@ async def create_comment(
             content=request_body.content,
         )
 
+    # 알림은 커밋 이후 OutboxDispatcher가 처리 (댓글 작성과 같은 트랜잭션에서 저장)
+    save_outbox_event(
+        CommentEvents.CREATE_COMMENT.value,
+        CreateCommentPayload(
+            feed_owner_user_id=feed.user_id,
+            parent_comment_writer_user_id=(
+                parent_comment.user_id if parent_comment is not None else None
+            ),
+            comment_writer_user_id=login_user.id,
+            comment_id=comment.id,
+        ),
+    )
+
     return CommentResponse.of(
         comment=comment,
         parent_comment_id=request_body.parent_comment_id,
@@ -1,8 +1,6 @@
-import random
-from typing import List
+from typing import List, Optional, Dict
 
-from fastapi import APIRouter, Depends
-from peewee import fn
+from fastapi import APIRouter, Depends, Query
 from starlette.requests import Request
 
 from ai.inference import (
@@ -23,7 +21,9 @@ from api.descriptions.feed_api_descriptions import (
     GET_FEEDS_BY_ALCOHOLS_DESC,
     FEED_LIKE_DESC,
     SEARCH_FEED_DESC,
+    AUTOCOMPLETE_FEED_KEYWORD_DESC,
 )
+from api.config.exceptions import BadRequestException
 from api.descriptions.responses_dict import (
     UNAUTHORIZED_RESPONSE,
     NOT_FOUND_RESPONSE,
@@ -39,15 +39,21 @@ from core.domain.feed.feed_query_function import (
     fetch_feeds_liked_by_me,
     fetch_my_feeds,
     fetch_feeds_randomly,
-    fetch_all_by_alcohol_ids,
-    fetch_feeds_order_by_feed_like_and_cominations,
+    search_feeds_by_keyword,
+    save_feed_search_document,
 )
-from core.domain.pairing.pairing_model import Pairing
-from core.domain.ranking.ranking_query_function import (
-    fetch_like_counts_group_by_combination,
+from core.domain.file.uploaded_image_query_function import (
+    fetch_uploaded_image_by_url,
+    fetch_thumbnail_url,
+)
+from core.domain.ranking.like_rollup_query_function import (
+    save_feed_like,
+    delete_feed_likes,
+)
+from core.domain.ranking.popular_feed_query_function import (
+    fetch_popular_feeds,
+    add_popular_feed_like_count,
 )
-from core.domain.user.user_model import User
-from core.domain.user.user_query_function import get_blocked_user_ids
 from core.dto.feed_dto import (
     FeedResponse,
     FeedUpdateRequest,
@@ -55,24 +61,30 @@ from core.dto.feed_dto import (
     FeedSoftDeleteResponse,
     RandomFeedListResponse,
     PopularFeedListDto,
+    PopularFeedDto,
     FeedByPreferenceListResponse,
     FeedByAlcoholListResponse,
-    FeedByAlcoholResponse,
     ClassificationResponse,
     PairingDto,
     FeedLikeResponse,
     FeedSearchListResponse,
     RandomFeedDto,
+    FeedAutocompleteListResponse,
+    FeedAutocompleteResponse,
 )
 from core.dto.page_dto import CursorPageResponse
 from core.util.auth_util import (
     get_login_user_id,
     get_login_user_or_none,
+    get_login_user_or_raise,
     AuthRequired,
     AuthOptional,
 )
-from core.util.cache import pairing_cache_store
-from core.util.feed_util import FeedResponseBuilder, parse_user_tags
+from core.util.autocomplete import keyword_autocomplete_store, normalize_keyword
+from core.util.cache import pairing_cache_store, user_block_cache_store
+from core.util.feed_pool_store import alcohol_feed_pool_store
+from core.util.feed_recommend import feed_recommend_store
+from core.util.feed_util import FeedResponseBuilder, FeedHydrator, parse_user_tags
 
 router = APIRouter(
     prefix="/feeds",
@@ -82,10 +94,15 @@ router = APIRouter(
 
 @router.post(
     "/classifications",
+    dependencies=[Depends(read_only)],
     response_model=ClassificationResponse,
     description=CLASSIFY_IMAGE_DESC,
 )
 async def classify_image_by_ai(image_url: str):
+    # 업로드 시 만들어둔 224px 이미지가 있으면 그걸로 추론
+    uploaded_image = fetch_uploaded_image_by_url(image_url)
+    if uploaded_image is not None and uploaded_image.classifier_image_url:
+        image_url = uploaded_image.classifier_image_url
     classified_names = classify(image_url)
     alcohols = pairing_cache_store.get_all_by_names(classified_names.alcohols)
     foods = pairing_cache_store.get_all_by_names(classified_names.foods)
@@ -105,8 +122,9 @@ async def classify_image_by_ai(image_url: str):
 async def get_all_my_feeds(
     request: Request, next_feed_id: int = 0, size: int = DEFAULT_PAGE_SIZE
 ):
-    my_feeds = fetch_my_feeds(get_login_user_id(request), next_feed_id, size)
-    return CursorPageResponse.of_feeds(my_feeds)
+    login_user_id = get_login_user_id(request)
+    my_feeds = fetch_my_feeds(login_user_id, next_feed_id, size)
+    return FeedResponseBuilder.feeds(my_feeds, size, login_user_id)
 
 
 @router.get(
@@ -121,14 +139,13 @@ async def get_all_liked_feeds_by_me(
 ):
     login_user_id = get_login_user_id(request)
     feeds_liked_by_me: List[Feed] = fetch_feeds_liked_by_me(
-        login_user_id, next_feed_id, size
+        login_user_id,
+        next_feed_id,
+        size,
+        blocked_user_ids=user_block_cache_store.get_blocked_user_ids(login_user_id),
     )
-    blocked_user_ids = get_blocked_user_ids(login_user_id)
-    block_filtered_feeds = [
-        feed for feed in feeds_liked_by_me if feed.user not in blocked_user_ids
-    ]
 
-    return CursorPageResponse.of_feeds(block_filtered_feeds)
+    return FeedResponseBuilder.feeds(feeds_liked_by_me, size, login_user_id)
 
 
 @router.get(
@@ -145,33 +162,63 @@ async def get_random_feeds(
     exclude_feed_ids = [int(i) for i in exclude_feed_ids.split(",") if i != ""]
     login_user_id = get_login_user_id(request)
     random_feeds: List[RandomFeedDto] = fetch_feeds_randomly(
-        size, exclude_feed_ids, login_user_id
+        size,
+        exclude_feed_ids,
+        login_user_id,
+        blocked_user_ids=user_block_cache_store.get_blocked_user_ids(login_user_id),
     )
-    if login_user_id is not None:
-        blocked_user_ids = get_blocked_user_ids(login_user_id)
-        random_feeds = [
-            feed for feed in random_feeds if feed.user_id not in blocked_user_ids
-        ]
     return RandomFeedListResponse.of_query_dto(random_feeds)
 
 
 @router.get(
     "/search",
-    dependencies=[Depends(read_only)],
+    dependencies=[Depends(read_only), Depends(AuthOptional())],
     description=SEARCH_FEED_DESC,
     response_model=FeedSearchListResponse,
 )
-async def search_feeds(keyword: str):
+async def search_feeds(
+    request: Request,
+    keyword: str,
+    cursor: Optional[str] = None,
+    size: int = Query(default=15, ge=1, le=50),
+):
     keyword = keyword.strip()
-    feeds = (
-        Feed.select()
-        .where(
-            Feed.title.contains(keyword) | Feed.content.contains(keyword),
-            Feed.is_deleted == False,
+    cursor_relevance, cursor_feed_id = None, None
+    if cursor:
+        try:
+            cursor_relevance, cursor_feed_id = [int(i) for i in cursor.split(":")]
+        except ValueError:
+            raise BadRequestException(f"({cursor}) 잘못된 커서입니다.")
+
+    feeds = list(
+        search_feeds_by_keyword(
+            keyword,
+            size,
+            cursor_relevance,
+            cursor_feed_id,
+            blocked_user_ids=user_block_cache_store.get_blocked_user_ids(
+                get_login_user_id(request)
+            ),
         )
-        .limit(15)
     )
-    return FeedSearchListResponse.of(feeds)
+    return FeedSearchListResponse.of(feeds, keyword, size)
+
+
+@router.get(
+    "/autocomplete",
+    dependencies=[Depends(read_only)],
+    description=AUTOCOMPLETE_FEED_KEYWORD_DESC,
+    response_model=FeedAutocompleteListResponse,
+)
+async def autocomplete_feed_keyword(
+    keyword: str, size: int = Query(default=10, ge=1, le=50)
+):
+    return FeedAutocompleteListResponse(
+        results=[
+            FeedAutocompleteResponse(keyword=entry.keyword, type=entry.type.value)
+            for entry in keyword_autocomplete_store.search(keyword, size)
+        ]
+    )
 
 
 @router.get(
@@ -181,27 +228,19 @@ async def search_feeds(keyword: str):
     description=GET_FEEDS_ORDER_BY_FEED_LIKE,
 )
 async def get_feeds_order_by_feed_like(request: Request, order_by_popular: bool = True):
-    # TODO 나중에 배치에서 만든 테이블에 쿼리하도록
-    comb_ids_list = []
-    for row in fetch_like_counts_group_by_combination(
-        order_by_popular=order_by_popular, limit=3
+    data: Dict[int, PopularFeedListDto] = {}
+    for popular_feed in fetch_popular_feeds(
+        order_by_popular=order_by_popular,
+        blocked_user_ids=user_block_cache_store.get_blocked_user_ids(
+            get_login_user_id(request)
+        ),
     ):
-        comb_ids_list.append(row.combined_ids)
-    data = []
-    for idx, comb_ids in enumerate(comb_ids_list):
-        data.append(
-            PopularFeedListDto(
-                title=f"{idx + 1}번째",
-                feeds=[
-                    row
-                    for row in fetch_feeds_order_by_feed_like_and_cominations(
-                        combination_ids=comb_ids, order_by_popular=order_by_popular
-                    )
-                ],
-            )
-        )
+        rank = popular_feed.combination_rank
+        if rank not in data:
+            data[rank] = PopularFeedListDto(title=f"{rank}번째")
+        data[rank].feeds.append(PopularFeedDto.of(popular_feed))
 
-    return data
+    return list(data.values())
 
 
 @router.get(
@@ -210,79 +249,32 @@ async def get_feeds_order_by_feed_like(request: Request, order_by_popular: bool
     response_model=FeedByPreferenceListResponse,
     description=GET_FEEDS_BY_PREFERENCES_DESC,
 )
-async def get_feeds_by_preferences(request: Request):
-    def get_randomly(pairings: List[int]) -> List[int]:
-        return random.sample(pairings, random.randint(1, len(pairings)))
-
-    size = 5
-    login_user = User.get_or_raise(get_login_user_id(request))
-    random_feeds = [
-        feed
-        for feed in Feed.select(Feed.is_deleted == False)
-        .order_by(fn.Random())
-        .limit(size * 2)
-    ]  # 넉넉하게 size 2배만큼 랜덤 피드를 가져온다
-
-    alcohols = get_randomly(login_user.preference["alcohols"])
-    foods = get_randomly(login_user.preference["foods"])
-    feeds_by_preferences = [
-        feed
-        for feed in Feed.select()
-        .where(
-            (
-                Feed.alcohol_pairing_ids.contains_any(alcohols)
-                | Feed.food_pairing_ids.contains_any(foods)
-            ),
-            Feed.is_deleted == False,
+async def get_feeds_by_preferences(
+    request: Request,
+    size: int = Query(default=5, ge=1, le=50),
+    exclude_feed_ids: List[int] = Query(default=[]),
+):
+    login_user = get_login_user_or_raise(request)
+    return FeedByPreferenceListResponse(
+        feeds=feed_recommend_store.recommend(
+            login_user.preference,
+            size,
+            exclude_feed_ids=exclude_feed_ids,
+            blocked_user_ids=user_block_cache_store.get_blocked_user_ids(login_user.id),
         )
-        .order_by(fn.Random())
-        .limit(size)
-    ]
-
-    if len(feeds_by_preferences) < size:  # 만약 취향으로 가져온 피드 size보다 적으면 나머지는 랜덤피드로 채워넣는다
-        feeds_by_preferences.extend(random_feeds[: size - len(feeds_by_preferences)])
-
-    none_filtered_feeds: List[Feed] = [
-        feed for feed in feeds_by_preferences if feed.id is not None
-    ]
-
-    blocked_user_ids = get_blocked_user_ids(login_user.id)
-    block_filtered_feeds = [
-        feed for feed in none_filtered_feeds if feed.user not in blocked_user_ids
-    ]
-
-    return FeedByPreferenceListResponse.of(block_filtered_feeds)
+    )
 
 
-# TODO : 쿼리 최적화
 @router.get(
     path="/by-alcohols",
-    dependencies=[Depends(read_only)],
     response_model=FeedByAlcoholListResponse,
     description=GET_FEEDS_BY_ALCOHOLS_DESC,
 )
 async def get_feeds_by_alcohols():
-    alcohols = (
-        Pairing.select(Pairing.subtype, fn.array_agg(Pairing.id).alias("ids"))
-        .where(Pairing.type == "술")
-        .group_by(Pairing.subtype)
+    # subtype별 후보는 백그라운드에서 미리 조회해두고, 여기서는 뽑기만 한다
+    return FeedByAlcoholListResponse.of(
+        alcohol_feed_pool_store.sample(size=5), alcohol_feed_pool_store.get_subtypes()
     )
-    alcohol_ids_dict = {
-        alcohol.subtype: [i for i in alcohol.ids] for alcohol in alcohols
-    }
-    size = 5
-
-    total_feeds = []
-    for subtype, alcohol_ids in alcohol_ids_dict.items():
-        feeds = []
-        for feed in fetch_all_by_alcohol_ids(alcohol_ids, size):
-            food_names = pairing_cache_store.get_all_names_by_ids(feed.food_pairing_ids)
-            feeds.append(FeedByAlcoholResponse.of(subtype, feed, food_names))
-        total_feeds.extend(feeds)
-    # 정렬 순서 때문에 하드코딩
-    alcohol_subtypes = ["소주", "맥주", "막걸리", "하이볼", "와인"]
-
-    return FeedByAlcoholListResponse.of(total_feeds, alcohol_subtypes)
 
 
 @router.get(
@@ -293,25 +285,10 @@ async def get_feeds_by_alcohols():
     responses=NOT_FOUND_RESPONSE,
 )
 async def get_feed_by_id(request: Request, feed_id: int):
-    login_user = User.get_or_none(get_login_user_id(request))
     feed = Feed.get_or_raise(feed_id)
-    likes = FeedLike.select().where(FeedLike.feed == feed)
-    comments_count = (
-        Comment.select()
-        .where(Comment.feed == feed, Comment.is_deleted == False)
-        .count()
-    )
-
     feed.add_view_count()
 
-    return FeedResponse.of(
-        feed=feed,
-        likes_count=len(likes),
-        comments_count=comments_count,
-        is_liked=any(like.user.id == login_user.id for like in likes)
-        if login_user is not None
-        else False,
-    )
+    return FeedHydrator(get_login_user_id(request)).hydrate_feeds([feed])[0]
 
 
 @router.get(
@@ -326,15 +303,12 @@ async def get_related_feeds(
 ):
     login_user_id = get_login_user_id(request)
     related_feeds: List[Feed] = fetch_related_feeds_by_feed_id(
-        feed_id, next_feed_id, size
+        feed_id,
+        next_feed_id,
+        size,
+        blocked_user_ids=user_block_cache_store.get_blocked_user_ids(login_user_id),
     )
 
-    if login_user_id is not None:
-        blocked_user_ids = get_blocked_user_ids(login_user_id)
-        related_feeds = [
-            feed for feed in related_feeds if feed.user not in blocked_user_ids
-        ]
-
     return FeedResponseBuilder.related_feeds(
         feeds=related_feeds,
         size=size,
@@ -350,19 +324,22 @@ async def get_related_feeds(
     responses={**NOT_FOUND_RESPONSE, **UNAUTHORIZED_RESPONSE},
 )
 async def create_feed(request: Request, request_body: FeedCreateRequest):
-    login_user = User.get_or_raise(get_login_user_id(request))
+    login_user = get_login_user_or_raise(request)
     request_body.validate_input()
     feed = Feed.create(
         user=login_user,
         title=request_body.title,
         content=request_body.content,
         represent_image=request_body.represent_image,
+        thumbnail_image=fetch_thumbnail_url(request_body.represent_image),
         images=request_body.images,
         score=request_body.score,
         alcohol_pairing_ids=sorted(request_body.alcohol_pairing_ids),
         food_pairing_ids=sorted(request_body.food_pairing_ids),
         user_tags=parse_user_tags(request_body.user_tags_raw_string),
     )
+    save_feed_search_document(feed)
+    keyword_autocomplete_store.add_tags(feed.user_tags)
     return FeedResponse.from_orm(feed).model_dump()
 
 
@@ -377,12 +354,24 @@ async def update_feed(request: Request, feed_id: int, request_body: FeedUpdateRe
     request_body.validate_input()
     feed = Feed.get_or_raise(feed_id)
     feed.check_if_owner(login_user_id)
+    previous_tags = feed.user_tags or []
+    previous_tag_keys = {normalize_keyword(tag) for tag in previous_tags}
     feed.update_feed(
         request_body.title,
         request_body.content,
         request_body.images,
         request_body.user_tags,
     )
+    save_feed_search_document(feed)
+    # 수정 전에도 있던 태그는 이미 가중치에 반영되어 있으므로 새로 추가된 태그만 더하고, 빠진 태그는 뺀다
+    tags = feed.user_tags or []
+    tag_keys = {normalize_keyword(tag) for tag in tags}
+    keyword_autocomplete_store.add_tags(
+        [tag for tag in tags if normalize_keyword(tag) not in previous_tag_keys]
+    )
+    keyword_autocomplete_store.remove_tags(
+        [tag for tag in previous_tags if normalize_keyword(tag) not in tag_keys]
+    )
     return FeedResponse.from_orm(feed).model_dump()
 
 
@@ -398,10 +387,11 @@ async def soft_delete_feed(request: Request, feed_id: int):
     feed.check_if_owner(get_login_user_id(request))
 
     feed.soft_delete()
+    keyword_autocomplete_store.remove_tags(feed.user_tags)
     deleted_comment_count = (
         Comment.update(is_deleted=True).where(Comment.feed == feed).execute()
     )
-    deleted_likes_count = FeedLike.delete().where(FeedLike.feed == feed).execute()
+    deleted_likes_count = delete_feed_likes(FeedLike.feed == feed)
 
     return FeedSoftDeleteResponse.of(feed, deleted_comment_count, deleted_likes_count)
 
@@ -419,12 +409,12 @@ async def like_feed(request: Request, feed_id: int):
     feed_like: FeedLike = FeedLike.get_or_none(user=login_user_id, feed=feed)
 
     if feed_like is None:
-        FeedLike.create(user=login_user_id, feed=feed)
+        save_feed_like(login_user_id, feed.id)
+        add_popular_feed_like_count(feed.id, 1)
         is_liked = True
     else:
-        feed_like.delete().where(
-            FeedLike.user == login_user_id, FeedLike.feed == feed
-        ).execute()
+        delete_feed_likes(FeedLike.user == login_user_id, FeedLike.feed == feed)
+        add_popular_feed_like_count(feed.id, -1)
         is_liked = False
 
     return FeedLikeResponse.of(feed.id, is_liked)
@@ -1,11 +1,24 @@
 from enum import Enum
+from typing import List
 
-from fastapi import UploadFile, APIRouter, Depends
+from fastapi import UploadFile, APIRouter, Depends, Request
 from starlette.responses import JSONResponse
 
-from api.descriptions.file_api_descriptions import UPLOAD_FILE_DESC
-from core.util.auth_util import AuthRequired
-from core.util.file_util import upload_file_to_s3
+from api.descriptions.file_api_descriptions import (
+    UPLOAD_FILE_DESC,
+    UPLOAD_FILES_DESC,
+    CREATE_PRESIGNED_UPLOAD_DESC,
+    CONFIRM_PRESIGNED_UPLOAD_DESC,
+)
+from core.config.orm_config import reset_db_state
+from core.domain.file.uploaded_image_model import UploadedImage
+from core.util.auth_util import AuthRequired, get_login_user_id
+from core.util.file_util import (
+    upload_file_to_s3,
+    upload_files_to_s3,
+    create_presigned_upload,
+    confirm_presigned_upload,
+)
 
 router = APIRouter(
     prefix="/files",
@@ -17,9 +30,62 @@ class FileDirectory(Enum):
     IMAGES = "images"
 
 
+def to_upload_response(uploaded_image: UploadedImage) -> dict:
+    return {
+        "url": uploaded_image.url,
+        "thumbnail_url": uploaded_image.thumbnail_url,
+        "webp_url": uploaded_image.webp_url,
+    }
+
+
+@router.post(
+    "/upload",
+    dependencies=[Depends(reset_db_state), Depends(AuthRequired())],
+    description=UPLOAD_FILE_DESC,
+)
+async def upload(request: Request, file: UploadFile, directory: FileDirectory):
+    uploaded_image = await upload_file_to_s3(
+        file, directory.value, get_login_user_id(request)
+    )
+    return JSONResponse(content=to_upload_response(uploaded_image))
+
+
+@router.post(
+    "/upload/multiple",
+    dependencies=[Depends(reset_db_state), Depends(AuthRequired())],
+    description=UPLOAD_FILES_DESC,
+)
+async def upload_multiple(
+    request: Request, files: List[UploadFile], directory: FileDirectory
+):
+    uploaded_images = await upload_files_to_s3(
+        files, directory.value, get_login_user_id(request)
+    )
+    return JSONResponse(
+        content={"files": [to_upload_response(image) for image in uploaded_images]}
+    )
+
+
+@router.post(
+    "/presigned-post",
+    dependencies=[Depends(reset_db_state), Depends(AuthRequired())],
+    description=CREATE_PRESIGNED_UPLOAD_DESC,
+)
+async def create_presigned_post(
+    request: Request, directory: FileDirectory, content_type: str
+):
+    return JSONResponse(
+        content=create_presigned_upload(
+            directory.value, content_type, get_login_user_id(request)
+        )
+    )
+
+
 @router.post(
-    "/upload", dependencies=[Depends(AuthRequired())], description=UPLOAD_FILE_DESC
+    "/presigned-post/confirm",
+    dependencies=[Depends(reset_db_state), Depends(AuthRequired())],
+    description=CONFIRM_PRESIGNED_UPLOAD_DESC,
 )
-async def upload(file: UploadFile, directory: FileDirectory):
-    url = upload_file_to_s3(file, directory.value)
-    return JSONResponse(content={"url": url})
+async def confirm_presigned_post(request: Request, key: str):
+    uploaded_image = await confirm_presigned_upload(key, get_login_user_id(request))
+    return JSONResponse(content=to_upload_response(uploaded_image))
@@ -1,6 +1,10 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 
-from api.descriptions.pairing_api_descriptions import REQUEST_PAIRING_BY_USER_DESC
+from api.config.exceptions import NotFoundException
+from api.descriptions.pairing_api_descriptions import (
+    REQUEST_PAIRING_BY_USER_DESC,
+    GET_PAIRING_RECOMMENDATIONS_DESC,
+)
 from core.config.orm_config import transactional, read_only
 from core.domain.pairing.pairing_model import Pairing
 from core.domain.pairing.pairing_request_model import PairingRequest
@@ -10,7 +14,11 @@ from core.dto.pairing_dto import (
     PairingSearchType,
     PairingRequestByUserRequest,
     PairingRequestByUserResponse,
+    PairingRecommendResponse,
+    PairingRecommendationListResponse,
 )
+from core.util.cache import pairing_cache_store
+from core.util.combination_util import pairing_cooccurrence_store
 
 router = APIRouter(
     prefix="/pairings",
@@ -44,6 +52,42 @@ async def get_pairing_by_id(pairing_id: int):
     return PairingResponse.from_orm(pairing)
 
 
+@router.get(
+    "/{pairing_id}/recommendations",
+    response_model=PairingRecommendationListResponse,
+    description=GET_PAIRING_RECOMMENDATIONS_DESC,
+)
+async def get_pairing_recommendations(
+    pairing_id: int, size: int = Query(default=10, ge=1, le=50)
+):
+    pairing = pairing_cache_store.get_or_none(pairing_id)
+    if pairing is None:
+        raise NotFoundException(target_entity=Pairing, target_id=pairing_id)
+
+    if pairing.type == PairingSearchType.술:
+        recommendations = pairing_cooccurrence_store.best_foods_for_alcohol(
+            pairing_id, size
+        )
+    else:
+        recommendations = pairing_cooccurrence_store.best_alcohols_for_food(
+            pairing_id, size
+        )
+
+    response = PairingRecommendationListResponse(
+        pairing=PairingResponse.from_orm(pairing), recommendations=[]
+    )
+    for recommended_id, score in recommendations:
+        recommended = pairing_cache_store.get_or_none(recommended_id)
+        if recommended is None:  # 삭제된 페어링
+            continue
+        response.recommendations.append(
+            PairingRecommendResponse(
+                pairing=PairingResponse.from_orm(recommended), score=score
+            )
+        )
+    return response
+
+
 @router.post(
     "/requests",
     dependencies=[Depends(transactional)],
@@ -1,12 +1,15 @@
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 
+from api.config.exceptions import NotFoundException
 from api.descriptions.ranking_api_descriptions import (
     GET_COMBINATION_RANKING_DESC,
     GET_ALCOHOL_RANKING_DESC,
     GET_TAGS_RELATED_FEEDS_DESC,
+    GET_COMBINATION_WINDOW_RANKING_DESC,
+    GET_ALCOHOL_WINDOW_RANKING_DESC,
 )
-from core.config.orm_config import read_only
-from core.config.var_config import DEFAULT_PAGE_SIZE
+from core.config.orm_config import read_only, reset_db_state
+from core.config.var_config import DEFAULT_PAGE_SIZE, RANKING_CACHE_MAX_AGE
 from core.domain.pairing.pairing_query_function import fetch_pairings_by_multiple_ids
 from core.domain.ranking.ranking_query_function import (
     fetch_like_counts_group_by_combination,
@@ -22,10 +25,24 @@ from core.dto.ranking_dto import (
     CombinationRankingResponse,
     AlcoholRankResponse,
     AlcoholRankingResponse,
+    CombinationWindowRankingResponse,
+    AlcoholWindowRankingResponse,
 )
 from core.dto.page_dto import CursorPageResponse
-from core.util.auth_util import get_login_user_or_none, AuthRequired, AuthOptional
+from core.util.auth_util import (
+    get_login_user_id,
+    get_login_user_or_none,
+    AuthRequired,
+    AuthOptional,
+)
+from core.util.cache import (
+    CachedResponse,
+    pairing_cache_store,
+    ranking_response_cache_store,
+    user_block_cache_store,
+)
 from core.util.feed_util import FeedResponseBuilder
+from core.util.ranking_store import RankingWindow, ranking_window_store
 
 router = APIRouter(
     prefix="/ranks",
@@ -33,49 +50,114 @@ router = APIRouter(
 )
 
 
+def build_cached_response(request: Request, cached: CachedResponse) -> Response:
+    """
+    캐시된 랭킹 응답 반환 (If-None-Match / If-Modified-Since 가 일치하면 304)
+    """
+    headers = {
+        "ETag": cached.etag,
+        "Last-Modified": cached.last_modified,
+        "Cache-Control": f"public, max-age={RANKING_CACHE_MAX_AGE}",
+    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        not_modified = (
+            cached.etag
+            in [etag.strip().removeprefix("W/") for etag in if_none_match.split(",")]
+            or if_none_match.strip() == "*"
+        )
+    else:
+        not_modified = request.headers.get("if-modified-since") == cached.last_modified
+    if not_modified:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
 @router.get(
     path="/combinations",
-    dependencies=[Depends(read_only), Depends(AuthOptional())],
+    dependencies=[Depends(reset_db_state), Depends(AuthOptional())],
     response_model=CombinationRankingResponse,
     description=GET_COMBINATION_RANKING_DESC,
 )
 async def get_combination_ranking(request: Request):
-    ranking: Ranking = [
-        ranking for ranking in Ranking.select().order_by(Ranking.id.desc()).limit(1)
-    ][0]
-    response = CombinationRankingResponse(
-        start_date=ranking.start_date.strftime("%Y-%m-%d"),
-        end_date=ranking.end_date.strftime("%Y-%m-%d"),
-    )
-    for rank, combination in ranking.ranking["combination"].items():
-        rank_dto = CombinationRankResponse(
-            rank=rank,
-            pairings=[PairingResponse(**comb) for comb in combination],
-        )
-        response.ranking.append(rank_dto)
-    return response
+    cached = ranking_response_cache_store.get_or_none("combination")
+    if cached is None:
+        raise NotFoundException(target_entity=Ranking, target_id="latest")
+    return build_cached_response(request, cached)
 
 
 @router.get(
     path="/alcohol",
-    dependencies=[Depends(read_only), Depends(AuthOptional())],
+    dependencies=[Depends(reset_db_state), Depends(AuthOptional())],
     response_model=AlcoholRankingResponse,
     description=GET_ALCOHOL_RANKING_DESC,
 )
 async def get_alcohol_ranking(request: Request):
-    ranking: Ranking = [
-        ranking for ranking in Ranking.select().order_by(Ranking.id.desc()).limit(1)
-    ][0]
-    response = AlcoholRankingResponse(
-        start_date=ranking.start_date.strftime("%Y-%m-%d"),
-        end_date=ranking.end_date.strftime("%Y-%m-%d"),
+    cached = ranking_response_cache_store.get_or_none("alcohol")
+    if cached is None:
+        raise NotFoundException(target_entity=Ranking, target_id="latest")
+    return build_cached_response(request, cached)
+
+
+def get_ranking_updated_at():
+    if ranking_window_store.updated_at is None:
+        return None
+    return ranking_window_store.updated_at.strftime("%Y-%m-%d %H:%M:%S")
+
+
+@router.get(
+    path="/windows/combinations",
+    response_model=CombinationWindowRankingResponse,
+    description=GET_COMBINATION_WINDOW_RANKING_DESC,
+)
+async def get_combination_window_ranking(
+    window: RankingWindow = RankingWindow.WEEK,
+    size: int = Query(default=3, ge=1, le=50),
+):
+    response = CombinationWindowRankingResponse(
+        window=window.value,
+        updated_at=get_ranking_updated_at(),
+    )
+    for combined_ids, score in ranking_window_store.get_combination_ranking(
+        window, size
+    ):
+        pairings = [
+            PairingResponse.from_orm(pairing)
+            for pairing in map(pairing_cache_store.get_or_none, combined_ids)
+            if pairing is not None  # 삭제된 페어링
+        ]
+        if not pairings:
+            continue
+        response.ranking.append(
+            CombinationRankResponse(
+                rank=len(response.ranking) + 1, pairings=pairings, score=score
+            )
+        )
+    return response
+
+
+@router.get(
+    path="/windows/alcohol",
+    response_model=AlcoholWindowRankingResponse,
+    description=GET_ALCOHOL_WINDOW_RANKING_DESC,
+)
+async def get_alcohol_window_ranking(
+    window: RankingWindow = RankingWindow.WEEK,
+    size: int = Query(default=10, ge=1, le=50),
+):
+    response = AlcoholWindowRankingResponse(
+        window=window.value,
+        updated_at=get_ranking_updated_at(),
     )
-    for rank, alcohol in ranking.ranking["alcohol"].items():
+    for alcohol_id, score in ranking_window_store.get_alcohol_ranking(window, size):
+        alcohol = pairing_cache_store.get_or_none(alcohol_id)
+        if alcohol is None:  # 삭제된 술
+            continue
         response.ranking.append(
             AlcoholRankResponse(
-                rank=rank,
-                alcohol=PairingResponse(**alcohol),
-                description=None,
+                rank=len(response.ranking) + 1,
+                alcohol=PairingResponse.from_orm(alcohol),
+                score=score,
             )
         )
     return response
@@ -93,8 +175,13 @@ async def get_related_feeds_by_classify_tags(
     next_feed_id: int = 0,
     size: int = DEFAULT_PAGE_SIZE,
 ):
+    blocked_user_ids = user_block_cache_store.get_blocked_user_ids(
+        get_login_user_id(request)
+    )
     return FeedResponseBuilder.related_feeds(
-        feeds=fetch_related_feeds_by_classify_tags(tags.split(","), next_feed_id, size),
+        feeds=fetch_related_feeds_by_classify_tags(
+            tags.split(","), next_feed_id, size, blocked_user_ids=blocked_user_ids
+        ),
         size=size,
         login_user=get_login_user_or_none(request),
     )
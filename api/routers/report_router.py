@@ -11,9 +11,8 @@ from core.config.orm_config import transactional
 from core.domain.comment.comment_model import Comment
 from core.domain.feed.feed_model import Feed
 from core.domain.report.report_model import Report, ReportStatus
-from core.domain.user.user_model import User
 from core.dto.report_dto import ReportRegisterResponse, ReportRegisterRequest
-from core.util.auth_util import get_login_user_id, AuthRequired
+from core.util.auth_util import get_login_user_or_raise, AuthRequired
 
 router = APIRouter(
     prefix="/reports",
@@ -29,7 +28,7 @@ router = APIRouter(
     responses={**UNAUTHORIZED_RESPONSE, **NOT_FOUND_RESPONSE, **BAD_REQUEST_RESPONSE},
 )
 async def register_report(request: Request, request_body: ReportRegisterRequest):
-    login_user = User.get_or_raise(get_login_user_id(request))
+    login_user = get_login_user_or_raise(request)
 
     if len(request_body.reason) > 500:
         raise BadRequestException("신고 사유는 500자 이하로 입력해주세요.")
@@ -3,10 +3,10 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, status, UploadFile
 from fastapi.responses import JSONResponse
-from fastapi_events.dispatcher import dispatch
 
 from ai.inference import classify
 from core.config.orm_config import transactional
+from core.domain.outbox.outbox_event_query_function import save_outbox_event
 from core.domain.user.user_model import User
 from core.dto.auth_dto import TokenResponse
 from core.event.events import CommentEvents, CreateCommentPayload
@@ -60,7 +60,7 @@ AI 모델 성능 테스트용 API (측정 완료되면 삭제 예정)
 async def get_inference_from_image(
     image: UploadFile, model_name: AiModel, threshold: float = 0.5
 ):
-    url = upload_file_to_s3(image, "images")
+    url = (await upload_file_to_s3(image, "images")).url
     weight_file_path = f"ai/weights/{model_name.value}_qat.pt"
     return classify(
         url,
@@ -75,11 +75,12 @@ async def occur_unexpected_error(test_params: Optional[str] = None):
     raise Exception("Unexpected Error")
 
 
-@router.post("/push")
+@router.post("/push", dependencies=[Depends(transactional)])
 async def send_push_notification():
     payload = CreateCommentPayload(
         comment_id=1,
         feed_owner_user_id=1,
         comment_writer_user_id=1,
     )
-    dispatch(CommentEvents.CREATE_COMMENT, payload.model_dump())
+    # 실제 댓글 작성과 같이 outbox에 저장하면 OutboxDispatcher가 푸시를 보낸다
+    save_outbox_event(CommentEvents.CREATE_COMMENT.value, payload)
@@ -19,6 +19,7 @@ from core.dto.user_dto import UserNicknameUpdateRequest
 from core.dto.user_dto import UserPreferenceUpdateRequest
 from core.dto.user_dto import UserResponse
 from core.util.auth_util import AuthRequired
+from core.util.cache import user_block_cache_store, user_cache_store
 
 router = APIRouter(
     prefix="/users",
@@ -109,6 +110,7 @@ async def update_user_nickname(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
     login_user.nickname = nickname
     login_user.save()
+    user_cache_store.evict(login_user.id)
     return UserResponse.from_orm(login_user)
 
 
@@ -125,6 +127,7 @@ async def update_user_image(request: Request, user_id: int, image_url: str):
 
     login_user.update(image=image_url)
     login_user.image = image_url
+    user_cache_store.evict(login_user.id)
 
     return UserResponse.from_orm(login_user)
 
@@ -144,6 +147,7 @@ async def update_user_preference(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
     login_user.preference = preference
     login_user.save()
+    user_cache_store.evict(login_user.id)
     return UserResponse.from_orm(login_user)
 
 
@@ -164,6 +168,7 @@ async def delete_user(request: Request, user_id: int):
     (Feed.update(is_deleted=True).where(Feed.user_id == login_user.id).execute())
     (Comment.update(is_deleted=True).where(Comment.user_id == login_user.id).execute())
     login_user.save()
+    user_cache_store.evict(login_user.id)
 
     return {"result": True}
 
@@ -188,9 +193,11 @@ async def block_user(request: Request, target_user_id: int):
             )
             .execute()
         )
+        user_block_cache_store.evict(login_user.id)
         return UserBlockResponse(target_user_id=target_user_id)
 
     UserBlock.create(user_id=login_user.id, blocked_user_id=target_user_id)
+    user_block_cache_store.evict(login_user.id)
 
     return UserBlockResponse(target_user_id=target_user_id)
 
@@ -209,5 +216,6 @@ async def block_user(request: Request, target_user_id: int):
         )
         .execute()
     )
+    user_block_cache_store.evict(login_user.id)
 
     return UserBlockResponse(target_user_id=target_user_id)
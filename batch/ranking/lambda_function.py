@@ -1,96 +1,85 @@
-print("============================================================================")
-try:
-    import sys
-
-    sys.path.append(".")
-    sys.path.append("/lambda")
-
-    # DEBUG
-    import os
-
-    print(os.getenv("IS_PROD"))
-    from core.config.var_config import IS_PROD, KST
-
-    print(IS_PROD)
-
-    from datetime import datetime, timedelta
-
-    from core.config.orm_config import db
-    from core.domain.ranking.ranking_model import Ranking
-    from core.dto.pairing_dto import PairingResponse
-    from core.domain.pairing.pairing_query_function import (
-        fetch_pairings_by_multiple_ids,
-    )
-    from core.domain.ranking.ranking_query_function import (
-        fetch_like_counts_group_by_alcohol,
-        fetch_like_counts_group_by_combination,
-    )
-
-    def lambda_handler(event, context):
-        today = datetime.now(KST).replace(hour=0, minute=0, second=0, microsecond=0)
-        start = today - timedelta(days=today.weekday() + 3)
-        end = start + timedelta(days=7)
-        print(start)
-        print(end)
-
-        db.connect()
-
-        # 술 랭킹
-        alcohol_ids = []
-        query = fetch_like_counts_group_by_alcohol(
-            start_date=start,
-            end_date=end,
-            execute=False,
-        )
-        for row in query.execute():
-            alcohol_ids.append(row.alcohol_id)
-
-        alcohols_dict = {
-            pairing.id: pairing
-            for pairing in fetch_pairings_by_multiple_ids(alcohol_ids)
-        }
-
-        alcohol_ranking = {}
-        for idx, alcohol_id in enumerate(alcohol_ids):
-            rank = idx + 1
-            alcohol_response = PairingResponse.from_orm(
-                alcohols_dict[alcohol_id]
-            ).__dict__
-            alcohol_ranking[rank] = alcohol_response
-
-        # 조합 랭킹
-        data = []
-        pairing_ids = set()
-        query = fetch_like_counts_group_by_combination(
-            start_date=start,
-            end_date=end,
-            execute=False,
-        )
-        for row in query.execute():
-            data.append(row.combined_ids)
-            pairing_ids.update(row.combined_ids)
-
+import sys
+
+sys.path.append(".")
+sys.path.append("/lambda")
+
+import json
+from datetime import datetime, timedelta
+
+from core.config.orm_config import db
+from core.config.var_config import KST
+from core.domain.pairing.pairing_query_function import fetch_pairings_by_multiple_ids
+from core.domain.ranking.like_rollup_query_function import (
+    aggregate_new_feed_likes,
+    fetch_weekly_alcohol_like_counts,
+    fetch_weekly_combination_like_counts,
+)
+from core.domain.ranking.popular_feed_query_function import refresh_popular_feeds
+from core.domain.ranking.ranking_model import Ranking
+from core.dto.pairing_dto import PairingResponse
+from core.util.batch_runner import (
+    BatchContext,
+    build_lambda_handler,
+    main,
+)
+from core.util.logger import logger
+
+
+def ranking_window():
+    today = datetime.now(KST).replace(hour=0, minute=0, second=0, microsecond=0)
+    start = today - timedelta(days=today.weekday() + 3)
+    end = start + timedelta(days=7)
+    return start, end
+
+
+def ranking(context: BatchContext):
+    start, end = context.start_date, context.end_date
+
+    # 마지막 배치 이후 새로 생긴 좋아요만 일간 집계에 반영
+    with context.stage("aggregate") as stage:
+        with db.atomic():
+            last_feed_like_id, max_feed_like_id = aggregate_new_feed_likes()
+        stage.rows = max_feed_like_id - last_feed_like_id
+
+    # 술, 조합 랭킹 (기간 내 일간 집계 합계)
+    with context.stage("query") as stage:
+        alcohol_ids = [
+            row.alcohol_id
+            for row in fetch_weekly_alcohol_like_counts(start.date(), end.date())
+        ]
+        combinations = [
+            row.combined_ids
+            for row in fetch_weekly_combination_like_counts(start.date(), end.date())
+        ]
+        stage.rows = len(alcohol_ids) + len(combinations)
+
+    with context.stage("hydrate") as stage:
+        pairing_ids = set(alcohol_ids)
+        for combined_ids in combinations:
+            pairing_ids.update(combined_ids)
         pairings_dict = {
-            pairing.id: pairing
+            pairing.id: PairingResponse.from_orm(pairing).__dict__
             for pairing in fetch_pairings_by_multiple_ids(pairing_ids=pairing_ids)
         }
 
-        combination_ranking = {}
-        for idx, pairing_ids in enumerate(data):
-            rank = idx + 1
-            combination_ranking[rank] = []
-            for pairing_id in pairing_ids:
-                combination_ranking[rank].append(
-                    PairingResponse.from_orm(pairings_dict[pairing_id]).__dict__
-                )
-
-        import json
+        alcohol_ranking = {
+            idx + 1: pairings_dict[alcohol_id]
+            for idx, alcohol_id in enumerate(alcohol_ids)
+        }
+        combination_ranking = {
+            idx + 1: [pairings_dict[pairing_id] for pairing_id in combined_ids]
+            for idx, combined_ids in enumerate(combinations)
+        }
+        stage.rows = len(pairings_dict)
 
-        print("술 랭킹: ")
-        print(json.dumps(alcohol_ranking, ensure_ascii=False, indent=4))
-        print("조합 랭킹: ")
-        print(json.dumps(combination_ranking, ensure_ascii=False, indent=4))
+    logger.info(
+        f"[Ranking Batch] - 술 랭킹: {json.dumps(alcohol_ranking, ensure_ascii=False)}"
+    )
+    logger.info(
+        f"[Ranking Batch] - 조합 랭킹: {json.dumps(combination_ranking, ensure_ascii=False)}"
+    )
 
+    with context.stage("write") as stage:
         Ranking(
             start_date=start,
             end_date=end,
@@ -100,9 +89,15 @@ try:
             },
         ).save()
 
-        db.close()
+        # 인기 조합 피드 (/feeds/popular) - 좋아요 많은 조합, 색다른 조합
+        stage.rows = (
+            1
+            + refresh_popular_feeds(order_by_popular=True)
+            + refresh_popular_feeds(order_by_popular=False)
+        )
+
 
-except:
-    import traceback
+lambda_handler = build_lambda_handler("Ranking", ranking, ranking_window)
 
-    print(traceback.format_exc())
+if __name__ == "__main__":
+    main("Ranking", ranking, ranking_window)
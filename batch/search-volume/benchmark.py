@@ -0,0 +1,79 @@
+"""
+검색량 계산 벤치마크 (기존 키워드별 DataFrame apply vs numpy 일괄 계산)
+- 실행: python batch/search-volume/benchmark.py [키워드 수] [일 수]
+- 네이버 API, DB 없이 임의 트렌드 데이터로 계산만 비교한다
+"""
+import math
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+sys.path.append(".")
+
+from core.util.search_volume_util import calculate_search_volumes
+
+
+def legacy_search_volume(trend: list, volume: int, end_date: str) -> int:
+    df = pd.DataFrame(trend).set_index("period")
+    df.index = pd.to_datetime(df.index, format="%Y-%m-%d")
+    df = df.reindex(
+        index=pd.date_range(start=df.index[0], end=end_date), fill_value=0.0
+    ).sort_index()
+    ratio_sum = df["ratio"].tail(30).sum()
+    coefficient = (volume / ratio_sum) if ratio_sum != 0 else 0
+    df["ratio"] = df["ratio"] * coefficient
+    df = df.apply(lambda x: math.ceil(x.ratio), axis=1)
+    return df.sum()
+
+
+def generate_trends(keyword_count: int, days: int):
+    today = datetime.today()
+    trends, volumes = dict(), dict()
+    for i in range(keyword_count):
+        keyword = f"keyword{i}"
+        # 하루씩 빠진 날짜가 섞이도록 일부 날짜는 건너뛴다
+        trends[keyword] = [
+            {
+                "period": (today - timedelta(days=day)).strftime("%Y-%m-%d"),
+                "ratio": round(random.uniform(0, 100), 5),
+            }
+            for day in range(days, 0, -1)
+            if day == days or random.random() > 0.1
+        ]
+        volumes[keyword] = random.randint(0, 100000)
+    return trends, volumes
+
+
+def benchmark(keyword_count: int = 500, days: int = 30):
+    trends, volumes = generate_trends(keyword_count, days)
+    keywords = list(trends.keys())
+    end_date = (datetime.today() - timedelta(1)).date()
+
+    started_at = time.perf_counter()
+    legacy = {
+        keyword: legacy_search_volume(
+            trends[keyword], volumes[keyword], end_date.strftime("%Y-%m-%d")
+        )
+        for keyword in keywords
+    }
+    legacy_seconds = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    vectorized = calculate_search_volumes(trends, volumes, keywords, end_date)
+    vectorized_seconds = time.perf_counter() - started_at
+
+    mismatches = [
+        keyword for keyword in keywords if legacy[keyword] != vectorized[keyword]
+    ]
+    print(f"keywords = {keyword_count}, days = {days}")
+    print(f"legacy (DataFrame apply) : {legacy_seconds * 1000:.1f}ms")
+    print(f"vectorized (numpy)       : {vectorized_seconds * 1000:.1f}ms")
+    print(f"speedup                  : {legacy_seconds / vectorized_seconds:.1f}x")
+    print(f"mismatches               : {len(mismatches)}")
+
+
+if __name__ == "__main__":
+    benchmark(*[int(arg) for arg in sys.argv[1:3]])
@@ -1,14 +1,17 @@
-import math
-from datetime import datetime, timedelta
-from typing import List
+import sys
+
+sys.path.append(".")
 
-import pandas as pd
+import asyncio
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
 
 from core.client.naver_client import NaverApiClient
-from core.config.orm_config import db
 from core.domain.pairing.pairing_model import Pairing
-from core.domain.ranking.search_volume_model import SearchVolume
+from core.domain.ranking.search_volume_query_function import upsert_search_volumes
+from core.util.batch_runner import BatchContext, build_lambda_handler, main
 from core.util.logger import logger
+from core.util.search_volume_util import calculate_search_volumes
 
 
 def fetch_keywords() -> List[str]:
@@ -20,74 +23,88 @@ def fetch_keywords() -> List[str]:
         ]
         return flat_list
 
-    try:
-        db.connect()
-        keywords = [
-            pairing.name.replace(" ", "").split("/")
-            if "/" in pairing.name
-            else pairing.name.replace(" ", "")
-            for pairing in Pairing.select().where(Pairing.is_deleted == False)
-        ]
-        return flatten(keywords)
-    finally:
-        db.close()
-
-
-def save_search_volume(name: str, volume: int, start_date: str, end_date: str):
-    try:
-        db.connect()
-        SearchVolume.delete().where(
-            SearchVolume.name == name,
-            SearchVolume.start_date == start_date,
-            SearchVolume.end_date == end_date,
-        ).execute()
-        SearchVolume.create(
-            name=name, volume=volume, start_date=start_date, end_date=end_date
+    keywords = [
+        pairing.name.replace(" ", "").split("/")
+        if "/" in pairing.name
+        else pairing.name.replace(" ", "")
+        for pairing in Pairing.select().where(Pairing.is_deleted == False)
+    ]
+    return flatten(keywords)
+
+
+def search_volume_window():
+    today = datetime.today().replace(hour=0, minute=0, second=0, microsecond=0)
+    return today - timedelta(days=7), today
+
+
+async def fetch_trends_and_volumes(
+    keywords: List[str], start_date: str, end_date: str
+) -> Tuple[Dict[str, list], Dict[str, int]]:
+    """
+    api 키워드는 최대 5개씩만 가능해서 5개씩 나눠서 동시에 조회한다
+    (호출 속도, 동시 요청 수는 NaverApiClient 에서 제한)
+    """
+    keyword_chunks = [keywords[i : i + 5] for i in range(0, len(keywords), 5)]
+    async with NaverApiClient() as naver_api_client:
+        trend_results, volume_results = await asyncio.gather(
+            asyncio.gather(
+                *[
+                    naver_api_client.get_trends(chunk, start_date, end_date)
+                    for chunk in keyword_chunks
+                ]
+            ),
+            asyncio.gather(
+                *[naver_api_client.get_volumes(chunk) for chunk in keyword_chunks]
+            ),
         )
-        logger.info(f"[SearchVolume Batch] - {name} save success")
-    except:
-        db.rollback()
-    finally:
-        db.close()
 
+    trends, volumes = dict(), dict()
+    for trend in trend_results:
+        trends.update(trend)
+    for volume in volume_results:
+        volumes.update(volume)
+    return trends, volumes
 
-start_date: str = ((datetime.today() - timedelta(days=7)).strftime("%Y-%m-%d"),)
-end_date: str = datetime.today().strftime("%Y-%m-%d")
 
+def search_volume(context: BatchContext):
+    start_date = context.start_date.strftime("%Y-%m-%d")
+    end_date = context.end_date.strftime("%Y-%m-%d")
 
-def search_volume():
-    naver_api_client = NaverApiClient()
-    keywords = fetch_keywords()
+    with context.stage("query") as stage:
+        keywords = fetch_keywords()
+        stage.rows = len(keywords)
     logger.info(f"[SearchVolume Batch] - keywords = {keywords}")
-    for i in range(0, len(keywords), 5):
-        # api 키워드는 최대 5개씩만 가능해서 5개씩 조회한다
-        keywords_split_by_five = keywords[i : i + 5]
-        logger.info(f"keywords_split_by_five = {keywords_split_by_five}")
-
-        trend = naver_api_client.get_trends(keywords_split_by_five)
-        volume = naver_api_client.get_volumes(keywords_split_by_five)
-
-        for keyword in keywords_split_by_five:
-            df = pd.DataFrame(trend[keyword]).set_index("period")
-            df.index = pd.to_datetime(df.index, format="%Y-%m-%d")
-            df = df.reindex(
-                index=pd.date_range(
-                    start=df.index[0],
-                    end=(datetime.today() - timedelta(1)).strftime("%Y-%m-%d"),
-                ),
-                fill_value=0.0,
-            ).sort_index()
-            ratio_sum = df["ratio"].tail(30).sum()
-            coefficient = (volume[keyword] / ratio_sum) if ratio_sum != 0 else 0
-            df["ratio"] = df["ratio"] * coefficient
-            df = df.apply(lambda x: math.ceil(x.ratio), axis=1)
-            df.index = df.index.strftime("%Y%m%d")
-
-            logger.info(
-                f"[SearchVolume Batch] - keyword = {keyword}, volume = {df.sum()}"
-            )
-
-            save_search_volume(keyword, df.sum(), start_date, end_date)
-
-
-search_volume()
+
+    with context.stage("fetch") as stage:
+        trends, volumes = asyncio.run(
+            fetch_trends_and_volumes(keywords, start_date, end_date)
+        )
+        stage.rows = len(trends)
+
+    # 검색량은 전날까지만 계산한다
+    with context.stage("compute") as stage:
+        search_volumes = calculate_search_volumes(
+            trends, volumes, keywords, (context.end_date - timedelta(1)).date()
+        )
+        rows = [
+            {
+                "name": keyword,
+                "volume": volume,
+                "start_date": start_date,
+                "end_date": end_date,
+            }
+            for keyword, volume in search_volumes.items()
+        ]
+        stage.rows = len(rows)
+    logger.info(f"[SearchVolume Batch] - volumes = {search_volumes}")
+
+    with context.stage("write") as stage:
+        stage.rows = upsert_search_volumes(rows)
+
+
+lambda_handler = build_lambda_handler(
+    "SearchVolume", search_volume, search_volume_window
+)
+
+if __name__ == "__main__":
+    main("SearchVolume", search_volume, search_volume_window)
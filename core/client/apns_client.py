@@ -1,9 +1,14 @@
+import asyncio
+import random
 from enum import Enum
 from typing import Optional, List
 
 from aioapns import APNs, NotificationRequest, PushType
+from aioapns.common import NotificationResult
 from pydantic import BaseModel
 
+from core.config.orm_config import run_in_new_db_state
+from core.domain.user.user_query_function import remove_push_tokens
 from core.util.logger import logger
 
 
@@ -22,11 +27,24 @@ class PushRequest(BaseModel):
     target_id: Optional[int] = None
 
 
+class PushResultType(str, Enum):
+    SUCCESS = "SUCCESS"
+    INVALID_TOKEN = "INVALID_TOKEN"  # 앱 삭제, 토큰 만료 등. 토큰을 삭제해야 함
+    RETRYABLE = "RETRYABLE"  # 429, 5xx, 네트워크 오류
+    FAILED = "FAILED"  # 재시도해도 실패하는 요청 (payload 오류 등)
+
+
+class PushResult(BaseModel):
+    request: PushRequest
+    result_type: PushResultType
+    reason: Optional[str] = None
+
+
 class PushClient:
     async def send_push(self, request: PushRequest):
         pass
 
-    async def send_push_batch(self, requests: List[PushRequest]):
+    async def send_push_batch(self, requests: List[PushRequest]) -> List[PushResult]:
         pass
 
 
@@ -47,8 +65,44 @@ class PushClientImpl(PushClient):
         elif request.device_type == DeviceType.ANDROID:
             await self.android_client.send_push(request)
 
-    async def send_push_batch(self, requests: List[PushRequest]):
-        pass
+    async def send_push_batch(self, requests: List[PushRequest]) -> List[PushResult]:
+        """
+        디바이스 타입별로 나눠서 동시에 전송하고, 유효하지 않은 토큰은 유저 정보에서 삭제
+        """
+        requests = [request for request in requests if request.is_sendable]
+        batches = [
+            (
+                client,
+                [request for request in requests if request.device_type == device_type],
+            )
+            for client, device_type in (
+                (self.ios_client, DeviceType.IOS),
+                (self.android_client, DeviceType.ANDROID),
+            )
+        ]
+        results = [
+            result
+            for batch_results in await asyncio.gather(
+                *[
+                    client.send_push_batch(batch)
+                    for client, batch in batches
+                    if client is not None and batch
+                ]
+            )
+            for result in batch_results
+        ]
+
+        invalid_tokens = {
+            result.request.device_token
+            for result in results
+            if result.result_type == PushResultType.INVALID_TOKEN
+        }
+        if invalid_tokens:
+            removed_count = await run_in_new_db_state(
+                remove_push_tokens, invalid_tokens
+            )
+            logger.info(f"removed invalid push tokens :: {removed_count}")
+        return results
 
 
 class APNSClient(PushClient):
@@ -59,17 +113,27 @@ class APNSClient(PushClient):
         team_id: str,
         topic: str,
         use_sandbox: bool,
+        max_connections: int = 10,
+        max_concurrency: int = 100,
+        max_retries: int = 3,
+        backoff_seconds: float = 0.5,
     ):
+        # APNs 객체가 HTTP/2 커넥션 풀을 유지하므로 클라이언트는 하나만 만들어서 재사용한다
         self.apns_key_client = APNs(
             key=apns_key_path,
             key_id=key_id,
             team_id=team_id,
             topic=topic,  # Bundle ID
             use_sandbox=use_sandbox,
+            max_connections=max_connections,
         )
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
 
-    async def send_push(self, request: PushRequest):
-        apns_request = NotificationRequest(
+    @staticmethod
+    def build_notification_request(request: PushRequest) -> NotificationRequest:
+        return NotificationRequest(
             device_token=request.device_token,
             message={
                 "aps": {
@@ -84,15 +148,68 @@ class APNSClient(PushClient):
             push_type=PushType.ALERT,
         )
 
+    @staticmethod
+    def classify_result(result: NotificationResult) -> PushResultType:
+        if result.is_successful:
+            return PushResultType.SUCCESS
+        if result.status == "410" or result.description in (
+            "BadDeviceToken",
+            "Unregistered",
+        ):
+            return PushResultType.INVALID_TOKEN
+        if result.description in ("DeviceTokenNotForTopic", "TopicDisallowed"):
+            # 토큰이 아니라 서버의 topic(bundle id) 설정 문제. 토큰을 지우면 안 된다
+            logger.error(
+                f"APNS topic is misconfigured :: {result.status} {result.description}"
+            )
+            return PushResultType.FAILED
+        if result.status == "429" or result.status.startswith("5"):
+            return PushResultType.RETRYABLE
+        return PushResultType.FAILED
+
+    async def send_push(self, request: PushRequest):
         try:
-            await self.apns_key_client.send_notification(apns_request)
+            await self.apns_key_client.send_notification(
+                self.build_notification_request(request)
+            )
         except Exception:
             logger.error(f"Failed to send push to :: {request}")
             pass
 
-    async def send_push_batch(self, requests: List[PushRequest]):
-        # TODO: implement
-        pass
+    async def send_push_with_retry(self, request: PushRequest) -> PushResult:
+        for attempt in range(self.max_retries + 1):
+            try:
+                result = await self.apns_key_client.send_notification(
+                    self.build_notification_request(request)
+                )
+                result_type, reason = self.classify_result(result), result.description
+            except Exception as e:
+                result_type, reason = PushResultType.RETRYABLE, repr(e)
+
+            if result_type != PushResultType.RETRYABLE or attempt == self.max_retries:
+                break
+            # 지수 backoff + jitter (동시에 실패한 요청들이 한꺼번에 재시도하지 않도록)
+            await asyncio.sleep(
+                self.backoff_seconds * (2**attempt) * (1 + random.random())
+            )
+
+        if result_type != PushResultType.SUCCESS:
+            logger.warning(
+                f"Failed to send push to :: {request.device_token} ({result_type.value}, {reason})"
+            )
+        return PushResult(request=request, result_type=result_type, reason=reason)
+
+    async def send_push_batch(self, requests: List[PushRequest]) -> List[PushResult]:
+        """
+        최대 max_concurrency 개씩 동시에 전송, 요청 순서대로 결과 반환
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def send(request: PushRequest) -> PushResult:
+            async with semaphore:
+                return await self.send_push_with_retry(request)
+
+        return list(await asyncio.gather(*[send(request) for request in requests]))
 
 
 # ios_push_client = APNSClient(
@@ -1,6 +1,8 @@
 import os
+from typing import Optional
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 
 from core.config.var_config import IS_PROD, S3_REGION, S3_BUCKET_NAME
 
@@ -21,18 +23,71 @@ class S3Client:
             aws_secret_access_key=secrets.AWS_S3_PRIVATE_KEY,
         )
 
+    # 8MiB 단위로 멀티파트 업로드 (파일 전체를 메모리에 올리지 않음)
+    transfer_config = TransferConfig(
+        multipart_threshold=8 * 1024**2,
+        multipart_chunksize=8 * 1024**2,
+        max_concurrency=4,
+    )
+
     # Singleton
     def __new__(cls):
         if not hasattr(cls, "instance"):
             cls.instance = super(S3Client, cls).__new__(cls)
         return cls.instance
 
-    def upload_fileobj(self, file, key: str = "", bucket_name: str = S3_BUCKET_NAME):
-        return self.s3.upload_fileobj(file, bucket_name, key)
+    def upload_fileobj(
+        self,
+        file,
+        key: str = "",
+        content_type: Optional[str] = None,
+        bucket_name: str = S3_BUCKET_NAME,
+    ):
+        return self.s3.upload_fileobj(
+            file,
+            bucket_name,
+            key,
+            ExtraArgs={"ContentType": content_type} if content_type else None,
+            Config=self.transfer_config,
+        )
 
     def get_object(self, key: str, bucket_name: str = S3_BUCKET_NAME):
         return self.s3.get_object(Bucket=bucket_name, Key=key)
 
+    def head_object(self, key: str, bucket_name: str = S3_BUCKET_NAME):
+        return self.s3.head_object(Bucket=bucket_name, Key=key)
+
+    def read_object_header(
+        self, key: str, size: int = 12, bucket_name: str = S3_BUCKET_NAME
+    ) -> bytes:
+        response = self.s3.get_object(
+            Bucket=bucket_name, Key=key, Range=f"bytes=0-{size - 1}"
+        )
+        return response["Body"].read()
+
+    def generate_presigned_post(
+        self,
+        key: str,
+        content_type: str,
+        max_size: int,
+        expires_in: int = 600,
+        bucket_name: str = S3_BUCKET_NAME,
+    ) -> dict:
+        """
+        클라이언트가 S3에 직접 업로드할 수 있는 presigned POST (url, fields) 발급
+        - content_type, 파일 크기(1 ~ max_size)가 다르면 S3에서 업로드를 거절한다
+        """
+        return self.s3.generate_presigned_post(
+            Bucket=bucket_name,
+            Key=key,
+            Fields={"Content-Type": content_type},
+            Conditions=[
+                {"Content-Type": content_type},
+                ["content-length-range", 1, max_size],
+            ],
+            ExpiresIn=expires_in,
+        )
+
     def delete_object(self, key: str, bucket_name: str = S3_BUCKET_NAME):
         return self.s3.delete_object(Bucket=bucket_name, Key=key)
 
@@ -1,12 +1,13 @@
+import asyncio
 import hashlib
 import hmac
 import os
 import time
 from base64 import b64encode
 from datetime import datetime, timedelta
-from typing import List
+from typing import Callable, Dict, List, Optional
 
-import requests
+import aiohttp
 
 try:
     from core.config.secrets import (
@@ -29,8 +30,50 @@ except Exception:
     NAVER_VOLUME_API_ACCESS_LICENCE = os.getenv("NAVER_VOLUME_API_ACCESS_LICENCE")
     NAVER_VOLUME_API_PRIVATE_KEY = os.getenv("NAVER_VOLUME_API_PRIVATE_KEY")
 
+from core.util.logger import logger
+from core.util.rate_limiter import TokenBucket, parse_retry_after
+
 
 class NaverApiClient:
+    """
+    네이버 데이터랩(검색어 트렌드), 검색광고(키워드 도구) API 클라이언트
+    - async with NaverApiClient() as client: 로 사용 (세션 하나로 커넥션 재사용)
+    - API별 토큰 버킷으로 초당 호출 수를 제한하고, 동시 요청은 max_concurrency 개까지만 보낸다
+    - 429, 5xx, 네트워크 오류는 max_retries 만큼 backoff 후 재시도한다
+    """
+
+    TREND_API_URL = "https://openapi.naver.com/v1/datalab/search"
+    VOLUME_API_URL = "https://api.naver.com/keywordstool"
+
+    def __init__(
+        self,
+        max_concurrency: int = 5,
+        trend_requests_per_second: float = 5,
+        volume_requests_per_second: float = 5,
+        max_retries: int = 3,
+        backoff_seconds: float = 1.0,
+        timeout: float = 10.0,
+    ):
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.trend_bucket = TokenBucket(
+            rate=trend_requests_per_second, capacity=trend_requests_per_second
+        )
+        self.volume_bucket = TokenBucket(
+            rate=volume_requests_per_second, capacity=volume_requests_per_second
+        )
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self):
+        self._session = aiohttp.ClientSession(timeout=self.timeout)
+        return self
+
+    async def __aexit__(self, *args):
+        await self._session.close()
+        self._session = None
+
     def __generate_signature(self):
         timestamp = str(round(time.time() * 1000))
         hash = hmac.new(
@@ -39,22 +82,63 @@ class NaverApiClient:
             digestmod=hashlib.sha256,
         )
         hash.hexdigest()
-        return timestamp, b64encode(hash.digest())
+        return timestamp, b64encode(hash.digest()).decode()
+
+    async def __request(
+        self,
+        bucket: TokenBucket,
+        method: str,
+        url: str,
+        build_headers: Callable[[], Dict[str, str]],
+        **kwargs,
+    ) -> dict:
+        for attempt in range(self.max_retries + 1):
+            retry_after = self.backoff_seconds * 2**attempt
+            await bucket.acquire()
+            async with self.semaphore:
+                try:
+                    # 서명에 타임스탬프가 들어가므로 헤더는 요청마다 새로 만든다
+                    async with self._session.request(
+                        method, url, headers=build_headers(), **kwargs
+                    ) as response:
+                        if response.status == 200:
+                            return await response.json(content_type=None)
+                        content = await response.read()
+                        if response.status != 429 and response.status < 500:
+                            raise Exception(content)
+                        # 헤더가 없거나 해석할 수 없으면 지수 백오프로 기다린다
+                        header_retry_after = parse_retry_after(
+                            response.headers.get("Retry-After", "")
+                        )
+                        if header_retry_after is not None:
+                            retry_after = header_retry_after
+                        logger.warning(
+                            f"naver api request failed :: {response.status} {content}"
+                        )
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    logger.warning(f"naver api request failed :: {e!r}")
+
+            if attempt < self.max_retries:
+                await asyncio.sleep(retry_after)
+
+        raise Exception(f"naver api request failed after {self.max_retries} retries")
 
-    def get_trends(
+    async def get_trends(
         self,
         keywords: List[str],
         start_date: str = (datetime.today() - timedelta(days=7)).strftime("%Y-%m-%d"),
         end_date: str = datetime.today().strftime("%Y-%m-%d"),
         time_unit: str = "date",
     ):
-        form = {
-            "url": "https://openapi.naver.com/v1/datalab/search",
-            "headers": {
+        response = await self.__request(
+            self.trend_bucket,
+            "POST",
+            self.TREND_API_URL,
+            build_headers=lambda: {
                 "X-Naver-Client-Id": NAVER_TREND_API_CLIENT_ID,
                 "X-Naver-Client-Secret": NAVER_TREND_API_CLIENT_SECRET,
             },
-            "json": {
+            json={
                 "startDate": start_date,
                 "endDate": end_date,
                 "timeUnit": time_unit,
@@ -63,46 +147,40 @@ class NaverApiClient:
                     for keyword in keywords
                 ],
             },
-        }
+        )
+        data = dict()
+        for result in response["results"]:
+            data[result["title"]] = result["data"]
+        return data
 
-        response = requests.post(**form)
-        if response.status_code == 200:
-            results = response.json()["results"]
-            data = dict()
-            for result in results:
-                data[result["title"]] = result["data"]
-            return data
-        else:
-            raise Exception(response.content)
-
-    def get_volumes(self, keywords: List[str]):
+    def __build_volume_headers(self) -> Dict[str, str]:
         timestamp, signature = self.__generate_signature()
-        form = {
-            "url": "https://api.naver.com/keywordstool",
-            "headers": {
-                "X-Customer": NAVER_VOLUME_API_CUSTOMER_ID,
-                "X-Api-Key": NAVER_VOLUME_API_ACCESS_LICENCE,
-                "X-Timestamp": timestamp,  # 요청하는 타임스탬프를 찍어서 보내야함
-                "X-Signature": signature,  # 시그니처를 만들어서 요청을 보내야함
-            },
-            "params": {"hintKeywords": ",".join(keywords), "event": "1", "month": "1"},
+        return {
+            "X-Customer": NAVER_VOLUME_API_CUSTOMER_ID,
+            "X-Api-Key": NAVER_VOLUME_API_ACCESS_LICENCE,
+            "X-Timestamp": timestamp,  # 요청하는 타임스탬프를 찍어서 보내야함
+            "X-Signature": signature,  # 시그니처를 만들어서 요청을 보내야함
         }
 
-        response = requests.get(**form)
-        if response.status_code == 200:
-            keyword_list = response.json()["keywordList"]
-            data = dict()
-            for item in keyword_list:
-                if len(data) == len(keywords):
-                    break
-                if item["relKeyword"] in keywords:
-                    if isinstance(item["monthlyPcQcCnt"], str):
-                        item["monthlyPcQcCnt"] = 0
-                    if isinstance(item["monthlyMobileQcCnt"], str):
-                        item["monthlyMobileQcCnt"] = 0
-                    data[item["relKeyword"]] = (
-                        item["monthlyPcQcCnt"] + item["monthlyMobileQcCnt"]
-                    )
-            return data
-        else:
-            raise Exception(response.content)
+    async def get_volumes(self, keywords: List[str]):
+        response = await self.__request(
+            self.volume_bucket,
+            "GET",
+            self.VOLUME_API_URL,
+            build_headers=self.__build_volume_headers,
+            params={"hintKeywords": ",".join(keywords), "event": "1", "month": "1"},
+        )
+        keyword_list = response["keywordList"]
+        data = dict()
+        for item in keyword_list:
+            if len(data) == len(keywords):
+                break
+            if item["relKeyword"] in keywords:
+                if isinstance(item["monthlyPcQcCnt"], str):
+                    item["monthlyPcQcCnt"] = 0
+                if isinstance(item["monthlyMobileQcCnt"], str):
+                    item["monthlyMobileQcCnt"] = 0
+                data[item["relKeyword"]] = (
+                    item["monthlyPcQcCnt"] + item["monthlyMobileQcCnt"]
+                )
+        return data
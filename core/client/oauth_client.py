@@ -1,11 +1,12 @@
+import asyncio
 import json
+import time
+from typing import Any, Callable, Dict, Optional
 
+import aiohttp
 import jwt
-import requests
-from cryptography.hazmat.primitives import serialization
 from fastapi import status, HTTPException
-from google.auth import transport
-from google.oauth2 import id_token
+from google.auth import jwt as google_jwt
 from jwt.algorithms import RSAAlgorithm
 
 from core.config.var_config import APPLE_CLIENT_ID
@@ -14,17 +15,122 @@ from core.dto.auth_dto import (
     KakaoCredentialsRequest,
     AppleCredentialsRequest,
 )
+from core.util.logger import logger
+
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+
+
+class PublicKeyCache:
+    """
+    OAuth 제공자 공개키 캐시 (kid -> key)
+    - ttl 동안은 다시 받지 않는다
+    - 캐시에 없는 kid가 오면 (키 교체) 다시 받되, min_refresh_interval 보다 자주 받지는 않는다
+    - 다시 받는데 실패하면 기존 키를 계속 사용한다
+    - 받기 시도 시각(성공/실패 모두)을 기준으로 min_refresh_interval 동안은 락을 잡지 않고 기존 키를 바로 쓴다
+      (제공자 장애 시 모든 로그인 요청이 락에서 줄 서서 각자 타임아웃을 기다리지 않도록)
+    """
+
+    def __init__(
+        self,
+        url: str,
+        parse_keys: Callable[[Any], Dict[str, Any]],
+        ttl: int = 60 * 60 * 6,
+        min_refresh_interval: int = 60,
+    ):
+        self.url = url
+        self.parse_keys = parse_keys
+        self.ttl = ttl
+        self.min_refresh_interval = min_refresh_interval
+        self._keys: Dict[str, Any] = {}
+        self._fetched_at: Optional[float] = None
+        self._attempted_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    async def get_key(self, session: aiohttp.ClientSession, kid: str) -> Optional[Any]:
+        if self._is_expired() or kid not in self._keys:
+            # 가진 키가 없으면(최초 조회) 락에서 받아올 때까지 기다린다
+            if not (self._keys and self._is_recently_attempted()):
+                await self._refresh(session)
+        return self._keys.get(kid)
+
+    def _is_expired(self) -> bool:
+        return (
+            self._fetched_at is None or time.monotonic() - self._fetched_at > self.ttl
+        )
+
+    def _is_recently_attempted(self) -> bool:
+        return (
+            self._attempted_at is not None
+            and time.monotonic() - self._attempted_at < self.min_refresh_interval
+        )
+
+    async def _refresh(self, session: aiohttp.ClientSession):
+        async with self._lock:
+            # 락을 기다리는 동안 다른 요청이 이미 받아왔거나 받기를 시도했으면 다시 받지 않는다
+            if self._is_recently_attempted():
+                return
+            self._attempted_at = time.monotonic()
+            try:
+                async with session.get(self.url) as response:
+                    response.raise_for_status()
+                    self._keys = self.parse_keys(await response.json(content_type=None))
+                    self._fetched_at = time.monotonic()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if not self._keys:
+                    raise
+                logger.warning(f"failed to refresh public keys from {self.url} :: {e}")
+
+
+def parse_google_certs(certs: Dict[str, str]) -> Dict[str, str]:
+    return certs
+
+
+def parse_apple_keys(jwks: dict) -> Dict[str, Any]:
+    return {jwk["kid"]: RSAAlgorithm.from_jwk(json.dumps(jwk)) for jwk in jwks["keys"]}
 
 
 class OAuthClient:
+    GOOGLE_CERTS_URL = "https://www.googleapis.com/oauth2/v1/certs"
+    KAKAO_USER_INFO_URL = (
+        'https://kapi.kakao.com/v2/user/me?property_keys=["kakao_account.email"]'
+    )
+    APPLE_KEYS_URL = "https://appleid.apple.com/auth/keys"
+
+    google_certs = PublicKeyCache(GOOGLE_CERTS_URL, parse_google_certs)
+    apple_keys = PublicKeyCache(APPLE_KEYS_URL, parse_apple_keys)
+
+    _session: Optional[aiohttp.ClientSession] = None
+
+    @classmethod
+    def get_session(cls) -> aiohttp.ClientSession:
+        """
+        커넥션 풀을 재사용하기 위해 세션은 하나만 만든다 (종료 시 close() 호출)
+        """
+        if cls._session is None or cls._session.closed:
+            cls._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=5),
+            )
+        return cls._session
+
+    @classmethod
+    async def close(cls):
+        if cls._session is not None:
+            await cls._session.close()
+            cls._session = None
+
     @classmethod
-    def verify_google_token(cls, form: GoogleCredentialsRequest):
+    async def verify_google_token(cls, form: GoogleCredentialsRequest):
         try:
-            user_info = id_token.verify_oauth2_token(
-                id_token=form.id_token,
+            kid = jwt.get_unverified_header(form.id_token)["kid"]
+            cert = await cls.google_certs.get_key(cls.get_session(), kid)
+            user_info = google_jwt.decode(
+                form.id_token,
+                certs={kid: cert},
                 audience=form.google_client_id,
-                request=transport.requests.Request(),
             )
+            if user_info["iss"] not in GOOGLE_ISSUERS:
+                raise ValueError(f"Wrong issuer : {user_info['iss']}")
             return user_info
         except Exception as e:
             raise HTTPException(
@@ -32,38 +138,39 @@ class OAuthClient:
             )
 
     @classmethod
-    def verify_kakao_token(cls, form: KakaoCredentialsRequest):
-        response = requests.get(
-            url='https://kapi.kakao.com/v2/user/me?property_keys=["kakao_account.email"]',
-            headers={
-                "Authorization": f"Bearer {form.access_token}",
-                "Content-Type": "application/x-www-form-urlencoded;charset=utf-8",
-            },
-        )
-        if response.status_code != 200:
-            try:
-                error_detail = response.json()
-            except:
-                error_detail = response.text
-            finally:
-                raise HTTPException(status.HTTP_400_BAD_REQUEST, error_detail)
+    async def verify_kakao_token(cls, form: KakaoCredentialsRequest):
+        try:
+            async with cls.get_session().get(
+                url=cls.KAKAO_USER_INFO_URL,
+                headers={
+                    "Authorization": f"Bearer {form.access_token}",
+                    "Content-Type": "application/x-www-form-urlencoded;charset=utf-8",
+                },
+            ) as response:
+                if response.status != 200:
+                    try:
+                        error_detail = await response.json(content_type=None)
+                    except:
+                        error_detail = await response.text()
+                    finally:
+                        raise HTTPException(status.HTTP_400_BAD_REQUEST, error_detail)
 
-        return response.json()
+                return await response.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise HTTPException(
+                status.HTTP_503_SERVICE_UNAVAILABLE, f"Kakao server error : {e}"
+            )
 
     @classmethod
-    def verify_apple_token(cls, form: AppleCredentialsRequest):
-        id_token_header = jwt.get_unverified_header(form.id_token)
-        jwks = requests.get("https://appleid.apple.com/auth/keys").json()["keys"]
-        rsa_public_key = RSAAlgorithm.from_jwk(
-            jwk=[
-                json.dumps(jwk) for jwk in jwks if jwk["kid"] == id_token_header["kid"]
-            ][0]
-        ).public_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo,
-        )
-
+    async def verify_apple_token(cls, form: AppleCredentialsRequest):
         try:
+            id_token_header = jwt.get_unverified_header(form.id_token)
+            rsa_public_key = await cls.apple_keys.get_key(
+                cls.get_session(), id_token_header["kid"]
+            )
+            if rsa_public_key is None:
+                raise ValueError("Unknown key id")
+
             user_info = jwt.decode(
                 jwt=form.id_token,
                 key=rsa_public_key,
@@ -1,3 +1,4 @@
+import asyncio
 from contextvars import ContextVar
 
 import peewee
@@ -61,6 +62,21 @@ async def reset_db_state():
     db._state.reset()
 
 
+async def run_in_new_db_state(func, *args, **kwargs):
+    """
+    요청 밖(백그라운드 작업)에서 DB 작업을 스레드로 실행
+    - 호출한 쪽의 커넥션 상태와 섞이지 않도록 새 커넥션 상태에서 실행하고 끝나면 커넥션을 반납한다
+    """
+
+    def run():
+        db._state._state.set(db_state_default.copy())
+        db._state.reset()
+        with db.connection_context():
+            return func(*args, **kwargs)
+
+    return await asyncio.to_thread(run)
+
+
 def read_only(db_state=Depends(reset_db_state)):
     try:
         db.connect()
@@ -59,3 +59,8 @@ S3_BUCKET_NAME = "sulsul-s3"
 
 MAX_UPLOAD_FILE_MIB_SIZE = 8
 MAX_UPLOAD_FILE_BYTE_SIZE = MAX_UPLOAD_FILE_MIB_SIZE * 1000**2
+MAX_UPLOAD_FILE_COUNT = 10
+MAX_UPLOAD_CONCURRENCY = 4
+
+# 주간 랭킹 응답 캐시 시간 (초) - 새 랭킹이 저장되면 최대 이 시간 후에 반영된다
+RANKING_CACHE_MAX_AGE = 60
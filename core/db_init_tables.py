@@ -317,20 +317,20 @@ pairing_data = [
         "description": "오비입니다",
         "order": 9,
     },
-    {
-        "type": "술",
-        "subtype": "하이볼",
-        "name": "하이볼",
-        "image": "https://s3-ap-northeast-2.amazonaws.com/sulsul-s3/images%2F4ef6d21c-6599-46cd-9869-c875bc05edfa.png",
-        "description": "하이볼입니다",
-        "order": 10,
-    },
     {
         "type": "술",
         "subtype": "막걸리",
         "name": "막걸리",
         "image": "https://s3-ap-northeast-2.amazonaws.com/sulsul-s3/images%2Fa843352c-4289-4875-9601-e35cd85e72ec.png",
         "description": "막걸리입니다",
+        "order": 10,
+    },
+    {
+        "type": "술",
+        "subtype": "하이볼",
+        "name": "하이볼",
+        "image": "https://s3-ap-northeast-2.amazonaws.com/sulsul-s3/images%2F4ef6d21c-6599-46cd-9869-c875bc05edfa.png",
+        "description": "하이볼입니다",
         "order": 11,
     },
     {
@@ -569,12 +569,59 @@ report_data = [
 # 더미데이터 생성용. 더미데이터 생성을 하고 싶으면 주석을 풀고 db_init_tables.py를 실행
 db.connect()
 
-# Feed의 FK때문에 선언 순서가 중요함. FeedLike -> Comment -> Feed 순
-models = [Admin, User, FeedLike, Comment, Feed, Pairing, Combination, Report, UserBlock]
+from core.domain.feed.feed_search_model import FeedSearchDocument
+from core.domain.ranking.popular_feed_model import PopularFeed
+from core.domain.file.uploaded_image_model import UploadedImage
+from core.domain.outbox.outbox_event_model import OutboxEvent
+from core.domain.notification.notification_model import Notification
+from core.domain.ranking.search_volume_model import SearchVolume
+from core.domain.ranking.like_rollup_model import (
+    DailyAlcoholLike,
+    DailyCombinationLike,
+    LikeRollupWatermark,
+)
+
+# Feed의 FK때문에 선언 순서가 중요함. FeedLike -> Comment -> FeedSearchDocument -> PopularFeed -> Feed 순
+models = [
+    Admin,
+    UploadedImage,
+    User,
+    FeedLike,
+    Comment,
+    FeedSearchDocument,
+    PopularFeed,
+    Feed,
+    Pairing,
+    Combination,
+    Report,
+    UserBlock,
+    OutboxEvent,
+    Notification,
+    SearchVolume,
+    DailyAlcoholLike,
+    DailyCombinationLike,
+    LikeRollupWatermark,
+]
 
 # db.drop_tables(models, cascade=True)
 # db.create_tables(models, safe=True)
 
+# 기존 search_volume 테이블에 (name, start_date, end_date) unique 인덱스 추가 (중복 row 정리 후 실행)
+# SearchVolume._schema.create_indexes(safe=True)
+
+# 기존 pairing 데이터의 막걸리/하이볼 순서 변경 (홈 화면 술 탭 순서 : 소주, 맥주, 막걸리, 하이볼, 와인)
+# Pairing.update(order=10).where(Pairing.name == "막걸리").execute()
+# Pairing.update(order=11).where(Pairing.name == "하이볼").execute()
+
+# 기존 uploaded_image 테이블에 status 컬럼 추가 (기존 row는 uploaded)
+# from core.config.var_config import DB_SCHEMA
+# from playhouse.migrate import PostgresqlMigrator, migrate
+# migrator = PostgresqlMigrator(db)
+# migrate(
+#     migrator.set_search_path(DB_SCHEMA),
+#     migrator.add_column(UploadedImage._meta.table_name, "status", UploadedImage.status),
+# )
+
 # User.bulk_create([User(**data) for data in user_data])
 # Feed.bulk_create([Feed(**data) for data in feed_data])
 # FeedLike.bulk_create([FeedLike(**data) for data in feed_like_data])
@@ -583,4 +630,8 @@ models = [Admin, User, FeedLike, Comment, Feed, Pairing, Combination, Report, Us
 # Combination.bulk_create([Combination(**data) for data in combination_data])
 # Report.bulk_create([Report(**data) for data in report_data])
 
+# 검색 문서 생성 (피드 더미데이터 생성 후 실행)
+# from core.domain.feed.feed_query_function import rebuild_feed_search_documents
+# rebuild_feed_search_documents()
+
 db.close()
@@ -1,4 +1,10 @@
+from typing import List, Tuple
+
+from peewee import fn
+
 from core.domain.combination.combination_model import Combination
+from core.domain.feed.feed_like_model import FeedLike
+from core.domain.feed.feed_model import Feed
 from core.domain.pairing.pairing_model import Pairing
 
 
@@ -74,3 +80,60 @@ def fetch_combination_ranking(order_by_popular: bool) -> list:
             }
         )
     return result_list
+
+
+def fetch_feed_pairings_with_like_counts(
+    after_feed_id: int, until_feed_like_id: int
+) -> List[Tuple[int, List[int], List[int], int]]:
+    """
+    after_feed_id 이후 피드의 (feed_id, 술 id 목록, 안주 id 목록, 좋아요 수) 목록
+    - 좋아요는 until_feed_like_id 까지만 센다 (이후 좋아요는 fetch_liked_feed_pairings 로 하나씩 가져감)
+    """
+    return list(
+        Feed.select(
+            Feed.id,
+            Feed.alcohol_pairing_ids,
+            Feed.food_pairing_ids,
+            fn.COUNT(FeedLike.id),
+        )
+        .left_outer_join(
+            FeedLike,
+            on=((Feed.id == FeedLike.feed_id) & (FeedLike.id <= until_feed_like_id)),
+        )
+        .where(Feed.id > after_feed_id, Feed.is_deleted == False)
+        .group_by(Feed.id)
+        .tuples()
+    )
+
+
+def fetch_feed_pairings(after_feed_id: int) -> List[Tuple[int, List[int], List[int]]]:
+    """
+    after_feed_id 이후 피드의 (feed_id, 술 id 목록, 안주 id 목록) 목록
+    """
+    return list(
+        Feed.select(Feed.id, Feed.alcohol_pairing_ids, Feed.food_pairing_ids)
+        .where(Feed.id > after_feed_id, Feed.is_deleted == False)
+        .tuples()
+    )
+
+
+def fetch_liked_feed_pairings(
+    after_feed_like_id: int, until_feed_like_id: int
+) -> List[Tuple[int, List[int], List[int]]]:
+    """
+    (after_feed_like_id, until_feed_like_id] 좋아요의 (feed_like_id, 술 id 목록, 안주 id 목록) 목록 (좋아요 하나당 하나)
+    """
+    return list(
+        FeedLike.select(FeedLike.id, Feed.alcohol_pairing_ids, Feed.food_pairing_ids)
+        .join(Feed, on=(FeedLike.feed_id == Feed.id))
+        .where(
+            FeedLike.id > after_feed_like_id,
+            FeedLike.id <= until_feed_like_id,
+            Feed.is_deleted == False,
+        )
+        .tuples()
+    )
+
+
+def fetch_max_feed_like_id() -> int:
+    return FeedLike.select(fn.MAX(FeedLike.id)).scalar() or 0
@@ -14,6 +14,7 @@ class Feed(BaseEntity):
     content = CharField(max_length=500, null=False)
     score = DoubleField(default=0.0)
     represent_image = CharField(null=False)
+    thumbnail_image = CharField(null=True)  # 목록 조회용 썸네일 (업로드 시 생성, 없으면 null)
     images = ArrayField(CharField, null=False)
     alcohol_pairing_ids = ArrayField(
         IntegerField, null=False
@@ -43,6 +44,9 @@ class Feed(BaseEntity):
             self.user_tags = user_tags if user_tags is not None else self.user_tags
             self.save()
 
+    def get_thumbnail_image(self) -> str:
+        return self.thumbnail_image or self.represent_image
+
     def add_view_count(self):
         # NOTICE : save를 호출하면 updated_at이 갱신되므로 호출하지 않는다.
         # FIXME : 조회수 증가 로직 고도화 필요 (ex. 하루에 한번만 증가)
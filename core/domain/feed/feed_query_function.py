@@ -1,16 +1,25 @@
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Iterable, Dict, Set
 
-from peewee import fn, Case, SQL
+from peewee import fn, Case, SQL, Cast, Value
 
 from core.domain.comment.comment_model import Comment
 from core.domain.feed.feed_like_model import FeedLike
 from core.domain.feed.feed_model import Feed
+from core.domain.feed.feed_search_model import FeedSearchDocument
 from core.domain.user.user_model import User
 from core.dto.feed_dto import RandomFeedDto, PopularFeedDto
+from core.util.cache import pairing_cache_store
+from core.util.search_util import (
+    escape_like,
+    tokenize_document,
+    tokenize_query,
+    split_words,
+)
 
 
 def fetch_related_feeds_by_feed_id(
-    feed_id: int, next_feed_id: int, size: int
+    feed_id: int, next_feed_id: int, size: int, blocked_user_ids: Iterable[int] = ()
 ) -> List[Feed]:
     feed = Feed.get_or_raise(feed_id)
     return (
@@ -24,6 +33,7 @@ def fetch_related_feeds_by_feed_id(
             Feed.id != feed_id,
             Feed.is_deleted == False,
             Feed.id > next_feed_id,
+            Feed.user.not_in(blocked_user_ids),
         )
         .order_by(Feed.id.asc())
         .limit(size)
@@ -31,7 +41,7 @@ def fetch_related_feeds_by_feed_id(
 
 
 def fetch_related_feeds_by_classify_tags(
-    tags: List[str], next_feed_id: int, size: int
+    tags: List[str], next_feed_id: int, size: int, blocked_user_ids: Iterable[int] = ()
 ) -> List[Feed]:
     return (
         Feed.select()
@@ -40,31 +50,52 @@ def fetch_related_feeds_by_classify_tags(
             Feed.food_pairing_ids.contains(tags),
             Feed.id > next_feed_id,
             Feed.is_deleted == False,
+            Feed.user.not_in(blocked_user_ids),
         )
         .order_by(Feed.id.desc())
         .limit(size)
     )
 
 
-def fetch_feeds_likes_to_dict(
-    related_feeds: List[Feed], login_user: Optional[User]
-) -> dict:
-    if login_user is None:
-        return {}
-    return (
-        FeedLike.select()
+def fetch_like_counts_by_feed_ids(feed_ids: List[int]) -> Dict[int, int]:
+    return {
+        feed_id: like_count
+        for feed_id, like_count in FeedLike.select(FeedLike.feed, fn.COUNT(FeedLike.id))
+        .where(FeedLike.feed.in_(feed_ids), FeedLike.is_deleted == False)
+        .group_by(FeedLike.feed)
+        .tuples()
+    }
+
+
+def fetch_comment_counts_by_feed_ids(feed_ids: List[int]) -> Dict[int, int]:
+    return {
+        feed_id: comment_count
+        for feed_id, comment_count in Comment.select(Comment.feed, fn.COUNT(Comment.id))
+        .where(Comment.feed.in_(feed_ids), Comment.is_deleted == False)
+        .group_by(Comment.feed)
+        .tuples()
+    }
+
+
+def fetch_liked_feed_ids(feed_ids: List[int], login_user_id: Optional[int]) -> Set[int]:
+    if login_user_id is None or login_user_id < 0:
+        return set()
+    return {
+        feed_id
+        for (feed_id,) in FeedLike.select(FeedLike.feed)
         .where(
-            FeedLike.feed.in_(related_feeds),
-            FeedLike.user == login_user.id,
+            FeedLike.feed.in_(feed_ids),
+            FeedLike.user == login_user_id,
             FeedLike.is_deleted == False,
         )
-        .dicts()
-    )
+        .tuples()
+    }
 
 
 def fetch_my_feeds(login_user_id: int, next_feed_id: int, size: int) -> List[Feed]:
     return (
-        Feed.select()
+        Feed.select(Feed, User)
+        .join(User, on=(Feed.user == User.id))
         .where(
             Feed.user == login_user_id,
             Feed.is_deleted == False,
@@ -76,16 +107,22 @@ def fetch_my_feeds(login_user_id: int, next_feed_id: int, size: int) -> List[Fee
 
 
 def fetch_feeds_liked_by_me(
-    login_user_id: int, next_feed_id: int, size: int
+    login_user_id: int,
+    next_feed_id: int,
+    size: int,
+    blocked_user_ids: Iterable[int] = (),
 ) -> List[Feed]:
     return (
-        Feed.select()
+        Feed.select(Feed, User)
         .join(FeedLike)
+        .switch(Feed)
+        .join(User, on=(Feed.user == User.id))
         .where(
             FeedLike.user == login_user_id,
             FeedLike.is_deleted == False,
             Feed.is_deleted == False,
             Feed.id > next_feed_id,
+            Feed.user.not_in(blocked_user_ids),
         )
         .limit(size)
         .order_by(Feed.id.desc())
@@ -93,13 +130,19 @@ def fetch_feeds_liked_by_me(
 
 
 def fetch_feeds_randomly(
-    size: int, exclude_feed_ids: List[int], login_user_id: Optional[int] = None
+    size: int,
+    exclude_feed_ids: List[int],
+    login_user_id: Optional[int] = None,
+    blocked_user_ids: Iterable[int] = (),
 ) -> List[RandomFeedDto]:
     projection_fields = [
         Feed.id.alias("feed_id"),
         Feed.title,
         Feed.content,
         Feed.represent_image,
+        fn.COALESCE(Feed.thumbnail_image, Feed.represent_image).alias(
+            "thumbnail_image"
+        ),
         Feed.updated_at,
         User.id.alias("user_id"),
         User.nickname.alias("user_nickname"),
@@ -129,6 +172,7 @@ def fetch_feeds_randomly(
                 (Comment.is_deleted == False) | (Comment.is_deleted.is_null())
             ),  # 댓글이 없는 경우도 카운트하기 위함
             Feed.id.not_in(exclude_feed_ids),
+            Feed.user.not_in(blocked_user_ids),
         )
         .group_by(Feed.id, User.id, FeedLike.id)
         .limit(size)
@@ -164,7 +208,7 @@ def fetch_feeds_order_by_feed_like_and_cominations(
         .join(User, on=(Feed.user == User.id))
         .where(
             fn.ARRAY_CAT(Feed.alcohol_pairing_ids, Feed.food_pairing_ids)
-            == SQL(f"ARRAY{combination_ids}"),
+            == Cast(Value(combination_ids, unpack=False), "int[]"),
             Feed.is_deleted == False,
         )
         .group_by(Feed.id, User.id)
@@ -176,12 +220,132 @@ def fetch_feeds_order_by_feed_like_and_cominations(
     )
 
 
-def fetch_all_by_alcohol_ids(alcohol_ids: List[int], size: int) -> List[Feed]:
+def fetch_all_by_alcohol_ids(
+    alcohol_ids: List[int], size: int, blocked_user_ids: Iterable[int] = ()
+) -> List[Feed]:
     return (
-        Feed.select()
+        Feed.select(Feed, User)
+        .join(User, on=(Feed.user == User.id))
         .where(
-            Feed.alcohol_pairing_ids.contains_any(alcohol_ids), Feed.is_deleted == False
+            Feed.alcohol_pairing_ids.contains_any(alcohol_ids),
+            Feed.is_deleted == False,
+            Feed.user.not_in(blocked_user_ids),
         )
         .order_by(fn.Random())
         .limit(size)
     )
+
+
+def fetch_recent_feeds_with_like_count(size: int) -> List[Feed]:
+    """
+    최근 피드 size 개 (작성자 join, 좋아요 수는 feed.like_count)
+    """
+    return list(
+        Feed.select(Feed, User, fn.COUNT(FeedLike.id).alias("like_count"))
+        .join(User, on=(Feed.user == User.id))
+        .switch(Feed)
+        .left_outer_join(
+            FeedLike,
+            on=((Feed.id == FeedLike.feed_id) & (FeedLike.is_deleted == False)),
+        )
+        .where(Feed.is_deleted == False)
+        .group_by(Feed.id, User.id)
+        .order_by(Feed.id.desc())
+        .limit(size)
+    )
+
+
+def fetch_user_tag_counts(limit: int) -> List[tuple]:
+    return (
+        Feed.select(
+            fn.unnest(Feed.user_tags).alias("tag"),
+            fn.COUNT(Feed.id).alias("tag_count"),
+        )
+        .where(Feed.is_deleted == False)
+        .group_by(SQL("tag"))
+        .order_by(SQL("tag_count").desc())
+        .limit(limit)
+        .tuples()
+    )
+
+
+def save_feed_search_document(feed: Feed):
+    pairing_names = pairing_cache_store.get_all_names_by_ids(
+        feed.alcohol_pairing_ids + feed.food_pairing_ids
+    )
+    tags_text = " ".join((feed.user_tags or []) + pairing_names)
+    document = " ".join((feed.title, feed.content, tags_text)).lower()
+
+    (
+        FeedSearchDocument.insert(
+            feed=feed.id,
+            document=document,
+            tokens=tokenize_document(document),
+            title_tokens=tokenize_document(feed.title),
+            tag_tokens=tokenize_document(tags_text),
+        )
+        .on_conflict(
+            conflict_target=[FeedSearchDocument.feed],
+            preserve=[
+                FeedSearchDocument.document,
+                FeedSearchDocument.tokens,
+                FeedSearchDocument.title_tokens,
+                FeedSearchDocument.tag_tokens,
+            ],
+            update={FeedSearchDocument.updated_at: datetime.now()},
+        )
+        .execute()
+    )
+
+
+def rebuild_feed_search_documents():
+    for feed in Feed.select().where(Feed.is_deleted == False).iterator():
+        save_feed_search_document(feed)
+
+
+def search_feeds_by_keyword(
+    keyword: str,
+    size: int,
+    cursor_relevance: Optional[int] = None,
+    cursor_feed_id: Optional[int] = None,
+    blocked_user_ids: Iterable[int] = (),
+) -> List[Feed]:
+    """
+    검색 결과는 관련도(제목 3 > 유저 태그, 술/안주 이름 2 > 내용 1), id 역순으로 정렬된다
+    - 관련도와 피드 id를 커서로 사용한다 (keyset pagination)
+    """
+    words = split_words(keyword)
+    if len(words) == 0:
+        return []
+
+    query_tokens = tokenize_query(words)
+    relevance = Case(
+        None,
+        [
+            (FeedSearchDocument.title_tokens.contains(*query_tokens), 3),
+            (FeedSearchDocument.tag_tokens.contains(*query_tokens), 2),
+        ],
+        1,
+    )
+
+    conditions = [
+        FeedSearchDocument.tokens.contains(*query_tokens),
+        Feed.is_deleted == False,
+        Feed.user.not_in(blocked_user_ids),
+    ]
+    conditions.extend(
+        FeedSearchDocument.document.ilike(f"%{escape_like(word)}%") for word in words
+    )
+    if cursor_relevance is not None and cursor_feed_id is not None:
+        conditions.append(
+            (relevance < cursor_relevance)
+            | ((relevance == cursor_relevance) & (Feed.id < cursor_feed_id))
+        )
+
+    return (
+        Feed.select(Feed, relevance.alias("relevance"))
+        .join(FeedSearchDocument, on=(FeedSearchDocument.feed == Feed.id))
+        .where(*conditions)
+        .order_by(SQL("relevance").desc(), Feed.id.desc())
+        .limit(size)
+    )
@@ -0,0 +1,23 @@
+import peewee
+from playhouse.postgres_ext import ArrayField
+
+from core.domain.base_entity import BaseEntity
+from core.domain.feed.feed_model import Feed
+
+
+class FeedSearchDocument(BaseEntity):
+    """
+    피드 검색용 문서
+    - document : 제목, 내용, 유저 태그, 술/안주 이름을 이어붙인 검색 대상 원문
+    - tokens : document의 1-gram, 2-gram 토큰 (GIN 인덱스로 후보 피드를 찾는다)
+    - title_tokens, tag_tokens : 검색 결과 정렬(제목 > 태그 > 내용)에 사용
+    """
+
+    feed = peewee.ForeignKeyField(Feed, unique=True, backref="search_document")
+    document = peewee.TextField(null=False)
+    tokens = ArrayField(peewee.TextField, index=True, index_type="GIN")
+    title_tokens = ArrayField(peewee.TextField, default=[])
+    tag_tokens = ArrayField(peewee.TextField, default=[])
+
+    class Meta:
+        table_name = "feed_search_document"
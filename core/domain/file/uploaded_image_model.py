@@ -0,0 +1,35 @@
+from enum import Enum
+
+import peewee
+
+from core.domain.base_entity import BaseEntity
+from core.domain.user.user_model import User
+
+
+class UploadedImageStatus(Enum):
+    PENDING = "pending"  # presigned POST 발급 후 업로드 확인 전
+    UPLOADED = "uploaded"
+
+
+class UploadedImage(BaseEntity):
+    """
+    업로드된 이미지
+    - thumbnail_url : 목록 조회용 썸네일 (webp)
+    - webp_url : 원본 해상도 webp 변환본
+    - classifier_image_url : 분류 모델 입력용 224x224 이미지
+    - 변환에 실패한 경우(ex. heic) 변환 이미지 url은 null
+    - presigned POST로 발급한 key는 발급받은 유저로 PENDING 상태로 저장해두고, 업로드 확인 후 UPLOADED로 바꾼다
+    """
+
+    user = peewee.ForeignKeyField(User, null=True, backref="uploaded_images")
+    s3_key = peewee.CharField(unique=True)
+    url = peewee.CharField(unique=True)
+    content_type = peewee.CharField(null=False)
+    size = peewee.IntegerField(null=False)
+    thumbnail_url = peewee.CharField(null=True)
+    webp_url = peewee.CharField(null=True)
+    classifier_image_url = peewee.CharField(null=True)
+    status = peewee.CharField(max_length=10, default=UploadedImageStatus.UPLOADED.value)
+
+    class Meta:
+        table_name = "uploaded_image"
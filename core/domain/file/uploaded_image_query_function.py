@@ -0,0 +1,38 @@
+from typing import Optional
+
+from core.config.orm_config import db
+from core.domain.file.uploaded_image_model import UploadedImage
+
+
+def save_uploaded_image(**fields) -> UploadedImage:
+    """
+    업로드 요청은 S3 업로드 동안 커넥션을 잡고 있지 않도록, 저장할 때만 커넥션을 연다
+    """
+    with db.connection_context():
+        return UploadedImage.create(**fields)
+
+
+def fetch_uploaded_image_by_url(url: str) -> Optional[UploadedImage]:
+    return UploadedImage.get_or_none(
+        UploadedImage.url == url, UploadedImage.is_deleted == False
+    )
+
+
+def fetch_thumbnail_url(image_url: str) -> Optional[str]:
+    uploaded_image = fetch_uploaded_image_by_url(image_url)
+    if uploaded_image is None:
+        return None
+    return uploaded_image.thumbnail_url
+
+
+def fetch_uploaded_image_by_s3_key(s3_key: str) -> Optional[UploadedImage]:
+    with db.connection_context():
+        return UploadedImage.get_or_none(UploadedImage.s3_key == s3_key)
+
+
+def update_uploaded_image(uploaded_image: UploadedImage, **fields) -> UploadedImage:
+    with db.connection_context():
+        for name, value in fields.items():
+            setattr(uploaded_image, name, value)
+        uploaded_image.save()
+        return uploaded_image
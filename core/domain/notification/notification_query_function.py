@@ -0,0 +1,9 @@
+from typing import List
+
+from core.domain.notification.notification_model import Notification
+
+
+def save_notifications(rows: List[dict]) -> int:
+    if not rows:
+        return 0
+    return Notification.insert_many(rows).execute()
@@ -0,0 +1,33 @@
+from datetime import datetime
+from enum import Enum
+
+import peewee
+from playhouse.postgres_ext import BinaryJSONField
+
+from core.domain.base_entity import BaseEntity
+
+
+class OutboxEventStatus(str, Enum):
+    PENDING = "PENDING"
+    PROCESSING = "PROCESSING"
+    DONE = "DONE"
+    FAILED = "FAILED"
+
+
+class OutboxEvent(BaseEntity):
+    """
+    트랜잭셔널 아웃박스 이벤트 (ex. 댓글 작성 -> 푸시 알림)
+    - 이벤트를 발생시킨 작업과 같은 트랜잭션에서 저장하고, OutboxDispatcher가 백그라운드에서 처리한다
+    - available_at : 이 시간 이후에 처리 가능 (처리중인 이벤트는 lease 만료 시간, 실패한 이벤트는 재시도 시간)
+    """
+
+    event_type = peewee.CharField(max_length=50, null=False)
+    payload = BinaryJSONField(default={})
+    status = peewee.CharField(max_length=20, default=OutboxEventStatus.PENDING.value)
+    attempts = peewee.IntegerField(default=0)
+    available_at = peewee.DateTimeField(default=datetime.now)
+    last_error = peewee.TextField(null=True)
+
+    class Meta:
+        table_name = "outbox_event"
+        indexes = ((("status", "available_at"), False),)
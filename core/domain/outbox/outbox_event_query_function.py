@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta
+from typing import List
+
+from pydantic import BaseModel
+
+from core.config.orm_config import db
+from core.domain.outbox.outbox_event_model import OutboxEvent, OutboxEventStatus
+
+
+def save_outbox_event(event_type: str, payload: BaseModel) -> OutboxEvent:
+    return OutboxEvent.create(event_type=event_type, payload=payload.model_dump())
+
+
+def claim_outbox_events(size: int, lease_seconds: int) -> List[OutboxEvent]:
+    """
+    처리할 이벤트를 가져와서 lease_seconds 동안 선점
+    - FOR UPDATE SKIP LOCKED 로 여러 워커가 동시에 가져가도 같은 이벤트를 중복으로 가져가지 않는다
+    - 처리중(PROCESSING)이던 워커가 죽으면 lease가 끝난 후 다른 워커가 다시 가져간다
+    """
+    now = datetime.now()
+    with db.atomic():
+        events = list(
+            OutboxEvent.select()
+            .where(
+                OutboxEvent.status.in_(
+                    [
+                        OutboxEventStatus.PENDING.value,
+                        OutboxEventStatus.PROCESSING.value,
+                    ]
+                ),
+                OutboxEvent.available_at <= now,
+            )
+            .order_by(OutboxEvent.id)
+            .limit(size)
+            .for_update("FOR UPDATE SKIP LOCKED")
+        )
+        if events:
+            (
+                OutboxEvent.update(
+                    status=OutboxEventStatus.PROCESSING.value,
+                    available_at=now + timedelta(seconds=lease_seconds),
+                    attempts=OutboxEvent.attempts + 1,
+                )
+                .where(OutboxEvent.id.in_([event.id for event in events]))
+                .execute()
+            )
+    for event in events:
+        event.attempts += 1
+    return events
+
+
+def complete_outbox_events(event_ids: List[int]):
+    (
+        OutboxEvent.update(
+            status=OutboxEventStatus.DONE.value, updated_at=datetime.now()
+        )
+        .where(OutboxEvent.id.in_(event_ids))
+        .execute()
+    )
+
+
+def fail_outbox_events(
+    events: List[OutboxEvent], error: str, max_attempts: int, backoff_seconds: int
+):
+    """
+    max_attempts 만큼 시도했으면 FAILED, 아니면 backoff 후 다시 처리되도록 PENDING
+    """
+    now = datetime.now()
+    with db.atomic():
+        for event in events:
+            is_failed = event.attempts >= max_attempts
+            (
+                OutboxEvent.update(
+                    status=(
+                        OutboxEventStatus.FAILED.value
+                        if is_failed
+                        else OutboxEventStatus.PENDING.value
+                    ),
+                    available_at=now
+                    + timedelta(seconds=backoff_seconds * 2 ** (event.attempts - 1)),
+                    last_error=error,
+                    updated_at=now,
+                )
+                .where(OutboxEvent.id == event.id)
+                .execute()
+            )
@@ -1,4 +1,6 @@
-from typing import List
+from typing import List, Tuple
+
+from peewee import fn
 
 from core.domain.pairing.pairing_model import Pairing
 
@@ -9,3 +11,20 @@ def fetch_pairings_by_multiple_ids(pairing_ids: List[int]):
         Pairing.is_deleted == False,
     )
     return query.execute()
+
+
+def fetch_alcohol_ids_by_subtype() -> List[Tuple[str, List[int]]]:
+    """
+    술 subtype별 술 id 목록 (subtype에 속한 술의 가장 작은 order 순)
+    """
+    return list(
+        Pairing.select(Pairing.subtype, fn.array_agg(Pairing.id).alias("ids"))
+        .where(
+            Pairing.type == "술",
+            Pairing.subtype.is_null(False),
+            Pairing.is_deleted == False,
+        )
+        .group_by(Pairing.subtype)
+        .order_by(fn.MIN(Pairing.order).asc(nulls="LAST"), Pairing.subtype)
+        .tuples()
+    )
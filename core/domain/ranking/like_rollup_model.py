@@ -0,0 +1,48 @@
+import peewee
+from playhouse.postgres_ext import ArrayField
+
+from core.domain.base_entity import BaseEntity
+
+
+class DailyAlcoholLike(BaseEntity):
+    """
+    술별 일간 좋아요 수 (랭킹 배치에서 새로 생긴 좋아요만 더한다)
+    - date : 좋아요 누른 날짜
+    - 주간 술 랭킹은 7일치 row의 like_count 합계로 구한다
+    """
+
+    date = peewee.DateField(null=False)
+    alcohol_id = peewee.IntegerField(null=False)
+    like_count = peewee.IntegerField(default=0)
+
+    class Meta:
+        table_name = "daily_alcohol_like"
+        indexes = ((("date", "alcohol_id"), True),)
+
+
+class DailyCombinationLike(BaseEntity):
+    """
+    조합별 일간 좋아요 수 (랭킹 배치에서 새로 생긴 좋아요만 더한다)
+    - combined_ids : 피드의 alcohol_pairing_ids + food_pairing_ids
+    """
+
+    date = peewee.DateField(null=False)
+    combined_ids = ArrayField(
+        peewee.IntegerField, null=False, index=False, index_type="BTREE"
+    )
+    like_count = peewee.IntegerField(default=0)
+
+    class Meta:
+        table_name = "daily_combination_like"
+        indexes = ((("date", "combined_ids"), True),)
+
+
+class LikeRollupWatermark(BaseEntity):
+    """
+    일간 좋아요 집계에 반영된 마지막 FeedLike.id (row 하나만 사용)
+    """
+
+    last_feed_like_id = peewee.BigIntegerField(default=0)
+
+    class Meta:
+        table_name = "like_rollup_watermark"
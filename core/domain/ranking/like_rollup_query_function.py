@@ -0,0 +1,274 @@
+from collections import Counter
+from datetime import date, datetime
+from typing import List, Optional, Tuple
+
+from peewee import EXCLUDED, SQL, Value, fn
+
+from core.domain.feed.feed_like_model import FeedLike
+from core.domain.feed.feed_model import Feed
+from core.domain.ranking.like_rollup_model import (
+    DailyAlcoholLike,
+    DailyCombinationLike,
+    LikeRollupWatermark,
+)
+
+WATERMARK_ID = 1
+
+
+def fetch_watermark(lock: str = "FOR UPDATE") -> Optional[LikeRollupWatermark]:
+    """
+    watermark row를 lock 잡고 조회
+    - 배치는 FOR UPDATE, 좋아요/좋아요 취소는 FOR SHARE 로 잡는다
+    - 배치는 진행중인 좋아요 트랜잭션이 끝난 후 집계하므로, 커밋 순서가 id 순서와 달라도 빠지는 좋아요가 없다
+    - SKIP LOCKED 로 조회했는데 다른 곳에서 집계중이면 None
+    """
+    query = (
+        LikeRollupWatermark.select()
+        .where(LikeRollupWatermark.id == WATERMARK_ID)
+        .for_update(lock)
+    )
+    watermark = query.get_or_none()
+    if watermark is None:
+        LikeRollupWatermark.insert(id=WATERMARK_ID).on_conflict_ignore().execute()
+        watermark = query.get_or_none()
+    return watermark
+
+
+def save_feed_like(user_id: int, feed_id: int) -> FeedLike:
+    """
+    좋아요 저장 (트랜잭션 안에서 호출, 집계중인 배치가 있으면 끝날 때까지 기다린다)
+    """
+    fetch_watermark(lock="FOR SHARE")
+    return FeedLike.create(user=user_id, feed=feed_id)
+
+
+def aggregate_new_feed_likes(skip_locked: bool = False) -> Tuple[int, int]:
+    """
+    마지막 집계 이후 새로 생긴 좋아요(FeedLike.id > watermark)만 일간 집계 테이블에 더한다
+    - 트랜잭션 안에서 호출해야 한다 (watermark row lock을 잡고 집계 + watermark 갱신)
+    - skip_locked : 다른 곳에서 집계중이면 기다리지 않고 넘어간다 (-1, -1 반환)
+    - (이전 watermark, 새 watermark) 반환
+    """
+    watermark = fetch_watermark(
+        lock="FOR UPDATE SKIP LOCKED" if skip_locked else "FOR UPDATE"
+    )
+    if watermark is None:
+        return -1, -1
+    last_feed_like_id = watermark.last_feed_like_id
+    max_feed_like_id = (
+        FeedLike.select(fn.MAX(FeedLike.id))
+        .where(FeedLike.id > last_feed_like_id)
+        .scalar()
+    )
+    if max_feed_like_id is None:
+        return last_feed_like_id, last_feed_like_id
+
+    now = datetime.now()
+    new_likes = (FeedLike.id > last_feed_like_id) & (FeedLike.id <= max_feed_like_id)
+    like_date = fn.DATE(FeedLike.created_at)
+
+    (
+        DailyAlcoholLike.insert_from(
+            Feed.select(
+                like_date,
+                fn.unnest(Feed.alcohol_pairing_ids).alias("alcohol_id"),
+                fn.COUNT(FeedLike.id),
+                Value(now),
+                Value(now),
+                Value(False),
+            )
+            .join(FeedLike, on=(Feed.id == FeedLike.feed_id))
+            .where(new_likes)
+            .group_by(like_date, SQL("alcohol_id")),
+            fields=[
+                DailyAlcoholLike.date,
+                DailyAlcoholLike.alcohol_id,
+                DailyAlcoholLike.like_count,
+                DailyAlcoholLike.created_at,
+                DailyAlcoholLike.updated_at,
+                DailyAlcoholLike.is_deleted,
+            ],
+        )
+        .on_conflict(
+            conflict_target=[DailyAlcoholLike.date, DailyAlcoholLike.alcohol_id],
+            update={
+                DailyAlcoholLike.like_count: DailyAlcoholLike.like_count
+                + EXCLUDED.like_count,
+                DailyAlcoholLike.updated_at: now,
+            },
+        )
+        .execute()
+    )
+
+    (
+        DailyCombinationLike.insert_from(
+            Feed.select(
+                like_date,
+                fn.ARRAY_CAT(Feed.alcohol_pairing_ids, Feed.food_pairing_ids).alias(
+                    "combined_ids"
+                ),
+                fn.COUNT(FeedLike.id),
+                Value(now),
+                Value(now),
+                Value(False),
+            )
+            .join(FeedLike, on=(Feed.id == FeedLike.feed_id))
+            .where(new_likes)
+            .group_by(like_date, SQL("combined_ids")),
+            fields=[
+                DailyCombinationLike.date,
+                DailyCombinationLike.combined_ids,
+                DailyCombinationLike.like_count,
+                DailyCombinationLike.created_at,
+                DailyCombinationLike.updated_at,
+                DailyCombinationLike.is_deleted,
+            ],
+        )
+        .on_conflict(
+            conflict_target=[
+                DailyCombinationLike.date,
+                DailyCombinationLike.combined_ids,
+            ],
+            update={
+                DailyCombinationLike.like_count: DailyCombinationLike.like_count
+                + EXCLUDED.like_count,
+                DailyCombinationLike.updated_at: now,
+            },
+        )
+        .execute()
+    )
+
+    (
+        LikeRollupWatermark.update(last_feed_like_id=max_feed_like_id, updated_at=now)
+        .where(LikeRollupWatermark.id == WATERMARK_ID)
+        .execute()
+    )
+    return last_feed_like_id, max_feed_like_id
+
+
+def delete_feed_likes(*conditions) -> int:
+    """
+    좋아요 삭제 (좋아요 취소, 피드 삭제)
+    - 이미 일간 집계에 반영된 좋아요(id <= watermark)는 집계에서도 뺀다
+    - 트랜잭션 안에서 호출해야 한다 (배치가 집계중이면 끝날 때까지 기다린다)
+    """
+    watermark = fetch_watermark(lock="FOR SHARE")
+    aggregated_likes = list(
+        FeedLike.select(
+            FeedLike.created_at, Feed.alcohol_pairing_ids, Feed.food_pairing_ids
+        )
+        .join(Feed, on=(FeedLike.feed_id == Feed.id))
+        .where(*conditions, FeedLike.id <= watermark.last_feed_like_id)
+        .objects()
+    )
+
+    alcohol_counts, combination_counts = Counter(), Counter()
+    for like in aggregated_likes:
+        like_date = like.created_at.date()
+        for alcohol_id in like.alcohol_pairing_ids:
+            alcohol_counts[(like_date, alcohol_id)] += 1
+        combined_ids = tuple(like.alcohol_pairing_ids + like.food_pairing_ids)
+        combination_counts[(like_date, combined_ids)] += 1
+
+    for (like_date, alcohol_id), count in alcohol_counts.items():
+        (
+            DailyAlcoholLike.update(like_count=DailyAlcoholLike.like_count - count)
+            .where(
+                DailyAlcoholLike.date == like_date,
+                DailyAlcoholLike.alcohol_id == alcohol_id,
+            )
+            .execute()
+        )
+    for (like_date, combined_ids), count in combination_counts.items():
+        (
+            DailyCombinationLike.update(
+                like_count=DailyCombinationLike.like_count - count
+            )
+            .where(
+                DailyCombinationLike.date == like_date,
+                DailyCombinationLike.combined_ids == list(combined_ids),
+            )
+            .execute()
+        )
+
+    return FeedLike.delete().where(*conditions).execute()
+
+
+def fetch_weekly_alcohol_like_counts(
+    start_date: date, end_date: date, limit: int = 10
+) -> List[DailyAlcoholLike]:
+    """
+    [start_date, end_date) 기간 술별 좋아요 합계 (일간 집계 합산)
+    """
+    like_count = fn.SUM(DailyAlcoholLike.like_count)
+    return list(
+        DailyAlcoholLike.select(
+            DailyAlcoholLike.alcohol_id, like_count.alias("like_count")
+        )
+        .where(
+            DailyAlcoholLike.date >= start_date,
+            DailyAlcoholLike.date < end_date,
+        )
+        .group_by(DailyAlcoholLike.alcohol_id)
+        .having(like_count > 0)
+        .order_by(like_count.desc(), DailyAlcoholLike.alcohol_id)
+        .limit(limit)
+    )
+
+
+def fetch_weekly_combination_like_counts(
+    start_date: date, end_date: date, limit: int = 3
+) -> List[DailyCombinationLike]:
+    """
+    [start_date, end_date) 기간 조합별 좋아요 합계 (일간 집계 합산)
+    """
+    like_count = fn.SUM(DailyCombinationLike.like_count)
+    return list(
+        DailyCombinationLike.select(
+            DailyCombinationLike.combined_ids, like_count.alias("like_count")
+        )
+        .where(
+            DailyCombinationLike.date >= start_date,
+            DailyCombinationLike.date < end_date,
+        )
+        .group_by(DailyCombinationLike.combined_ids)
+        .having(like_count > 0)
+        .order_by(like_count.desc())
+        .limit(limit)
+    )
+
+
+def fetch_alcohol_like_buckets(oldest_date: date) -> List[Tuple[int, date, int]]:
+    """
+    술별 일간 좋아요 수 (alcohol_id, date, like_count) 목록
+    - oldest_date 이전 날짜는 oldest_date 하나로 합쳐서 반환한다
+    """
+    bucket_date = fn.GREATEST(DailyAlcoholLike.date, oldest_date)
+    return list(
+        DailyAlcoholLike.select(
+            DailyAlcoholLike.alcohol_id,
+            bucket_date,
+            fn.SUM(DailyAlcoholLike.like_count),
+        )
+        .group_by(DailyAlcoholLike.alcohol_id, bucket_date)
+        .tuples()
+    )
+
+
+def fetch_combination_like_buckets(
+    oldest_date: date,
+) -> List[Tuple[List[int], date, int]]:
+    """
+    조합별 일간 좋아요 수 (combined_ids, date, like_count) 목록
+    - oldest_date 이전 날짜는 oldest_date 하나로 합쳐서 반환한다
+    """
+    bucket_date = fn.GREATEST(DailyCombinationLike.date, oldest_date)
+    return list(
+        DailyCombinationLike.select(
+            DailyCombinationLike.combined_ids,
+            bucket_date,
+            fn.SUM(DailyCombinationLike.like_count),
+        )
+        .group_by(DailyCombinationLike.combined_ids, bucket_date)
+        .tuples()
+    )
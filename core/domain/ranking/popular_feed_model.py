@@ -0,0 +1,24 @@
+import peewee
+from playhouse.postgres_ext import ArrayField
+
+from core.domain.base_entity import BaseEntity
+from core.domain.feed.feed_model import Feed
+
+
+class PopularFeed(BaseEntity):
+    """
+    인기 조합 피드 (랭킹 배치에서 갱신)
+    - order_by_popular : True면 좋아요 많은 조합, False면 색다른 조합
+    - combination_rank : 조합 순위 (1 ~ 3)
+    - like_count : 배치 이후 좋아요/좋아요 취소 시 증감된다
+    """
+
+    feed = peewee.ForeignKeyField(Feed, backref="popular_feeds")
+    order_by_popular = peewee.BooleanField(default=True)
+    combination_rank = peewee.IntegerField(null=False)
+    pairing_ids = ArrayField(peewee.IntegerField, null=False)
+    like_count = peewee.IntegerField(default=0)
+
+    class Meta:
+        table_name = "popular_feed"
+        indexes = ((("order_by_popular", "combination_rank"), False),)
@@ -0,0 +1,72 @@
+from typing import Iterable, List
+
+from core.config.orm_config import db
+from core.domain.feed.feed_model import Feed
+from core.domain.feed.feed_query_function import (
+    fetch_feeds_order_by_feed_like_and_cominations,
+)
+from core.domain.ranking.popular_feed_model import PopularFeed
+from core.domain.ranking.ranking_query_function import (
+    fetch_like_counts_group_by_combination,
+)
+from core.domain.user.user_model import User
+
+
+def refresh_popular_feeds(order_by_popular: bool = True, size: int = 3) -> int:
+    rows = []
+    for idx, row in enumerate(
+        fetch_like_counts_group_by_combination(
+            order_by_popular=order_by_popular, limit=size
+        )
+    ):
+        for popular_feed in fetch_feeds_order_by_feed_like_and_cominations(
+            combination_ids=row.combined_ids,
+            order_by_popular=order_by_popular,
+            size=size,
+        ):
+            rows.append(
+                {
+                    "feed": popular_feed.feed_id,
+                    "order_by_popular": order_by_popular,
+                    "combination_rank": idx + 1,
+                    "pairing_ids": popular_feed.pairing_ids,
+                    "like_count": popular_feed.like_count,
+                }
+            )
+
+    with db.atomic():
+        PopularFeed.delete().where(
+            PopularFeed.order_by_popular == order_by_popular
+        ).execute()
+        if rows:
+            PopularFeed.insert_many(rows).execute()
+    return len(rows)
+
+
+def fetch_popular_feeds(
+    order_by_popular: bool = True, blocked_user_ids: Iterable[int] = ()
+) -> List[PopularFeed]:
+    return (
+        PopularFeed.select(PopularFeed, Feed, User)
+        .join(Feed, on=(PopularFeed.feed == Feed.id))
+        .join(User, on=(Feed.user == User.id))
+        .where(
+            PopularFeed.order_by_popular == order_by_popular,
+            Feed.is_deleted == False,
+            Feed.user.not_in(blocked_user_ids),
+        )
+        .order_by(
+            PopularFeed.combination_rank,
+            PopularFeed.like_count.desc()
+            if order_by_popular
+            else PopularFeed.like_count.asc(),
+        )
+    )
+
+
+def add_popular_feed_like_count(feed_id: int, amount: int):
+    (
+        PopularFeed.update(like_count=PopularFeed.like_count + amount)
+        .where(PopularFeed.feed == feed_id)
+        .execute()
+    )
@@ -1,16 +1,31 @@
 from datetime import datetime
+from typing import Optional
 
 from peewee import fn, SQL
 
 from core.domain.feed.feed_model import Feed
 from core.domain.feed.feed_like_model import FeedLike
+from core.domain.ranking.ranking_model import Ranking
+
+
+def filter_feed_created_between(
+    query, start_date: Optional[datetime], end_date: Optional[datetime]
+):
+    """
+    피드 작성일 조건 추가 (None이면 해당 방향으로 제한 없음)
+    """
+    if start_date is not None:
+        query = query.where(Feed.created_at >= start_date)
+    if end_date is not None:
+        query = query.where(Feed.created_at <= end_date)
+    return query
 
 
 def fetch_like_counts_group_by_combination(
     order_by_popular: bool = True,
     limit: int = 3,
-    start_date=datetime.now(),
-    end_date=datetime.now(),
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
     execute=True,
 ):
     query = (
@@ -20,19 +35,19 @@ def fetch_like_counts_group_by_combination(
             ),
             fn.COUNT(FeedLike.id).alias("like_count"),
         )
-        .where(Feed.created_at >= start_date and Feed.created_at <= end_date)
         .join(FeedLike, on=(Feed.id == FeedLike.feed_id))
         .group_by(SQL("combined_ids"))
         .order_by(SQL("like_count").desc() if order_by_popular else fn.RANDOM())
         .limit(limit)
     )
+    query = filter_feed_created_between(query, start_date, end_date)
     return query.execute() if execute else query
 
 
 def fetch_like_counts_group_by_alcohol(
     limit: int = 10,
-    start_date=datetime.now(),
-    end_date=datetime.now(),
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
     execute=True,
 ):
     query = (
@@ -51,4 +66,9 @@ def fetch_like_counts_group_by_alcohol(
         # .where(Feed.created_at.between(lo=start, hi=end))
         # .group_by(fn.unnest(Feed.alcohol_pairing_ids).alias("tag"))
     )
+    query = filter_feed_created_between(query, start_date, end_date)
     return query.execute() if execute else query
+
+
+def fetch_latest_ranking_id() -> Optional[int]:
+    return Ranking.select(fn.MAX(Ranking.id)).scalar()
@@ -7,6 +7,11 @@ from core.domain.base_entity import BaseEntity
 
 
 class SearchVolume(BaseEntity):
+    """
+    키워드별 검색량 (search-volume 배치에서 저장)
+    - 같은 기간의 키워드 검색량은 하나만 저장한다 (name, start_date, end_date unique)
+    """
+
     name = CharField(max_length=100, null=False)
     volume = IntegerField(default=0, null=False)
     start_date = DateTimeField(default=datetime.now(KST).strftime("%Y-%m-%d"))
@@ -14,3 +19,4 @@ class SearchVolume(BaseEntity):
 
     class Meta:
         table_name = "search_volume"
+        indexes = ((("name", "start_date", "end_date"), True),)
@@ -0,0 +1,34 @@
+from datetime import datetime
+from typing import List
+
+from peewee import chunked
+
+from core.config.orm_config import db
+from core.domain.ranking.search_volume_model import SearchVolume
+
+
+def upsert_search_volumes(rows: List[dict], chunk_size: int = 500) -> int:
+    """
+    검색량 일괄 저장 (INSERT ... ON CONFLICT (name, start_date, end_date) DO UPDATE)
+    - chunk_size 개씩 한번에 insert 하고, 같은 기간 키워드가 이미 있으면 검색량만 갱신한다
+    - 같은 배치를 다시 실행해도 결과가 같다
+    """
+    with db.atomic():
+        for chunk in chunked(rows, chunk_size):
+            (
+                SearchVolume.insert_many(chunk)
+                .on_conflict(
+                    conflict_target=[
+                        SearchVolume.name,
+                        SearchVolume.start_date,
+                        SearchVolume.end_date,
+                    ],
+                    preserve=[SearchVolume.volume],
+                    update={
+                        SearchVolume.updated_at: datetime.now(),
+                        SearchVolume.is_deleted: False,
+                    },
+                )
+                .execute()
+            )
+    return len(rows)
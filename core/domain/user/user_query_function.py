@@ -1,14 +1,25 @@
-from typing import List
-
-from psycopg2._psycopg import Int
+from typing import Iterable, Set
 
 from core.domain.user.user_block_model import UserBlock
+from core.domain.user.user_model import User
+
+
+def get_blocked_user_ids(login_user_id: int) -> Set[int]:
+    return {
+        blocked_user_id
+        for (blocked_user_id,) in UserBlock.select(UserBlock.blocked_user)
+        .where(UserBlock.user == login_user_id, UserBlock.is_deleted == False)
+        .tuples()
+    }
 
 
-def get_blocked_user_ids(login_user_id: int) -> List[Int]:
-    return [
-        user_block.blocked_user
-        for user_block in UserBlock.select().where(
-            UserBlock.user == login_user_id, UserBlock.is_deleted == False
-        )
-    ]
+def remove_push_tokens(push_tokens: Iterable[str]) -> int:
+    """
+    더 이상 유효하지 않은 푸시 토큰 삭제 (APNs에서 BadDeviceToken, Unregistered 응답을 받은 경우)
+    """
+    push_tokens = list(push_tokens)
+    if not push_tokens:
+        return 0
+    return (
+        User.update(push_token=None).where(User.push_token.in_(push_tokens)).execute()
+    )
@@ -7,6 +7,7 @@ from api.config.exceptions import BadRequestException
 from core.domain.feed.feed_model import Feed
 from core.dto.user_dto import UserSimpleInfoResponse
 from core.util.cache import pairing_cache_store
+from core.util.search_util import find_highlights, split_words
 
 
 class PairingDto(BaseModel):
@@ -190,6 +191,7 @@ class RandomFeedDto(BaseModel):
     title: str
     content: str
     represent_image: str
+    thumbnail_image: str
     user_id: int
     user_nickname: str
     user_image: Optional[str]
@@ -231,6 +233,25 @@ class PopularFeedDto(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    @classmethod
+    def of(cls, popular_feed):
+        feed: Feed = popular_feed.feed
+        return PopularFeedDto(
+            feed_id=feed.id,
+            title=feed.title,
+            content=feed.content,
+            represent_image=feed.represent_image,
+            pairing_ids=popular_feed.pairing_ids,
+            images=feed.images,
+            like_count=popular_feed.like_count,
+            score=feed.score,
+            user_id=feed.user.id,
+            user_nickname=feed.user.nickname,
+            user_image=feed.user.image,
+            created_at=feed.created_at,
+            updated_at=feed.updated_at,
+        )
+
 
 class PopularFeedListDto(BaseModel):
     title: str
@@ -241,6 +262,7 @@ class FeedByPreferenceResponse(BaseModel):
     feed_id: int
     title: str
     represent_image: str
+    thumbnail_image: str
     score: float
     alcohols: List[str]
     foods: List[str]
@@ -253,7 +275,7 @@ class FeedByPreferenceResponse(BaseModel):
             feed_id=feed.id,
             alcohols=from_cache(feed.alcohol_pairing_ids),
             foods=from_cache(feed.food_pairing_ids),
-            **feed.__data__,
+            **(feed.__data__ | {"thumbnail_image": feed.get_thumbnail_image()}),
             writer_nickname=feed.user.nickname,
         )
 
@@ -261,22 +283,13 @@ class FeedByPreferenceResponse(BaseModel):
 class FeedByPreferenceListResponse(BaseModel):
     feeds: List[FeedByPreferenceResponse] = []
 
-    @classmethod
-    def of(cls, feeds: List[Feed]):
-        return FeedByPreferenceListResponse(
-            feeds=sorted(
-                [FeedByPreferenceResponse.of(feed) for feed in feeds],
-                key=lambda x: x.score,
-                reverse=True,
-            ),
-        )
-
 
 class FeedByAlcoholResponse(BaseModel):
     subtype: str
     feed_id: int
     title: str
     represent_image: str
+    thumbnail_image: str
     foods: List[str]
     score: float
     writer_nickname: str
@@ -287,7 +300,7 @@ class FeedByAlcoholResponse(BaseModel):
             subtype=subtype,
             feed_id=feed.id,
             foods=foods,
-            **feed.__data__,
+            **(feed.__data__ | {"thumbnail_image": feed.get_thumbnail_image()}),
             writer_nickname=feed.user.nickname,
         )
 
@@ -310,37 +323,68 @@ class FeedLikeResponse(BaseModel):
         return FeedLikeResponse(feed_id=feed_id, is_liked=is_liked)
 
 
+class FeedSearchHighlightDto(BaseModel):
+    field: str  # title, content
+    start: int
+    end: int
+
+
 class FeedSearchResponse(BaseModel):
     feed_id: int
     represent_image: str
     title: str
     content: str
     tags: List[str]
+    highlights: List[FeedSearchHighlightDto] = []
 
     @classmethod
-    def of(cls, feed: Feed, tags: List[str]):
+    def of(cls, feed: Feed, tags: List[str], words: Optional[List[str]] = None):
+        highlights = [
+            FeedSearchHighlightDto(field=field, start=start, end=end)
+            for field, text in (("title", feed.title), ("content", feed.content))
+            for start, end in find_highlights(text, words or [])
+        ]
         return FeedSearchResponse(
             feed_id=feed.id,
             represent_image=feed.represent_image,
             title=feed.title,
             content=feed.content,
             tags=tags,
+            highlights=highlights,
         )
 
 
 class FeedSearchListResponse(BaseModel):
     results: List[FeedSearchResponse]
+    next_cursor: Optional[str] = None
+    is_last: bool = True
 
     @classmethod
-    def of(cls, feeds: List[Feed]):
+    def of(cls, feeds: List[Feed], keyword: str, size: int):
+        words = split_words(keyword)
         results = []
         for feed in feeds:
             alcohols = pairing_cache_store.get_all_names_by_ids(
                 feed.alcohol_pairing_ids
             )
             foods = pairing_cache_store.get_all_names_by_ids(feed.food_pairing_ids)
-            results.append(FeedSearchResponse.of(feed, alcohols + foods))
-        return FeedSearchListResponse(results=results)
+            results.append(FeedSearchResponse.of(feed, alcohols + foods, words))
+        return FeedSearchListResponse(
+            results=results,
+            next_cursor=f"{feeds[-1].relevance}:{feeds[-1].id}"
+            if len(feeds) > 0
+            else None,
+            is_last=len(feeds) < size,
+        )
+
+
+class FeedAutocompleteResponse(BaseModel):
+    keyword: str
+    type: str  # pairing, tag
+
+
+class FeedAutocompleteListResponse(BaseModel):
+    results: List[FeedAutocompleteResponse] = []
 
 
 class FeedAdminResponse(BaseModel):
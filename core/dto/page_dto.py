@@ -3,7 +3,6 @@ from typing import Optional, List
 from pydantic import BaseModel
 
 from core.config.var_config import DEFAULT_PAGE_SIZE
-from core.domain.feed.feed_model import Feed
 from core.dto.feed_dto import FeedResponse, RelatedFeedResponse
 
 
@@ -14,12 +13,14 @@ class CursorPageResponse(BaseModel):
     content: Optional[list]
 
     @staticmethod
-    def of_feeds(feeds: List[Feed]):
+    def of_feeds(feeds_response: List[FeedResponse], size: int = DEFAULT_PAGE_SIZE):
         return CursorPageResponse(
-            content=[FeedResponse.from_orm(feed).model_dump() for feed in feeds],
-            next_cursor_id=feeds[-1].id if len(feeds) > 0 else None,
-            size=DEFAULT_PAGE_SIZE,
-            is_last=len(feeds) < DEFAULT_PAGE_SIZE,
+            content=[feed_response.model_dump() for feed_response in feeds_response],
+            next_cursor_id=feeds_response[-1].feed_id
+            if len(feeds_response) > 0
+            else None,
+            size=size,
+            is_last=len(feeds_response) < size,
         )
 
     @staticmethod
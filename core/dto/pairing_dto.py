@@ -60,6 +60,16 @@ class PairingListResponse(BaseDTO):
     pairings: List[PairingResponse]
 
 
+class PairingRecommendResponse(BaseDTO):
+    pairing: PairingResponse
+    score: float
+
+
+class PairingRecommendationListResponse(BaseDTO):
+    pairing: PairingResponse
+    recommendations: List[PairingRecommendResponse]
+
+
 class PairingSearchType(str, Enum):
     전체 = "전체"
     술 = "술"
@@ -1,6 +1,7 @@
 from typing import List, Optional
 from pydantic import BaseModel
 
+from core.domain.ranking.ranking_model import Ranking
 from core.dto.pairing_dto import PairingResponse
 from core.util.time import get_start_of_week_and_end_of_week
 
@@ -9,6 +10,7 @@ class CombinationRankResponse(BaseModel):
     rank: int = 1
     pairings: List[PairingResponse] = []
     description: Optional[str] = None
+    score: Optional[float] = None
 
 
 class CombinationRankingResponse(BaseModel):
@@ -16,14 +18,56 @@ class CombinationRankingResponse(BaseModel):
     end_date: str = get_start_of_week_and_end_of_week()[1].strftime("%m/%d")
     ranking: List[CombinationRankResponse] = []
 
+    @classmethod
+    def of(cls, ranking: Ranking):
+        return CombinationRankingResponse(
+            start_date=ranking.start_date.strftime("%Y-%m-%d"),
+            end_date=ranking.end_date.strftime("%Y-%m-%d"),
+            ranking=[
+                CombinationRankResponse(
+                    rank=rank,
+                    pairings=[PairingResponse(**comb) for comb in combination],
+                )
+                for rank, combination in ranking.ranking["combination"].items()
+            ],
+        )
+
 
 class AlcoholRankResponse(BaseModel):
     rank: int = 1
     alcohol: PairingResponse
     description: Optional[str] = None
+    score: Optional[float] = None
 
 
 class AlcoholRankingResponse(BaseModel):
     start_date: str = get_start_of_week_and_end_of_week()[0].strftime("%m/%d")
     end_date: str = get_start_of_week_and_end_of_week()[1].strftime("%m/%d")
     ranking: List[AlcoholRankResponse] = []
+
+    @classmethod
+    def of(cls, ranking: Ranking):
+        return AlcoholRankingResponse(
+            start_date=ranking.start_date.strftime("%Y-%m-%d"),
+            end_date=ranking.end_date.strftime("%Y-%m-%d"),
+            ranking=[
+                AlcoholRankResponse(
+                    rank=rank,
+                    alcohol=PairingResponse(**alcohol),
+                    description=None,
+                )
+                for rank, alcohol in ranking.ranking["alcohol"].items()
+            ],
+        )
+
+
+class CombinationWindowRankingResponse(BaseModel):
+    window: str
+    updated_at: Optional[str] = None
+    ranking: List[CombinationRankResponse] = []
+
+
+class AlcoholWindowRankingResponse(BaseModel):
+    window: str
+    updated_at: Optional[str] = None
+    ranking: List[AlcoholRankResponse] = []
@@ -0,0 +1,114 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from core.config.orm_config import db, run_in_new_db_state
+from core.domain.notification.notification_query_function import save_notifications
+from core.domain.outbox.outbox_event_model import OutboxEvent
+from core.domain.outbox.outbox_event_query_function import (
+    claim_outbox_events,
+    complete_outbox_events,
+    fail_outbox_events,
+)
+from core.event.events import CommentEvents
+from core.event.push_event_handler import handle_create_comment_events
+from core.util.logger import logger
+
+# 이벤트 타입별 핸들러 : 이벤트 목록을 받아서 저장할 알림 row 목록을 반환
+OutboxEventHandler = Callable[[List[OutboxEvent]], Awaitable[List[dict]]]
+
+
+class OutboxDispatcher:
+    """
+    아웃박스 이벤트 처리기
+    - poll_interval 마다 처리할 이벤트를 batch_size 만큼 선점(claim_outbox_events)해서 타입별 핸들러로 넘긴다
+    - 핸들러가 반환한 알림은 이벤트 완료 처리와 같은 트랜잭션에서 한번에 저장한다
+    - 핸들러 실패 시 backoff 후 재시도하고, max_attempts 번 실패하면 FAILED로 남긴다
+    - 푸시 전송 후 완료 처리 전에 프로세스가 죽으면 푸시가 중복 전송될 수 있다 (at-least-once)
+    """
+
+    def __init__(
+        self,
+        handlers: Dict[str, OutboxEventHandler],
+        batch_size: int = 100,
+        poll_interval: float = 1.0,
+        lease_seconds: int = 60,
+        max_attempts: int = 5,
+        backoff_seconds: int = 10,
+    ):
+        self.handlers = handlers
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                processed_count = await self.dispatch_once()
+            except Exception as e:
+                logger.error(f"failed to dispatch outbox events :: {e}")
+                processed_count = 0
+            if processed_count < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
+
+    async def dispatch_once(self) -> int:
+        events = await run_in_new_db_state(
+            claim_outbox_events, self.batch_size, self.lease_seconds
+        )
+        events_by_type: Dict[str, List[OutboxEvent]] = {}
+        for event in events:
+            events_by_type.setdefault(event.event_type, []).append(event)
+
+        await asyncio.gather(
+            *[
+                self._handle(event_type, typed_events)
+                for event_type, typed_events in events_by_type.items()
+            ]
+        )
+        return len(events)
+
+    async def _handle(self, event_type: str, events: List[OutboxEvent]):
+        handler = self.handlers.get(event_type)
+        try:
+            if handler is None:
+                raise ValueError(f"no handler for outbox event type {event_type}")
+            notifications = await handler(events)
+            await run_in_new_db_state(
+                self._complete, [event.id for event in events], notifications
+            )
+        except Exception as e:
+            logger.error(f"failed to handle outbox events({event_type}) :: {e}")
+            await run_in_new_db_state(
+                fail_outbox_events,
+                events,
+                repr(e),
+                self.max_attempts,
+                self.backoff_seconds,
+            )
+
+    @staticmethod
+    def _complete(event_ids: List[int], notifications: List[dict]):
+        with db.atomic():
+            save_notifications(notifications)
+            complete_outbox_events(event_ids)
+
+
+outbox_dispatcher = OutboxDispatcher(
+    handlers={CommentEvents.CREATE_COMMENT.value: handle_create_comment_events}
+)
@@ -1,15 +1,92 @@
-from fastapi_events.handlers.local import local_handler
-from fastapi_events.typing import Event
+from typing import List, Tuple
 
-from core.client.apns_client import push_client
-from core.event.events import CommentEvents
+from core.client.apns_client import push_client, PushRequest, DeviceType
+from core.config.orm_config import run_in_new_db_state
+from core.domain.comment.comment_model import Comment
+from core.domain.outbox.outbox_event_model import OutboxEvent
+from core.domain.user.user_model import User
+from core.event.events import CreateCommentPayload
 
+COMMENT_NOTIFICATION_TITLE = "새 댓글 알림"
+DEVICE_TYPES = {device_type.value for device_type in DeviceType}
 
-@local_handler.register(event_name=CommentEvents.CREATE_COMMENT)
-async def handle_create_comment_send_push_handler(
-    event: Event,
-):
-    print("야-호! 이벤트 핸들링 성공-!")
-    print(push_client)
-    event_name, payload = event
-    print(f"event_name: {event_name} handled")
+
+def build_comment_notifications(
+    payloads: List[CreateCommentPayload],
+) -> Tuple[List[dict], List[PushRequest]]:
+    """
+    댓글 작성 이벤트로 알림(Notification) row와 푸시 요청 생성
+    - 알림 대상 : 피드 작성자, 부모 댓글 작성자 (본인이 작성한 댓글은 제외)
+    """
+    comments = {
+        comment.id: comment
+        for comment in Comment.select().where(
+            Comment.id.in_([payload.comment_id for payload in payloads])
+        )
+    }
+    user_ids = set()
+    for payload in payloads:
+        user_ids.update(
+            (
+                payload.feed_owner_user_id,
+                payload.parent_comment_writer_user_id,
+                payload.comment_writer_user_id,
+            )
+        )
+    users = {
+        user.id: user
+        for user in User.select().where(
+            User.id.in_([user_id for user_id in user_ids if user_id is not None])
+        )
+    }
+
+    notifications, push_requests = [], []
+    for payload in payloads:
+        comment = comments.get(payload.comment_id)
+        writer = users.get(payload.comment_writer_user_id)
+        if comment is None or comment.is_deleted or writer is None:
+            continue
+
+        content = f"{writer.nickname}님이 댓글을 남겼어요 : {comment.content[:50]}"
+        receiver_ids = {
+            payload.feed_owner_user_id,
+            payload.parent_comment_writer_user_id,
+        } - {None, writer.id}
+        for receiver_id in receiver_ids:
+            receiver = users.get(receiver_id)
+            if receiver is None or receiver.is_deleted:
+                continue
+            notifications.append(
+                {
+                    "send_user": writer.id,
+                    "receive_user": receiver.id,
+                    "title": COMMENT_NOTIFICATION_TITLE,
+                    "content": content[:500],
+                }
+            )
+            if receiver.push_token and receiver.device_type in DEVICE_TYPES:
+                push_requests.append(
+                    PushRequest(
+                        device_token=receiver.push_token,
+                        device_type=DeviceType(receiver.device_type),
+                        title=COMMENT_NOTIFICATION_TITLE,
+                        content=content,
+                        is_sendable=True,
+                        target_type="feed",
+                        target_id=comment.feed_id,
+                    )
+                )
+    return notifications, push_requests
+
+
+async def handle_create_comment_events(events: List[OutboxEvent]) -> List[dict]:
+    """
+    댓글 작성 이벤트 처리 : 푸시 전송 후 저장할 알림 row 반환 (알림 저장은 OutboxDispatcher가 이벤트 완료 처리와 함께 한다)
+    """
+    payloads = [CreateCommentPayload(**event.payload) for event in events]
+    notifications, push_requests = await run_in_new_db_state(
+        build_comment_notifications, payloads
+    )
+    if push_requests:
+        await push_client.send_push_batch(push_requests)
+    return notifications
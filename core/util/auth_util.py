@@ -3,9 +3,10 @@ from typing import Optional
 from fastapi.security import HTTPBearer
 from starlette.requests import Request
 
-from api.config.exceptions import UnauthorizedException
+from api.config.exceptions import UnauthorizedException, NotFoundException
 from core.domain.user.user_model import User
-from core.util.jwt import decode_token
+from core.util.cache import user_cache_store
+from core.util.jwt import token_cache_store
 
 
 def get_login_user_id(request: Request) -> int:
@@ -20,7 +21,25 @@ def get_login_user_id(request: Request) -> int:
 
 
 def get_login_user_or_none(request: Request) -> Optional[User]:
-    return User.get_or_none(get_login_user_id(request))
+    """
+    로그인 유저 조회
+    - 한 요청 안에서는 request.state.login_user 로 최대 1번만 조회한다
+    - 요청 간에는 user_cache_store 에 잠깐 캐싱된다 (조회한 유저를 수정할 때는 DB에서 다시 조회할 것)
+    """
+    if not hasattr(request.state, "login_user"):
+        request.state.login_user = user_cache_store.get_or_none(
+            get_login_user_id(request)
+        )
+    return request.state.login_user
+
+
+def get_login_user_or_raise(request: Request) -> User:
+    login_user = get_login_user_or_none(request)
+    if login_user is None or login_user.is_deleted is True:
+        raise NotFoundException(
+            target_entity=User, target_id=get_login_user_id(request)
+        )
+    return login_user
 
 
 class AuthRequired(HTTPBearer):
@@ -39,7 +58,7 @@ class AuthRequired(HTTPBearer):
             raise UnauthorizedException("Invalid token type")
 
         try:
-            request.state.token_info = decode_token(token)
+            request.state.token_info = token_cache_store.decode(token)
         except Exception as e:
             raise UnauthorizedException("Invalid token")
 
@@ -52,7 +71,7 @@ class AuthOptional(HTTPBearer):
         try:
             auth_header = request.headers.get("Authorization")
             token_type, token = auth_header.split(" ")
-            request.state.token_info = decode_token(token)
+            request.state.token_info = token_cache_store.decode(token)
         except Exception as e:
             request.state.token_info = None
             pass
@@ -0,0 +1,141 @@
+from bisect import bisect_left, insort
+from enum import Enum
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+from core.domain.feed.feed_query_function import fetch_user_tag_counts
+from core.util.cache import pairing_cache_store
+from core.util.logger import logger
+
+
+class AutocompleteType(str, Enum):
+    PAIRING = "pairing"
+    TAG = "tag"
+
+
+class AutocompleteEntry(BaseModel):
+    keyword: str  # 화면에 보여줄 키워드 (ex. 참이슬 후레쉬, #소맥)
+    type: AutocompleteType
+    weight: int = 0  # 태그 사용 횟수
+
+
+def normalize_keyword(keyword: str) -> str:
+    return keyword.replace(" ", "").replace("#", "").lower()
+
+
+class KeywordAutocompleteStore:
+    """
+    피드 검색 자동완성용 prefix 인덱스
+    - 술/안주 이름과 자주 쓰이는 유저 태그를 정규화한 키로 정렬해두고 bisect로 prefix 범위를 찾는다
+    - 최초 조회 시 빌드하고, 이후에는 술/안주 추가/삭제, 피드 태그 추가/삭제 시 점진적으로 갱신한다
+    """
+
+    def __init__(self, tag_limit: int = 1000, max_scan_size: int = 200):
+        self.tag_limit = tag_limit
+        self.max_scan_size = max_scan_size
+        self._keys: List[str] = []
+        self._entries: Dict[str, AutocompleteEntry] = {}
+        self._is_built = False
+
+    def build(self):
+        entries = {}
+        for tag, tag_count in fetch_user_tag_counts(self.tag_limit):
+            key = normalize_keyword(tag)
+            if key:
+                entries[key] = AutocompleteEntry(
+                    keyword=tag, type=AutocompleteType.TAG, weight=tag_count
+                )
+        for pairing in pairing_cache_store.get_all():
+            for key in self._pairing_keys(pairing.name):
+                entries[key] = AutocompleteEntry(
+                    keyword=pairing.name, type=AutocompleteType.PAIRING
+                )
+
+        self._entries = entries
+        self._keys = sorted(entries.keys())
+        self._is_built = True
+        logger.info(f"build keyword autocomplete index. size = {len(self._keys)}")
+
+    def search(self, prefix: str, size: int = 10) -> List[AutocompleteEntry]:
+        if not self._is_built:
+            self.build()
+
+        prefix = normalize_keyword(prefix)
+        if not prefix:
+            return []
+
+        candidates = {}
+        start = bisect_left(self._keys, prefix)
+        for key in self._keys[start : start + self.max_scan_size]:
+            if not key.startswith(prefix):
+                break
+            entry = self._entries[key]
+            candidates[(entry.type, entry.keyword)] = entry
+
+        return sorted(
+            candidates.values(),
+            key=lambda entry: (
+                entry.type != AutocompleteType.PAIRING,
+                -entry.weight,
+                len(entry.keyword),
+            ),
+        )[:size]
+
+    def add_pairing(self, name: str):
+        for key in self._pairing_keys(name):
+            self._put(
+                key, AutocompleteEntry(keyword=name, type=AutocompleteType.PAIRING)
+            )
+
+    def remove_pairing(self, name: str):
+        for key in self._pairing_keys(name):
+            entry = self._entries.get(key)
+            if entry is not None and entry.type == AutocompleteType.PAIRING:
+                self._remove(key)
+
+    def add_tags(self, tags: Optional[List[str]]):
+        for tag in tags or []:
+            key = normalize_keyword(tag)
+            if not key:
+                continue
+            entry = self._entries.get(key)
+            if entry is None:
+                self._put(
+                    key, AutocompleteEntry(keyword=tag, type=AutocompleteType.TAG)
+                )
+                entry = self._entries[key]
+            entry.weight += 1
+
+    def remove_tags(self, tags: Optional[List[str]]):
+        """
+        피드 수정/삭제로 빠진 태그의 사용 횟수를 줄이고, 더 이상 쓰이지 않는 태그는 지운다
+        """
+        for tag in tags or []:
+            key = normalize_keyword(tag)
+            entry = self._entries.get(key)
+            if entry is None:
+                continue
+            entry.weight = max(entry.weight - 1, 0)
+            if entry.type == AutocompleteType.TAG and entry.weight == 0:
+                self._remove(key)
+
+    def _put(self, key: str, entry: AutocompleteEntry):
+        if key not in self._entries:
+            insort(self._keys, key)
+        self._entries[key] = entry
+
+    def _remove(self, key: str):
+        index = bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            del self._keys[index]
+        self._entries.pop(key, None)
+
+    @staticmethod
+    def _pairing_keys(name: str) -> List[str]:
+        # "참이슬/처음처럼" 처럼 여러 이름이 묶인 경우 각각의 이름으로도 찾을 수 있게 한다
+        names = [name] + (name.split("/") if "/" in name else [])
+        return [key for key in map(normalize_keyword, names) if key]
+
+
+keyword_autocomplete_store = KeywordAutocompleteStore()
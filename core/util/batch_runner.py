@@ -0,0 +1,154 @@
+import argparse
+import json
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, List, Optional, Tuple
+
+from core.config.orm_config import db
+from core.util.logger import logger
+
+DATE_FORMAT = "%Y-%m-%d"
+
+
+class StageResult:
+    def __init__(self, name: str):
+        self.name = name
+        self.rows = 0
+        self.seconds = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "stage": self.name,
+            "rows": self.rows,
+            "ms": round(self.seconds * 1000, 1),
+        }
+
+
+class BatchContext:
+    """
+    배치 실행 정보 (기간, dry run 여부) + 단계별 실행 시간, row 수 기록
+
+    with context.stage("query") as stage:
+        rows = ...
+        stage.rows = len(rows)
+    """
+
+    def __init__(
+        self, name: str, start_date: datetime, end_date: datetime, dry_run: bool
+    ):
+        self.name = name
+        self.start_date = start_date
+        self.end_date = end_date
+        self.dry_run = dry_run
+        self.stages: List[StageResult] = []
+
+    @contextmanager
+    def stage(self, name: str):
+        result = StageResult(name)
+        started_at = time.perf_counter()
+        try:
+            yield result
+        finally:
+            result.seconds = time.perf_counter() - started_at
+            self.stages.append(result)
+            logger.info(f"[{self.name} Batch] - {json.dumps(result.to_dict())}")
+
+    def report(self) -> dict:
+        return {
+            "batch": self.name,
+            "start_date": self.start_date.strftime(DATE_FORMAT),
+            "end_date": self.end_date.strftime(DATE_FORMAT),
+            "dry_run": self.dry_run,
+            "total_ms": round(sum(stage.seconds for stage in self.stages) * 1000, 1),
+            "stages": [stage.to_dict() for stage in self.stages],
+        }
+
+
+BatchJob = Callable[[BatchContext], None]
+DateWindow = Callable[[], Tuple[datetime, datetime]]
+
+
+def run_batch(
+    name: str,
+    job: BatchJob,
+    start_date: datetime,
+    end_date: datetime,
+    dry_run: bool = False,
+) -> dict:
+    """
+    배치 실행 후 리포트(단계별 실행 시간, row 수) 반환
+    - 커넥션 하나로 실행한다
+    - dry_run 이면 전체를 트랜잭션 하나로 실행하고 마지막에 롤백한다 (쓰기 시간까지 측정 가능)
+    """
+    context = BatchContext(name, start_date, end_date, dry_run)
+    db.connect(reuse_if_open=True)
+    try:
+        if dry_run:
+            with db.atomic() as txn:
+                job(context)
+                txn.rollback()
+        else:
+            job(context)
+    finally:
+        db.close()
+
+    report = context.report()
+    logger.info(f"[{name} Batch] - report = {json.dumps(report)}")
+    return report
+
+
+def parse_date(value: str) -> datetime:
+    return datetime.strptime(value, DATE_FORMAT)
+
+
+def main(
+    name: str, job: BatchJob, default_window: DateWindow, argv: Optional[list] = None
+) -> dict:
+    """
+    로컬 실행용 CLI
+    python batch/<배치>/lambda_function.py [--dry-run] [--start-date YYYY-MM-DD] [--end-date YYYY-MM-DD]
+    """
+    default_start_date, default_end_date = default_window()
+    parser = argparse.ArgumentParser(description=f"{name} batch")
+    parser.add_argument(
+        "--dry-run", action="store_true", help="run and rollback all writes"
+    )
+    parser.add_argument(
+        "--start-date",
+        type=parse_date,
+        default=default_start_date,
+        help=f"YYYY-MM-DD (default: {default_start_date.strftime(DATE_FORMAT)})",
+    )
+    parser.add_argument(
+        "--end-date",
+        type=parse_date,
+        default=default_end_date,
+        help=f"YYYY-MM-DD (default: {default_end_date.strftime(DATE_FORMAT)})",
+    )
+    args = parser.parse_args(argv)
+    return run_batch(name, job, args.start_date, args.end_date, args.dry_run)
+
+
+def build_lambda_handler(name: str, job: BatchJob, default_window: DateWindow):
+    """
+    Lambda 핸들러 생성
+    - event로 dry_run, start_date, end_date(YYYY-MM-DD)를 넘길 수 있다
+    """
+
+    def lambda_handler(event, context):
+        event = event or {}
+        default_start_date, default_end_date = default_window()
+        return run_batch(
+            name,
+            job,
+            start_date=parse_date(event["start_date"])
+            if "start_date" in event
+            else default_start_date,
+            end_date=parse_date(event["end_date"])
+            if "end_date" in event
+            else default_end_date,
+            dry_run=bool(event.get("dry_run", False)),
+        )
+
+    return lambda_handler
@@ -1,7 +1,18 @@
-from typing import Optional, List
+import hashlib
+from datetime import timezone
+from email.utils import format_datetime
+from typing import Optional, List, FrozenSet, Dict, NamedTuple
+
+from cachetools import TTLCache
 
 from core.config.orm_config import db
+from core.config.var_config import RANKING_CACHE_MAX_AGE
 from core.domain.pairing.pairing_model import Pairing
+from core.domain.ranking.ranking_model import Ranking
+from core.domain.ranking.ranking_query_function import fetch_latest_ranking_id
+from core.domain.user.user_model import User
+from core.domain.user.user_query_function import get_blocked_user_ids
+from core.dto.ranking_dto import AlcoholRankingResponse, CombinationRankingResponse
 from core.util.logger import logger
 
 
@@ -17,12 +28,24 @@ class PairingCacheStore:
         db.close()
         logger.info(f"load all pairing cache = {self._pairing_cache}")
 
+    def get_all(self) -> List[Pairing]:
+        return list(self._pairing_cache.values())
+
+    def put(self, pairing: Pairing):
+        if pairing.is_deleted:
+            self._pairing_cache.pop(pairing.id, None)
+        else:
+            self._pairing_cache[pairing.id] = pairing
+
     def get_all_names_by_ids(self, pairing_ids: List[int]) -> List[str]:
         return [self._pairing_cache[pairing_id].name for pairing_id in pairing_ids]
 
     def get_by_id(self, pairing_id: int) -> Optional[Pairing]:
         return self._pairing_cache[pairing_id]
 
+    def get_or_none(self, pairing_id: int) -> Optional[Pairing]:
+        return self._pairing_cache.get(pairing_id)
+
     def get_all_by_type(self, pairing_type: str) -> List[Pairing]:
         return [
             pairing
@@ -39,3 +62,109 @@ class PairingCacheStore:
 
 
 pairing_cache_store = PairingCacheStore()
+
+
+class UserBlockCacheStore:
+    """
+    로그인 유저별 차단한 유저 id 캐시
+    - 피드 목록 조회마다 user_block 테이블을 조회하지 않기 위함
+    - 차단/차단해제 시 evict()로 무효화하고, 다른 워커 프로세스를 위해 TTL도 둔다
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: int = 60 * 10):
+        self._blocked_user_ids_cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def get_blocked_user_ids(self, login_user_id: Optional[int]) -> FrozenSet[int]:
+        if login_user_id is None or login_user_id < 0:  # 비로그인 유저
+            return frozenset()
+
+        blocked_user_ids = self._blocked_user_ids_cache.get(login_user_id)
+        if blocked_user_ids is None:
+            blocked_user_ids = frozenset(get_blocked_user_ids(login_user_id))
+            self._blocked_user_ids_cache[login_user_id] = blocked_user_ids
+        return blocked_user_ids
+
+    def evict(self, login_user_id: int):
+        self._blocked_user_ids_cache.pop(login_user_id, None)
+
+
+user_block_cache_store = UserBlockCacheStore()
+
+
+class UserCacheStore:
+    """
+    유저 id별 User 캐시
+    - 로그인 유저 조회를 요청마다 DB에서 하지 않기 위함 (auth_util.get_login_user_or_none)
+    - 유저 정보 수정 시 evict()로 무효화하고, 다른 워커 프로세스를 위해 TTL은 짧게 둔다
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: int = 30):
+        self._user_cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def get_or_none(self, user_id: Optional[int]) -> Optional[User]:
+        if user_id is None or user_id < 0:  # 비로그인 유저
+            return None
+
+        user = self._user_cache.get(user_id)
+        if user is None:
+            user = User.get_or_none(User.id == user_id)
+            if user is not None:
+                self._user_cache[user_id] = user
+        return user
+
+    def evict(self, user_id: int):
+        self._user_cache.pop(user_id, None)
+
+
+user_cache_store = UserCacheStore()
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    etag: str
+    last_modified: str
+
+
+class RankingResponseCacheStore:
+    """
+    주간 랭킹 응답 캐시 (종류별로 직렬화된 응답 body, ETag, Last-Modified 저장)
+    - 랭킹은 배치(별도 프로세스)에서 저장하므로 최신 랭킹 id만 latest_ttl 마다 다시 조회하고,
+      id가 바뀌면 응답을 새로 만든다
+    - 그 외에는 dict 조회만 한다
+    """
+
+    def __init__(self, latest_ttl: int = RANKING_CACHE_MAX_AGE):
+        self._latest_ranking_id_cache = TTLCache(maxsize=1, ttl=latest_ttl)
+        self._ranking_id: Optional[int] = None
+        self._responses: Dict[str, CachedResponse] = {}
+
+    def get_or_none(self, ranking_type: str) -> Optional[CachedResponse]:
+        ranking_id = self._latest_ranking_id_cache.get("latest")
+        if ranking_id is None:
+            with db.connection_context():
+                ranking_id = fetch_latest_ranking_id()
+                if ranking_id is None:
+                    return None
+                if ranking_id != self._ranking_id:
+                    self.__set_responses(Ranking.get_by_id(ranking_id))
+            self._latest_ranking_id_cache["latest"] = ranking_id
+        return self._responses.get(ranking_type)
+
+    def __set_responses(self, ranking: Ranking):
+        last_modified = format_datetime(
+            ranking.created_at.astimezone(timezone.utc), usegmt=True
+        )
+        responses = {}
+        for ranking_type, response in (
+            ("alcohol", AlcoholRankingResponse.of(ranking)),
+            ("combination", CombinationRankingResponse.of(ranking)),
+        ):
+            body = response.model_dump_json().encode()
+            etag = f'"{ranking.id}-{hashlib.md5(body).hexdigest()}"'
+            responses[ranking_type] = CachedResponse(body, etag, last_modified)
+        self._responses = responses
+        self._ranking_id = ranking.id
+        logger.info(f"ranking response cache updated :: ranking id = {ranking.id}")
+
+
+ranking_response_cache_store = RankingResponseCacheStore()
@@ -0,0 +1,262 @@
+import asyncio
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from core.config.orm_config import run_in_new_db_state
+from core.domain.combination.combination_query_function import (
+    fetch_feed_pairings,
+    fetch_feed_pairings_with_like_counts,
+    fetch_liked_feed_pairings,
+    fetch_max_feed_like_id,
+)
+from core.util.logger import logger
+
+
+class CsrIndex:
+    """
+    배열 기반 CSR 인덱스 (행 id -> 가중치 내림차순 (열 id, 가중치) 목록)
+    - 행 id의 위치는 dict로, 행별 값은 indptr 구간 슬라이스로 바로 꺼낸다
+    """
+
+    def __init__(self, row_ids: np.ndarray, col_ids: np.ndarray, weights: np.ndarray):
+        order = np.lexsort((-weights, row_ids))
+        row_ids, self.col_ids, self.weights = (
+            row_ids[order],
+            col_ids[order],
+            weights[order],
+        )
+        unique_row_ids, row_starts = np.unique(row_ids, return_index=True)
+        self.indptr = np.append(row_starts, len(row_ids))
+        self.row_index: Dict[int, int] = {
+            row_id: index for index, row_id in enumerate(unique_row_ids.tolist())
+        }
+
+    def get_row(self, row_id: int, size: int) -> List[Tuple[int, float]]:
+        index = self.row_index.get(row_id)
+        if index is None:
+            return []
+        start = self.indptr[index]
+        end = min(self.indptr[index + 1], start + size)
+        return list(
+            zip(self.col_ids[start:end].tolist(), self.weights[start:end].tolist())
+        )
+
+
+def explode_pairs(
+    feeds: Iterable[Tuple[List[int], List[int], float]]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    피드별 (술 id 목록, 안주 id 목록, 가중치)를 술 x 안주 쌍 (술 id, 안주 id, 가중치) 배열로 펼친다
+    """
+    alcohol_ids, food_ids, weights = [], [], []
+    for feed_alcohol_ids, feed_food_ids, weight in feeds:
+        for alcohol_id in feed_alcohol_ids:
+            alcohol_ids.extend([alcohol_id] * len(feed_food_ids))
+            food_ids.extend(feed_food_ids)
+            weights.extend([weight] * len(feed_food_ids))
+    return (
+        np.array(alcohol_ids, dtype=np.int64),
+        np.array(food_ids, dtype=np.int64),
+        np.array(weights, dtype=np.float64),
+    )
+
+
+def sum_duplicate_pairs(
+    alcohol_ids: np.ndarray, food_ids: np.ndarray, weights: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    pairs, inverse = np.unique(
+        np.stack([alcohol_ids, food_ids], axis=1), axis=0, return_inverse=True
+    )
+    return (
+        pairs[:, 0],
+        pairs[:, 1],
+        np.bincount(inverse.ravel(), weights=weights, minlength=len(pairs)),
+    )
+
+
+def advance_watermark(
+    last_id: int, counted_ids: Set[int], new_ids: Iterable[int], window: int
+) -> Tuple[int, Set[int]]:
+    """
+    새로 센 id를 반영한 (watermark, watermark - window 이후 센 id 집합)
+    """
+    counted_ids = counted_ids | set(new_ids)
+    last_id = max(last_id, max(counted_ids, default=last_id))
+    return last_id, {id for id in counted_ids if id > last_id - window}
+
+
+class CooccurrenceMatrix:
+    """
+    술 x 안주 동시 출현 가중치 (희소 행렬, 술->안주 / 안주->술 CSR 두개로 저장)
+    - add()로 들어온 변경분은 쌓아두고 compact() 할 때 한번에 합쳐서 CSR을 다시 만든다
+    """
+
+    def __init__(self):
+        empty = np.zeros(0, dtype=np.int64)
+        self.alcohol_ids, self.food_ids = empty, empty
+        self.weights = np.zeros(0, dtype=np.float64)
+        self._pending: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        self.foods_by_alcohol = CsrIndex(empty, empty, self.weights)
+        self.alcohols_by_food = CsrIndex(empty, empty, self.weights)
+
+    def add(self, feeds: Iterable[Tuple[List[int], List[int], float]]):
+        alcohol_ids, food_ids, weights = explode_pairs(feeds)
+        if len(weights):
+            self._pending.append((alcohol_ids, food_ids, weights))
+
+    def compact(self) -> bool:
+        if not self._pending:
+            return False
+        alcohol_ids, food_ids, weights = sum_duplicate_pairs(
+            np.concatenate([self.alcohol_ids] + [p[0] for p in self._pending]),
+            np.concatenate([self.food_ids] + [p[1] for p in self._pending]),
+            np.concatenate([self.weights] + [p[2] for p in self._pending]),
+        )
+        self._pending = []
+        self.alcohol_ids, self.food_ids, self.weights = alcohol_ids, food_ids, weights
+        self.foods_by_alcohol = CsrIndex(alcohol_ids, food_ids, weights)
+        self.alcohols_by_food = CsrIndex(food_ids, alcohol_ids, weights)
+        return True
+
+    @property
+    def nnz(self) -> int:
+        return len(self.weights)
+
+
+class PairingCooccurrenceStore:
+    """
+    술-안주 추천용 동시 출현 행렬
+    - 피드 하나당 (술 x 안주) 쌍마다 1 + 좋아요 수 만큼 가중치를 더한다
+    - refresh_interval 마다 새 피드, 새 좋아요만 조회해서 더하고, 삭제/좋아요 취소 반영을 위해
+      full_rebuild_interval 마다 전체를 다시 만든다
+    - 시퀀스 id는 커밋 순서와 다를 수 있어서(늦게 커밋된 작은 id), 조회는 watermark 보다 safety_window 만큼
+      앞에서부터 다시 하고, 그 구간에서 이미 센 id 는 기억해뒀다가 건너뛴다
+      (피드 저장은 watermark row lock 을 잡지 않아서 like_rollup 의 lock 방식은 쓰지 않는다.
+      safety_window 개 이상의 id가 지나도록 커밋되지 않은 row는 다음 전체 재생성때 반영된다)
+    - 조회는 메모리에서만 한다 (best_foods_for_alcohol, best_alcohols_for_food)
+    """
+
+    def __init__(
+        self,
+        refresh_interval: float = 60,
+        full_rebuild_interval: float = 60 * 60,
+        safety_window: int = 1000,
+    ):
+        self.refresh_interval = refresh_interval
+        self.full_rebuild_interval = full_rebuild_interval
+        self.safety_window = safety_window
+        self.matrix = CooccurrenceMatrix()
+        self._last_feed_id = 0
+        self._last_feed_like_id = 0
+        self._counted_feed_ids: Set[int] = set()
+        self._counted_feed_like_ids: Set[int] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        rebuilt_at = None
+        while True:
+            try:
+                if rebuilt_at is None or (
+                    loop.time() - rebuilt_at > self.full_rebuild_interval
+                ):
+                    await run_in_new_db_state(self.rebuild)
+                    rebuilt_at = loop.time()
+                else:
+                    await run_in_new_db_state(self.refresh)
+            except Exception as e:
+                logger.error(f"failed to refresh pairing cooccurrence :: {e}")
+            await asyncio.sleep(self.refresh_interval)
+
+    def rebuild(self):
+        # safety_window 구간의 좋아요는 좋아요 수에 넣지 않고 하나씩 세서, 센 id 로 기억해둔다
+        max_feed_like_id = fetch_max_feed_like_id()
+        like_window_start = max(0, max_feed_like_id - self.safety_window)
+        feeds = fetch_feed_pairings_with_like_counts(0, like_window_start)
+        likes = fetch_liked_feed_pairings(like_window_start, max_feed_like_id)
+
+        matrix = CooccurrenceMatrix()
+        matrix.add(
+            (alcohol_ids, food_ids, 1 + like_count)
+            for _, alcohol_ids, food_ids, like_count in feeds
+        )
+        matrix.add((alcohol_ids, food_ids, 1) for _, alcohol_ids, food_ids in likes)
+        matrix.compact()
+
+        self.matrix = matrix
+        self._last_feed_id, self._counted_feed_ids = advance_watermark(
+            0, set(), [feed_id for feed_id, *_ in feeds], self.safety_window
+        )
+        self._last_feed_like_id, self._counted_feed_like_ids = advance_watermark(
+            max_feed_like_id,
+            set(),
+            [feed_like_id for feed_like_id, *_ in likes],
+            self.safety_window,
+        )
+        logger.info(f"pairing cooccurrence rebuilt :: nnz = {matrix.nnz}")
+
+    def refresh(self):
+        # 새 피드는 1, 새 좋아요는 하나당 1 (피드와 좋아요를 따로 세므로 어느 쪽이 먼저 보여도 한번씩만 센다)
+        max_feed_like_id = fetch_max_feed_like_id()
+        new_feeds = [
+            feed
+            for feed in fetch_feed_pairings(
+                max(0, self._last_feed_id - self.safety_window)
+            )
+            if feed[0] not in self._counted_feed_ids
+        ]
+        new_likes = [
+            like
+            for like in fetch_liked_feed_pairings(
+                max(0, self._last_feed_like_id - self.safety_window),
+                max_feed_like_id,
+            )
+            if like[0] not in self._counted_feed_like_ids
+        ]
+
+        self.matrix.add(
+            (alcohol_ids, food_ids, 1)
+            for _, alcohol_ids, food_ids in new_feeds + new_likes
+        )
+        self.matrix.compact()
+
+        self._last_feed_id, self._counted_feed_ids = advance_watermark(
+            self._last_feed_id,
+            self._counted_feed_ids,
+            [feed_id for feed_id, *_ in new_feeds],
+            self.safety_window,
+        )
+        self._last_feed_like_id, self._counted_feed_like_ids = advance_watermark(
+            max(self._last_feed_like_id, max_feed_like_id),
+            self._counted_feed_like_ids,
+            [feed_like_id for feed_like_id, *_ in new_likes],
+            self.safety_window,
+        )
+
+    def best_foods_for_alcohol(
+        self, alcohol_id: int, size: int = 10
+    ) -> List[Tuple[int, float]]:
+        return self.matrix.foods_by_alcohol.get_row(alcohol_id, size)
+
+    def best_alcohols_for_food(
+        self, food_id: int, size: int = 10
+    ) -> List[Tuple[int, float]]:
+        return self.matrix.alcohols_by_food.get_row(food_id, size)
+
+
+pairing_cooccurrence_store = PairingCooccurrenceStore()
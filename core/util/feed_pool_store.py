@@ -0,0 +1,93 @@
+import asyncio
+import random
+from typing import Dict, List, Optional, Tuple
+
+from core.config.orm_config import run_in_new_db_state
+from core.domain.feed.feed_query_function import fetch_all_by_alcohol_ids
+from core.domain.pairing.pairing_query_function import fetch_alcohol_ids_by_subtype
+from core.dto.feed_dto import FeedByAlcoholResponse
+from core.util.cache import pairing_cache_store
+from core.util.logger import logger
+
+
+def load_alcohol_feed_pools(
+    pool_size: int,
+) -> Tuple[List[str], Dict[str, List[FeedByAlcoholResponse]]]:
+    """
+    술 subtype 목록(Pairing.order 순)과 subtype별 랜덤 피드 후보 pool_size 개 조회
+    """
+    subtypes, pools = [], {}
+    for subtype, alcohol_ids in fetch_alcohol_ids_by_subtype():
+        subtypes.append(subtype)
+        pools[subtype] = [
+            FeedByAlcoholResponse.of(
+                subtype,
+                feed,
+                [
+                    food.name
+                    for food in map(
+                        pairing_cache_store.get_or_none, feed.food_pairing_ids
+                    )
+                    if food is not None
+                ],
+            )
+            for feed in fetch_all_by_alcohol_ids(alcohol_ids, pool_size)
+        ]
+    return subtypes, pools
+
+
+class AlcoholFeedPoolStore:
+    """
+    비로그인 홈 화면(/feeds/by-alcohols)용 술 subtype별 피드 후보
+    - refresh_interval 마다 subtype별 랜덤 피드 pool_size 개를 미리 조회해서 응답 형태로 들고 있는다
+    - 조회는 후보에서 랜덤으로 뽑기만 한다 (DB 조회 없음)
+    """
+
+    def __init__(self, refresh_interval: float = 60 * 5, pool_size: int = 50):
+        self.refresh_interval = refresh_interval
+        self.pool_size = pool_size
+        self._subtypes: List[str] = []
+        self._pools: Dict[str, List[FeedByAlcoholResponse]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"failed to refresh alcohol feed pools :: {e}")
+            await asyncio.sleep(self.refresh_interval)
+
+    async def refresh(self):
+        self._subtypes, self._pools = await run_in_new_db_state(
+            load_alcohol_feed_pools, self.pool_size
+        )
+
+    def get_subtypes(self) -> List[str]:
+        return self._subtypes
+
+    def sample(self, size: int) -> List[FeedByAlcoholResponse]:
+        # subtype 목록과 후보를 한번에 교체하므로, 같은 시점의 값으로 읽는다
+        subtypes, pools = self._subtypes, self._pools
+        feeds = []
+        for subtype in subtypes:
+            pool = pools.get(subtype, [])
+            feeds.extend(random.sample(pool, min(size, len(pool))))
+        return feeds
+
+
+alcohol_feed_pool_store = AlcoholFeedPoolStore()
@@ -0,0 +1,153 @@
+import asyncio
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from core.config.orm_config import run_in_new_db_state
+from core.domain.feed.feed_model import Feed
+from core.domain.feed.feed_query_function import fetch_recent_feeds_with_like_count
+from core.dto.feed_dto import FeedByPreferenceResponse
+from core.util.logger import logger
+
+
+class FeedRecommendIndex:
+    """
+    취향 기반 피드 추천용 인덱스
+    - 페어링 id -> 피드 위치 목록 (역색인)
+    - 피드별 기본 점수 = 0.5 * 최신순 (반감기 half_life_days 지수 감쇠) + 0.5 * 좋아요 수 (log, 최대값 기준 0~1)
+    - 추천 점수 = 취향과 겹치는 페어링 수 + 기본 점수 (겹치는 페어링이 하나라도 많으면 먼저 나온다)
+    """
+
+    def __init__(self, feeds: List[Feed], now: datetime, half_life_days: float):
+        self.responses: List[FeedByPreferenceResponse] = []
+        feed_ids, user_ids, ages, like_counts = [], [], [], []
+        postings: Dict[int, List[int]] = {}
+        for feed in feeds:
+            try:
+                response = FeedByPreferenceResponse.of(feed)
+            except KeyError:  # 삭제된 페어링이 달린 피드
+                continue
+            position = len(self.responses)
+            self.responses.append(response)
+            feed_ids.append(feed.id)
+            user_ids.append(feed.user.id)
+            ages.append((now - feed.created_at).total_seconds() / 86400)
+            like_counts.append(feed.like_count)
+            for pairing_id in {*feed.alcohol_pairing_ids, *feed.food_pairing_ids}:
+                postings.setdefault(pairing_id, []).append(position)
+
+        self.feed_ids = np.array(feed_ids, dtype=np.int64)
+        self.user_ids = np.array(user_ids, dtype=np.int64)
+        self.postings: Dict[int, np.ndarray] = {
+            pairing_id: np.array(positions, dtype=np.int64)
+            for pairing_id, positions in postings.items()
+        }
+
+        recency = 0.5 ** (np.clip(np.array(ages), 0, None) / half_life_days)
+        popularity = np.log1p(np.array(like_counts, dtype=np.float64))
+        if len(popularity) and popularity.max() > 0:
+            popularity /= popularity.max()
+        self.base_scores = 0.5 * recency + 0.5 * popularity
+
+    def __len__(self) -> int:
+        return len(self.responses)
+
+    def recommend(
+        self,
+        pairing_ids: Iterable[int],
+        size: int,
+        exclude_feed_ids: Iterable[int] = (),
+        blocked_user_ids: Iterable[int] = (),
+    ) -> List[FeedByPreferenceResponse]:
+        """
+        추천 점수 상위 size 개 (exclude_feed_ids, 차단한 유저의 피드 제외)
+        - 취향과 겹치는 피드가 size 개보다 적으면 기본 점수가 높은 피드로 채운다
+        """
+        if len(self) == 0:
+            return []
+
+        scores = self.base_scores.copy()
+        postings = [
+            self.postings[pairing_id]
+            for pairing_id in set(pairing_ids)
+            if pairing_id in self.postings
+        ]
+        if postings:
+            scores += np.bincount(np.concatenate(postings), minlength=len(scores))
+
+        excluded = np.isin(self.feed_ids, list(exclude_feed_ids)) | np.isin(
+            self.user_ids, list(blocked_user_ids)
+        )
+        candidates = np.flatnonzero(~excluded)
+        if len(candidates) > size:
+            candidates = candidates[
+                np.argpartition(-scores[candidates], size - 1)[:size]
+            ]
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [self.responses[position] for position in candidates]
+
+
+class FeedRecommendStore:
+    """
+    취향 기반 피드 추천 (/feeds/by-preferences)
+    - refresh_interval 마다 최근 피드 max_feeds 개를 좋아요 수와 함께 조회해서 인덱스를 새로 만든다
+    - 조회는 메모리의 인덱스에서만 한다 (DB 조회 없음)
+    """
+
+    def __init__(
+        self,
+        refresh_interval: float = 60 * 5,
+        max_feeds: int = 10000,
+        half_life_days: float = 14.0,
+    ):
+        self.refresh_interval = refresh_interval
+        self.max_feeds = max_feeds
+        self.half_life_days = half_life_days
+        self._index = FeedRecommendIndex([], datetime.now(), half_life_days)
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"failed to refresh feed recommend index :: {e}")
+            await asyncio.sleep(self.refresh_interval)
+
+    async def refresh(self):
+        feeds = await run_in_new_db_state(
+            fetch_recent_feeds_with_like_count, self.max_feeds
+        )
+        self._index = FeedRecommendIndex(feeds, datetime.now(), self.half_life_days)
+
+    def recommend(
+        self,
+        preference: dict,
+        size: int,
+        exclude_feed_ids: Iterable[int] = (),
+        blocked_user_ids: Iterable[int] = (),
+    ) -> List[FeedByPreferenceResponse]:
+        return self._index.recommend(
+            [*preference.get("alcohols", []), *preference.get("foods", [])],
+            size,
+            exclude_feed_ids,
+            blocked_user_ids,
+        )
+
+
+feed_recommend_store = FeedRecommendStore()
@@ -1,24 +1,62 @@
 from typing import List, Optional
 
 from core.domain.feed.feed_model import Feed
-from core.domain.feed.feed_query_function import fetch_feeds_likes_to_dict
-from core.domain.user.user_block_model import UserBlock
+from core.domain.feed.feed_query_function import (
+    fetch_like_counts_by_feed_ids,
+    fetch_comment_counts_by_feed_ids,
+    fetch_liked_feed_ids,
+)
 from core.domain.user.user_model import User
-from core.dto.feed_dto import RelatedFeedResponse, RandomFeedDto
+from core.dto.feed_dto import FeedResponse, RelatedFeedResponse
 from core.dto.page_dto import CursorPageResponse
-from core.util.logger import logger
+
+
+class FeedHydrator:
+    """
+    피드 목록 응답을 만들기 위한 부가 정보(작성자, 좋아요 수, 댓글 수, 좋아요 여부) 조회
+    - 피드 개수와 상관없이 고정된 횟수의 쿼리로 조회한다
+    - 작성자는 피드 조회 쿼리에서 User를 join 해서 가져온다
+    """
+
+    def __init__(self, login_user_id: Optional[int] = None):
+        self.login_user_id = login_user_id
+
+    def hydrate_feeds(self, feeds: List[Feed]) -> List[FeedResponse]:
+        if len(feeds) == 0:
+            return []
+
+        feed_ids = [feed.id for feed in feeds]
+        like_counts = fetch_like_counts_by_feed_ids(feed_ids)
+        comment_counts = fetch_comment_counts_by_feed_ids(feed_ids)
+        liked_feed_ids = fetch_liked_feed_ids(feed_ids, self.login_user_id)
+
+        return [
+            FeedResponse.of(
+                feed=feed,
+                likes_count=like_counts.get(feed.id, 0),
+                comments_count=comment_counts.get(feed.id, 0),
+                is_liked=feed.id in liked_feed_ids,
+            )
+            for feed in feeds
+        ]
 
 
 class FeedResponseBuilder:
+    @staticmethod
+    def feeds(feeds: List[Feed], size: int, login_user_id: Optional[int] = None):
+        feeds_response = FeedHydrator(login_user_id).hydrate_feeds(list(feeds))
+        return CursorPageResponse.of_feeds(feeds_response, size)
+
     @staticmethod
     def related_feeds(feeds: List[Feed], size: int, login_user: Optional[User] = None):
-        likes = fetch_feeds_likes_to_dict(feeds, login_user=login_user)
-        is_liked_dict = {
-            feed.id: any(like["feed"] == feed.id for like in likes) for feed in feeds
-        }
+        feeds = list(feeds)
+        liked_feed_ids = fetch_liked_feed_ids(
+            [feed.id for feed in feeds],
+            login_user.id if login_user is not None else None,
+        )
 
         feeds_response = [
-            RelatedFeedResponse.of(feed, is_liked_dict[feed.id]) for feed in feeds
+            RelatedFeedResponse.of(feed, feed.id in liked_feed_ids) for feed in feeds
         ]
 
         return CursorPageResponse(
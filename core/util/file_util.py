@@ -1,47 +1,292 @@
+import asyncio
+import re
 import urllib
 import uuid
+from io import BytesIO
+from typing import Dict, List, Optional, Tuple
 
 from botocore.exceptions import BotoCoreError, ClientError
 from fastapi import UploadFile, HTTPException
 from starlette import status
+from starlette.concurrency import run_in_threadpool
 
 from core.client.aws_client import S3Client
 from core.config.var_config import (
     S3_BUCKET_NAME,
     MAX_UPLOAD_FILE_MIB_SIZE,
     MAX_UPLOAD_FILE_BYTE_SIZE,
+    MAX_UPLOAD_FILE_COUNT,
+    MAX_UPLOAD_CONCURRENCY,
 )
+from core.domain.file.uploaded_image_model import UploadedImage, UploadedImageStatus
+from core.domain.file.uploaded_image_query_function import (
+    save_uploaded_image,
+    fetch_uploaded_image_by_s3_key,
+    update_uploaded_image,
+)
+from core.util.image_util import IMAGE_VARIANT_TYPES, create_image_variants_async
 
 directories = ["images"]
 
 s3 = S3Client()
 
+# (content_type, 확장자)
+IMAGE_TYPES = {
+    "png": ("image/png", "png"),
+    "jpeg": ("image/jpeg", "jpg"),
+    "gif": ("image/gif", "gif"),
+    "webp": ("image/webp", "webp"),
+    "heic": ("image/heic", "heic"),
+}
+
+
+def detect_image_type(header: bytes) -> Optional[Tuple[str, str]]:
+    """
+    파일 앞부분(magic number)으로 이미지 타입 판별, 지원하지 않는 타입이면 None
+    """
+    if header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return IMAGE_TYPES["png"]
+    if header.startswith(b"\xff\xd8\xff"):
+        return IMAGE_TYPES["jpeg"]
+    if header[:6] in (b"GIF87a", b"GIF89a"):
+        return IMAGE_TYPES["gif"]
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return IMAGE_TYPES["webp"]
+    if header[4:8] == b"ftyp" and header[8:12] in (b"heic", b"heix", b"mif1"):
+        return IMAGE_TYPES["heic"]
+    return None
+
+
+PRESIGNED_S3_KEY_PATTERN = re.compile(
+    r"^(?P<directory>[a-z]+)/[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\.(?P<extension>[a-z]+)$"
+)
+
 
-def upload_file_to_s3(file: UploadFile, directory: str) -> str:
+def validate_upload_file(file: UploadFile, directory: str):
     if directory not in directories:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="invalid directory"
         )
-    if file.size > MAX_UPLOAD_FILE_BYTE_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File size must be less than {MAX_UPLOAD_FILE_MIB_SIZE}MiB",
-        )
+    if file.size is not None and file.size > MAX_UPLOAD_FILE_BYTE_SIZE:
+        raise_file_too_large()
 
-    filename = f"{str(uuid.uuid4())}.png"
-    s3_key = f"{directory}/{filename}"
 
+def raise_file_too_large():
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"File size must be less than {MAX_UPLOAD_FILE_MIB_SIZE}MiB",
+    )
+
+
+async def read_upload_file(file: UploadFile, chunk_size: int = 1024 * 1024) -> bytes:
+    """
+    업로드 파일을 청크 단위로 읽고, MAX_UPLOAD_FILE_BYTE_SIZE를 넘으면 바로 400
+    - file.size는 클라이언트가 보낸 multipart 크기라 실제 읽은 크기로 다시 확인한다
+    """
+    await file.seek(0)
+    buffer = BytesIO()
+    while chunk := await file.read(chunk_size):
+        buffer.write(chunk)
+        if buffer.tell() > MAX_UPLOAD_FILE_BYTE_SIZE:
+            raise_file_too_large()
+    await file.seek(0)
+    return buffer.getvalue()
+
+
+def get_file_url(s3_key: str) -> str:
+    return "https://s3-ap-northeast-2.amazonaws.com/%s/%s" % (
+        S3_BUCKET_NAME,
+        urllib.parse.quote(s3_key, safe="~()*!.'"),
+    )
+
+
+async def upload_to_s3(file, s3_key: str, content_type: str):
     try:
-        s3.upload_fileobj(file.file, s3_key)
+        await run_in_threadpool(s3.upload_fileobj, file, s3_key, content_type)
     except (BotoCoreError, ClientError) as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"S3 upload failed: {str(e)}",
         )
 
-    url = "https://s3-ap-northeast-2.amazonaws.com/%s/%s" % (
-        S3_BUCKET_NAME,
-        urllib.parse.quote(s3_key, safe="~()*!.'"),
+
+async def upload_file_to_s3(
+    file: UploadFile, directory: str, user_id: Optional[int] = None
+) -> UploadedImage:
+    """
+    파일을 S3에 업로드하고 업로드 정보 저장
+    - 업로드는 스레드풀에서 실행해서 이벤트 루프를 막지 않는다
+    - 업로드된 파일(spooled temp file)을 크기 제한 안에서 청크 단위로 읽은 뒤 올린다
+    - 썸네일, webp 등 변환 이미지도 함께 만들어서 올린다 (image_util.create_image_variants)
+    """
+    validate_upload_file(file, directory)
+
+    data = await read_upload_file(file)
+    image_type = detect_image_type(data[:12])
+    if image_type is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Only png, jpeg, gif, webp, heic images can be uploaded",
+        )
+    content_type, extension = image_type
+
+    file_id = str(uuid.uuid4())
+    s3_key = f"{directory}/{file_id}.{extension}"
+    await upload_to_s3(BytesIO(data), s3_key, content_type)
+
+    variant_urls = await upload_image_variants(data, f"{directory}/{file_id}")
+
+    return save_uploaded_image(
+        user=user_id,
+        s3_key=s3_key,
+        url=get_file_url(s3_key),
+        content_type=content_type,
+        size=len(data),
+        thumbnail_url=variant_urls.get("thumbnail"),
+        webp_url=variant_urls.get("webp"),
+        classifier_image_url=variant_urls.get("classifier"),
     )
 
-    return url
+
+async def upload_image_variants(data: bytes, s3_key_prefix: str) -> Dict[str, str]:
+    """
+    변환 이미지를 만들어서 업로드하고 {변환 이름: url} 반환, 변환할 수 없는 이미지면 빈 dict
+    """
+    variants = await create_image_variants_async(data)
+    if variants is None:
+        return {}
+
+    async def upload(name: str, variant: bytes) -> Tuple[str, str]:
+        content_type, extension = IMAGE_VARIANT_TYPES[name]
+        s3_key = f"{s3_key_prefix}_{name}.{extension}"
+        await upload_to_s3(BytesIO(variant), s3_key, content_type)
+        return name, get_file_url(s3_key)
+
+    return dict(
+        await asyncio.gather(
+            *[upload(name, variant) for name, variant in variants.items()]
+        )
+    )
+
+
+async def upload_files_to_s3(
+    files: List[UploadFile], directory: str, user_id: Optional[int] = None
+) -> List[UploadedImage]:
+    """
+    여러 파일을 동시에 업로드 (최대 MAX_UPLOAD_CONCURRENCY 개씩), 요청 순서대로 반환
+    """
+    if len(files) > MAX_UPLOAD_FILE_COUNT:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Up to {MAX_UPLOAD_FILE_COUNT} files can be uploaded at once",
+        )
+    for file in files:
+        validate_upload_file(file, directory)
+
+    semaphore = asyncio.Semaphore(MAX_UPLOAD_CONCURRENCY)
+
+    async def upload(file: UploadFile) -> UploadedImage:
+        async with semaphore:
+            return await upload_file_to_s3(file, directory, user_id)
+
+    return list(await asyncio.gather(*[upload(file) for file in files]))
+
+
+def create_presigned_upload(directory: str, content_type: str, user_id: int) -> dict:
+    """
+    S3 직접 업로드용 presigned POST 발급
+    - 클라이언트는 url에 fields + file을 multipart/form-data로 POST 하고, 업로드 후 confirm_presigned_upload 호출
+    - 발급한 key는 유저와 함께 PENDING 상태로 저장한다 (발급받은 유저만 확인 가능)
+    """
+    if directory not in directories:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="invalid directory"
+        )
+    extensions = {
+        image_content_type: extension
+        for image_content_type, extension in IMAGE_TYPES.values()
+    }
+    if content_type not in extensions:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Only png, jpeg, gif, webp, heic images can be uploaded",
+        )
+
+    s3_key = f"{directory}/{str(uuid.uuid4())}.{extensions[content_type]}"
+    presigned_post = s3.generate_presigned_post(
+        s3_key, content_type, MAX_UPLOAD_FILE_BYTE_SIZE
+    )
+    save_uploaded_image(
+        user=user_id,
+        s3_key=s3_key,
+        url=get_file_url(s3_key),
+        content_type=content_type,
+        size=0,
+        status=UploadedImageStatus.PENDING.value,
+    )
+    return {
+        "url": presigned_post["url"],
+        "fields": presigned_post["fields"],
+        "key": s3_key,
+        "file_url": get_file_url(s3_key),
+    }
+
+
+async def confirm_presigned_upload(s3_key: str, user_id: int) -> UploadedImage:
+    """
+    presigned POST로 업로드된 파일 확인 후 업로드 정보 저장
+    - 해당 유저에게 발급한 key만 확인한다 (다른 유저의 key, 발급하지 않은 key는 400)
+    - 파일 크기, content type, 실제 파일 내용(magic number)이 맞지 않으면 S3에서 삭제한다
+    - 같은 key로 여러번 호출해도 한번만 저장된다
+    """
+    matched = PRESIGNED_S3_KEY_PATTERN.match(s3_key)
+    if matched is None or matched.group("directory") not in directories:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="invalid key"
+        )
+
+    uploaded_image = fetch_uploaded_image_by_s3_key(s3_key)
+    if (
+        uploaded_image is None
+        or uploaded_image.is_deleted
+        or uploaded_image.user_id != user_id
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="invalid key"
+        )
+    if uploaded_image.status == UploadedImageStatus.UPLOADED.value:
+        return uploaded_image
+
+    try:
+        head = await run_in_threadpool(s3.head_object, s3_key)
+        header = await run_in_threadpool(s3.read_object_header, s3_key)
+    except ClientError as e:
+        if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="file is not uploaded"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"S3 request failed: {str(e)}",
+        )
+
+    image_type = detect_image_type(header)
+    if (
+        image_type is None
+        or image_type[1] != matched.group("extension")
+        or head["ContentLength"] > MAX_UPLOAD_FILE_BYTE_SIZE
+    ):
+        # 이 유저에게 발급한 PENDING key만 여기까지 오므로, 다른 업로드 파일을 지울 일은 없다
+        await run_in_threadpool(s3.delete_object, s3_key)
+        update_uploaded_image(uploaded_image, is_deleted=True)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="uploaded file is not a valid image",
+        )
+
+    return update_uploaded_image(
+        uploaded_image,
+        content_type=image_type[0],
+        size=head["ContentLength"],
+        status=UploadedImageStatus.UPLOADED.value,
+    )
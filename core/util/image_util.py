@@ -0,0 +1,109 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from typing import Dict, Optional, Tuple
+
+from PIL import Image, ImageOps
+
+from core.util.logger import logger
+
+THUMBNAIL_SIZE = (400, 400)
+CLASSIFIER_IMAGE_SIZE = 224
+
+# 변환 이미지 이름: (content_type, 확장자)
+IMAGE_VARIANT_TYPES = {
+    "thumbnail": ("image/webp", "webp"),
+    "webp": ("image/webp", "webp"),
+    "classifier": ("image/jpeg", "jpg"),
+}
+
+
+class ImageProcessPool:
+    """
+    이미지 변환용 프로세스 풀 (CPU 작업이라 이벤트 루프, 스레드풀이 아닌 별도 프로세스에서 실행)
+    - 서버 프로세스에는 이미 스레드(스레드풀, DB 커넥션 풀, aiohttp)가 떠 있어서 fork 하면
+      자식 프로세스가 복사된 락 때문에 멈출 수 있으므로 spawn으로 워커를 만든다
+    - 앱 시작 시 start(), 종료 시 stop() 호출 (시작 전에 쓰면 그때 만든다)
+    """
+
+    def __init__(self, max_workers: int = 2):
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def start(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+    def stop(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        self.start()
+        return self._executor
+
+
+image_process_pool = ImageProcessPool()
+
+
+def create_image_variants(data: bytes) -> Dict[str, bytes]:
+    """
+    원본 이미지로 썸네일, webp 변환본, 분류 모델 입력용 이미지 생성
+    - AVIF는 현재 Pillow 버전(10.1)에서 지원하지 않아 생성하지 않는다
+    """
+    with Image.open(BytesIO(data)) as image:
+        image = ImageOps.exif_transpose(image)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+
+        thumbnail = image.copy()
+        thumbnail.thumbnail(THUMBNAIL_SIZE)
+
+        classifier_image = pad_to_square(image.convert("RGB")).resize(
+            (CLASSIFIER_IMAGE_SIZE, CLASSIFIER_IMAGE_SIZE)
+        )
+
+        return {
+            "thumbnail": to_bytes(thumbnail, "WEBP", quality=80),
+            "webp": to_bytes(image, "WEBP", quality=85),
+            "classifier": to_bytes(classifier_image, "JPEG", quality=90),
+        }
+
+
+def pad_to_square(image: Image.Image, fill: Tuple[int, int, int] = (0, 0, 0)):
+    """
+    분류 모델 학습 시와 같은 방식(ai.dataset.Padding)으로 정사각형 패딩
+    """
+    width, height = image.size
+    if width == height:
+        return image
+    size = max(width, height)
+    padded = Image.new(image.mode, (size, size), fill)
+    padded.paste(image, ((size - width) // 2, (size - height) // 2))
+    return padded
+
+
+def to_bytes(image: Image.Image, format: str, **params) -> bytes:
+    buffer = BytesIO()
+    image.save(buffer, format=format, **params)
+    return buffer.getvalue()
+
+
+async def create_image_variants_async(data: bytes) -> Optional[Dict[str, bytes]]:
+    """
+    워커 프로세스에서 변환 이미지 생성, 변환할 수 없는 이미지면 None
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(
+            image_process_pool.executor, create_image_variants, data
+        )
+    except Exception as e:
+        logger.warning(f"failed to create image variants :: {e}")
+        return None
@@ -1,6 +1,10 @@
+import hashlib
 import os, jwt
+import time
 from datetime import datetime, timedelta
 
+from cachetools import TLRUCache
+
 from core.config.var_config import (
     IS_PROD,
     KST,
@@ -56,3 +60,31 @@ def decode_token(token: str) -> dict:
         verify=True,
         options={"verify_signature": True},
     )
+
+
+class TokenCacheStore:
+    """
+    검증된 토큰 캐시 (토큰 sha256 digest -> claims)
+    - 인증이 필요한 요청마다 서명 검증, payload 파싱을 반복하지 않기 위함
+    - 캐시 만료 시간은 min(ttl, 토큰 exp) 이므로 만료된 토큰은 캐시에서도 사라진다
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: int = 60 * 10):
+        self.ttl = ttl
+        self._claims_cache = TLRUCache(
+            maxsize=maxsize, ttu=self._get_expire_time, timer=time.time
+        )
+
+    def _get_expire_time(self, key: bytes, claims: dict, now: float) -> float:
+        return min(now + self.ttl, claims.get("exp", now + self.ttl))
+
+    def decode(self, token: str) -> dict:
+        key = hashlib.sha256(token.encode()).digest()
+        claims = self._claims_cache.get(key)
+        if claims is None:
+            claims = decode_token(token)
+            self._claims_cache[key] = claims
+        return dict(claims)
+
+
+token_cache_store = TokenCacheStore()
@@ -0,0 +1,168 @@
+from bisect import bisect_left
+from typing import Dict, List, Tuple
+
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+SIZE_BUCKETS = (100, 1000, 10000, 100000, 1000000, 10000000)
+
+LabelValues = Tuple[str, ...]
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, label_names: List[str], buckets):
+        self.name = name
+        self.help = help
+        self.label_names = label_names
+        self.buckets = tuple(buckets)
+        self._bucket_counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, label_values: LabelValues, value: float):
+        bucket_counts = self._bucket_counts.get(label_values)
+        if bucket_counts is None:
+            bucket_counts = self._bucket_counts[label_values] = [0] * (
+                len(self.buckets) + 1
+            )
+            self._sums[label_values] = 0.0
+        bucket_counts[bisect_left(self.buckets, value)] += 1
+        self._sums[label_values] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for label_values, bucket_counts in self._bucket_counts.items():
+            labels = format_labels(self.label_names, label_values)
+            cumulative_count = 0
+            for upper_bound, count in zip(self.buckets, bucket_counts):
+                cumulative_count += count
+                lines.append(
+                    f'{self.name}_bucket{{{labels},le="{upper_bound}"}} {cumulative_count}'
+                )
+            cumulative_count += bucket_counts[-1]
+            lines.append(f'{self.name}_bucket{{{labels},le="+Inf"}} {cumulative_count}')
+            lines.append(f"{self.name}_sum{{{labels}}} {self._sums[label_values]}")
+            lines.append(f"{self.name}_count{{{labels}}} {cumulative_count}")
+        return lines
+
+
+class Counter:
+    def __init__(self, name: str, help: str, label_names: List[str]):
+        self.name = name
+        self.help = help
+        self.label_names = label_names
+        self._values: Dict[LabelValues, int] = {}
+
+    def inc(self, label_values: LabelValues, amount: int = 1):
+        self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for label_values, value in self._values.items():
+            labels = format_labels(self.label_names, label_values)
+            lines.append(f"{self.name}{{{labels}}} {value}")
+        return lines
+
+
+class Gauge:
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self.value = 0
+
+    def inc(self, amount: int = 1):
+        self.value += amount
+
+    def dec(self, amount: int = 1):
+        self.value -= amount
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.help}",
+            f"# TYPE {self.name} gauge",
+            f"{self.name} {self.value}",
+        ]
+
+
+def format_labels(label_names: List[str], label_values: LabelValues) -> str:
+    return ",".join(
+        f'{name}="{escape_label_value(value)}"'
+        for name, value in zip(label_names, label_values)
+    )
+
+
+def escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class HttpMetrics:
+    """
+    API 요청 메트릭 (Prometheus text format으로 /metrics 에서 조회)
+    - route 라벨은 실제 url이 아닌 path 템플릿(ex. /feeds/{feed_id})을 사용한다
+    """
+
+    def __init__(self):
+        self.requests_total = Counter(
+            "http_requests_total",
+            "Total HTTP requests by route, method and status code",
+            ["route", "method", "status"],
+        )
+        self.request_duration_seconds = Histogram(
+            "http_request_duration_seconds",
+            "HTTP request latency in seconds",
+            ["route", "method"],
+            LATENCY_BUCKETS,
+        )
+        self.request_size_bytes = Histogram(
+            "http_request_size_bytes",
+            "HTTP request body size in bytes",
+            ["route", "method"],
+            SIZE_BUCKETS,
+        )
+        self.response_size_bytes = Histogram(
+            "http_response_size_bytes",
+            "HTTP response body size in bytes",
+            ["route", "method"],
+            SIZE_BUCKETS,
+        )
+        self.requests_in_flight = Gauge(
+            "http_requests_in_flight", "HTTP requests currently being processed"
+        )
+
+    def observe(
+        self,
+        route: str,
+        method: str,
+        status: int,
+        duration: float,
+        request_size: int,
+        response_size: int,
+    ):
+        self.requests_total.inc((route, method, str(status)))
+        self.request_duration_seconds.observe((route, method), duration)
+        self.request_size_bytes.observe((route, method), request_size)
+        self.response_size_bytes.observe((route, method), response_size)
+
+    def render(self) -> str:
+        lines = []
+        for metric in (
+            self.requests_total,
+            self.request_duration_seconds,
+            self.request_size_bytes,
+            self.response_size_bytes,
+            self.requests_in_flight,
+        ):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+http_metrics = HttpMetrics()
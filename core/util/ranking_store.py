@@ -0,0 +1,196 @@
+import asyncio
+from datetime import date, datetime, timedelta
+from enum import Enum
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+from core.config.orm_config import db, run_in_new_db_state
+from core.domain.ranking.like_rollup_query_function import (
+    aggregate_new_feed_likes,
+    fetch_alcohol_like_buckets,
+    fetch_combination_like_buckets,
+)
+from core.util.logger import logger
+
+# 최근 HISTORY_DAYS 일은 일별로, 그 이전은 하나로 합쳐서 들고 있는다 (30일 윈도우 + 경계 1일)
+HISTORY_DAYS = 31
+
+
+class RankingWindow(str, Enum):
+    DAY = "24h"
+    WEEK = "7d"
+    MONTH = "30d"
+    ALL = "all"
+    TRENDING = "trending"
+
+
+WINDOW_DAYS = {
+    RankingWindow.DAY: 1,
+    RankingWindow.WEEK: 7,
+    RankingWindow.MONTH: 30,
+}
+
+
+def build_bucket_matrix(
+    rows: List[Tuple[Hashable, date, int]], today: date
+) -> Tuple[List[Hashable], np.ndarray]:
+    """
+    (key, date, like_count) 목록을 (key x 날짜) 행렬로 변환
+    - 마지막 열이 오늘, 첫번째 열은 HISTORY_DAYS 일 전 이전까지 합친 값
+    """
+    key_index: Dict[Hashable, int] = {}
+    key_indices, days_ago, like_counts = [], [], []
+    for key, bucket_date, like_count in rows:
+        key_indices.append(key_index.setdefault(key, len(key_index)))
+        days_ago.append((today - bucket_date).days)
+        like_counts.append(like_count)
+
+    columns = HISTORY_DAYS - np.clip(
+        np.array(days_ago, dtype=np.int64), 0, HISTORY_DAYS
+    )
+    matrix = np.zeros((len(key_index), HISTORY_DAYS + 1), dtype=np.float64)
+    np.add.at(
+        matrix,
+        (np.array(key_indices, dtype=np.int64), columns),
+        np.array(like_counts, dtype=np.float64),
+    )
+    return list(key_index.keys()), matrix
+
+
+def build_window_weights(
+    elapsed_fraction: float, trending_half_life_days: float
+) -> np.ndarray:
+    """
+    (날짜 x 윈도우) 가중치 행렬
+    - N일 윈도우 : 최근 N개 일별 버킷 + 윈도우 경계에 걸친 버킷은 오늘 지난 시간만큼 빼서 반영
+      (ex. 오후 6시의 24h = 오늘 + 어제의 1/4)
+    - trending : 버킷 나이(일)에 반감기 trending_half_life_days 인 지수 감쇠 적용
+    """
+    days_ago = np.arange(HISTORY_DAYS, -1, -1, dtype=np.float64)
+    weights = np.zeros((HISTORY_DAYS + 1, len(RankingWindow)), dtype=np.float64)
+    for column, window in enumerate(RankingWindow):
+        if window in WINDOW_DAYS:
+            window_days = WINDOW_DAYS[window]
+            weights[days_ago < window_days, column] = 1.0
+            weights[days_ago == window_days, column] = 1.0 - elapsed_fraction
+        elif window == RankingWindow.ALL:
+            weights[:, column] = 1.0
+        else:
+            weights[:, column] = 0.5 ** (
+                (days_ago + elapsed_fraction) / trending_half_life_days
+            )
+    return weights
+
+
+def compute_rankings(
+    keys: List[Hashable], matrix: np.ndarray, weights: np.ndarray, size: int
+) -> Dict[RankingWindow, List[Tuple[Hashable, float]]]:
+    """
+    전체 윈도우 점수를 행렬곱 한번으로 계산하고, 윈도우별 점수 상위 size 개 (key, score) 반환
+    """
+    scores = matrix @ weights
+    rankings = {}
+    for column, window in enumerate(RankingWindow):
+        window_scores = scores[:, column]
+        top = np.flatnonzero(window_scores > 0)
+        if len(top) > size:
+            top = top[np.argpartition(-window_scores[top], size - 1)[:size]]
+        top = top[np.argsort(-window_scores[top], kind="stable")]
+        rankings[window] = [(keys[index], float(window_scores[index])) for index in top]
+    return rankings
+
+
+def load_like_buckets(oldest_date: date):
+    with db.atomic():
+        aggregate_new_feed_likes(skip_locked=True)
+    return (
+        fetch_alcohol_like_buckets(oldest_date),
+        fetch_combination_like_buckets(oldest_date),
+    )
+
+
+class RankingWindowStore:
+    """
+    기간별(24h, 7d, 30d, 전체, trending) 술/조합 랭킹
+    - refresh_interval 마다 새 좋아요를 일간 집계에 반영하고, 일간 집계를 읽어서 모든 윈도우 랭킹을 미리 계산한다
+    - 조회는 미리 계산된 랭킹에서 꺼내기만 한다 (DB 조회 없음)
+    """
+
+    def __init__(
+        self,
+        refresh_interval: float = 60 * 5,
+        max_size: int = 50,
+        trending_half_life_days: float = 3.0,
+    ):
+        self.refresh_interval = refresh_interval
+        self.max_size = max_size
+        self.trending_half_life_days = trending_half_life_days
+        self.updated_at: Optional[datetime] = None
+        self._alcohol_rankings: Dict[RankingWindow, List[Tuple[int, float]]] = {}
+        self._combination_rankings: Dict[
+            RankingWindow, List[Tuple[Tuple[int, ...], float]]
+        ] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"failed to refresh ranking windows :: {e}")
+            await asyncio.sleep(self.refresh_interval)
+
+    async def refresh(self):
+        now = datetime.now()
+        today = now.date()
+        alcohol_rows, combination_rows = await run_in_new_db_state(
+            load_like_buckets, today - timedelta(days=HISTORY_DAYS)
+        )
+
+        elapsed_fraction = (
+            now - datetime.combine(today, datetime.min.time())
+        ).total_seconds() / 86400
+        weights = build_window_weights(elapsed_fraction, self.trending_half_life_days)
+        self._alcohol_rankings = compute_rankings(
+            *build_bucket_matrix(alcohol_rows, today), weights, self.max_size
+        )
+        self._combination_rankings = compute_rankings(
+            *build_bucket_matrix(
+                [
+                    (tuple(combined_ids), bucket_date, like_count)
+                    for combined_ids, bucket_date, like_count in combination_rows
+                ],
+                today,
+            ),
+            weights,
+            self.max_size,
+        )
+        self.updated_at = now
+
+    def get_alcohol_ranking(
+        self, window: RankingWindow, size: int
+    ) -> List[Tuple[int, float]]:
+        return self._alcohol_rankings.get(window, [])[:size]
+
+    def get_combination_ranking(
+        self, window: RankingWindow, size: int
+    ) -> List[Tuple[Tuple[int, ...], float]]:
+        return self._combination_rankings.get(window, [])[:size]
+
+
+ranking_window_store = RankingWindowStore()
@@ -0,0 +1,66 @@
+import re
+from typing import List, Optional, Tuple
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def split_words(text: Optional[str]) -> List[str]:
+    """
+    검색어, 검색 문서를 단어 단위로 분리 (소문자, '#' 등 특수문자 제거)
+    """
+    if text is None:
+        return []
+    return WORD_PATTERN.findall(text.lower())
+
+
+def escape_like(word: str) -> str:
+    """
+    LIKE/ILIKE 패턴용 escape ('\\', '%', '_'를 문자 그대로 찾도록, postgres 기본 escape 문자는 '\\')
+    """
+    return word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def tokenize_document(text: Optional[str]) -> List[str]:
+    """
+    검색 문서 토큰화
+    - 한글은 형태소 분석 없이 부분 검색이 되어야 해서 단어별 1-gram, 2-gram을 모두 저장한다
+    """
+    tokens = set()
+    for word in split_words(text):
+        tokens.update(word)
+        tokens.update(word[i : i + 2] for i in range(len(word) - 1))
+    return sorted(tokens)
+
+
+def tokenize_query(words: List[str]) -> List[str]:
+    """
+    검색어 토큰화 - 1글자 단어는 1-gram, 그 외에는 2-gram
+    """
+    tokens = set()
+    for word in words:
+        if len(word) == 1:
+            tokens.add(word)
+        else:
+            tokens.update(word[i : i + 2] for i in range(len(word) - 1))
+    return sorted(tokens)
+
+
+def find_highlights(text: str, words: List[str]) -> List[Tuple[int, int]]:
+    """
+    text에서 검색어가 등장하는 [start, end) 구간 목록 (겹치는 구간은 합친다)
+    """
+    lowered_text = text.lower()
+    spans = []
+    for word in words:
+        start = lowered_text.find(word)
+        while start != -1:
+            spans.append((start, start + len(word)))
+            start = lowered_text.find(word, start + 1)
+
+    merged_spans = []
+    for start, end in sorted(spans):
+        if merged_spans and start <= merged_spans[-1][1]:
+            merged_spans[-1] = (merged_spans[-1][0], max(merged_spans[-1][1], end))
+        else:
+            merged_spans.append((start, end))
+    return merged_spans
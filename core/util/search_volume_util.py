@@ -0,0 +1,69 @@
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# ratio 합계를 구하는 기간 (최근 30일 검색량 = 키워드 도구 월간 검색량)
+RATIO_SUM_DAYS = 30
+
+
+def build_trend_matrix(
+    trends: Dict[str, list], keywords: List[str], end_date: date
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    키워드별 트렌드(period, ratio 목록)를 (키워드 x 날짜) 2차원 배열로 변환
+    - 날짜 축은 가장 이른 period ~ end_date 이고, 데이터가 없는 날은 0
+    - end_date 이후 period는 버린다
+    - 두번째 반환값은 날짜 축 (datetime64[D])
+    """
+    rows, periods, ratios = [], [], []
+    for row, keyword in enumerate(keywords):
+        for item in trends.get(keyword, []):
+            rows.append(row)
+            periods.append(item["period"])
+            ratios.append(item["ratio"])
+
+    end = np.datetime64(end_date, "D")
+    days = np.array(periods, dtype="datetime64[D]")
+    start = days.min() if len(days) else end
+    dates = np.arange(start, end + 1)
+
+    matrix = np.zeros((len(keywords), len(dates)), dtype=np.float64)
+    columns = (days - start).astype(np.int64)
+    in_range = columns < len(dates)
+    matrix[np.array(rows, dtype=np.int64)[in_range], columns[in_range]] = np.array(
+        ratios, dtype=np.float64
+    )[in_range]
+    return matrix, dates
+
+
+def calculate_search_volumes(
+    trends: Dict[str, list],
+    volumes: Dict[str, int],
+    keywords: List[str],
+    end_date: Optional[date] = None,
+) -> Dict[str, int]:
+    """
+    키워드별 검색량 계산
+    - 데이터랩 트렌드는 상대값(ratio)이라서, 최근 30일 ratio 합이 키워드 도구의 월간 검색량이 되도록
+      키워드마다 계수를 곱하고 일별로 올림한 뒤 더한다
+    - 전체 키워드를 한번에 numpy 배열로 계산한다 (end_date 기본값은 어제)
+    """
+    if not keywords:
+        return {}
+    if end_date is None:
+        end_date = (datetime.today() - timedelta(1)).date()
+
+    matrix, _ = build_trend_matrix(trends, keywords, end_date)
+    ratio_sums = matrix[:, -RATIO_SUM_DAYS:].sum(axis=1)
+    monthly_volumes = np.array(
+        [volumes.get(keyword, 0) for keyword in keywords], dtype=np.float64
+    )
+    coefficients = np.divide(
+        monthly_volumes,
+        ratio_sums,
+        out=np.zeros_like(ratio_sums),
+        where=ratio_sums != 0,
+    )
+    daily_volumes = np.ceil(matrix * coefficients[:, np.newaxis])
+    return dict(zip(keywords, daily_volumes.sum(axis=1).astype(np.int64).tolist()))
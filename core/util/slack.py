@@ -1,9 +1,14 @@
+import asyncio
 import json
 import os
+from typing import Dict, List, Optional, Tuple
 
-import requests
+import aiohttp
+from pydantic import BaseModel
 
 from core.config.var_config import IS_PROD
+from core.util.logger import logger
+from core.util.rate_limiter import parse_retry_after
 
 if IS_PROD:
     webhook_rul = os.environ.get("SLACK_WEB_HOOK_URL")
@@ -13,17 +18,178 @@ else:
     webhook_rul = secrets.SLACK_WEB_HOOK_URL
 
 
-async def send_slack_message(
-    sender_name: str, channel: str, icon_emoji: str, message: str
-):
-    requests.post(
-        webhook_rul,
-        data=json.dumps(
-            {
-                "username": sender_name,
-                "channel": channel,
-                "icon_emoji": icon_emoji,
-                "text": message,
-            }
-        ),
+class SlackMessage(BaseModel):
+    sender_name: str
+    channel: str
+    icon_emoji: str
+    message: str
+
+
+class SlackLogShipper:
+    """
+    슬랙 로그 전송기
+    - 요청 처리 중에는 메모리 큐에 넣기만 하고, 백그라운드 태스크가 flush_interval 동안 모인 메시지를
+      채널(보낸이, 아이콘)별로 묶어서 전송한다
+    - 큐가 가득 차면 새 메시지를 버린다 (슬랙 장애가 API 응답에 영향을 주지 않게 하기 위함)
+    - 전송 실패 시(429, 5xx, 네트워크 오류) max_retries 만큼 backoff 하며 재시도한다
+    """
+
+    def __init__(
+        self,
+        webhook_url: str,
+        max_queue_size: int = 1000,
+        flush_interval: float = 2.0,
+        max_batch_size: int = 50,
+        max_text_length: int = 30000,
+        max_retries: int = 3,
+        max_retry_after: float = 30.0,
+        timeout: float = 5.0,
+    ):
+        self.webhook_url = webhook_url
+        self.max_queue_size = max_queue_size
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+        self.max_text_length = max_text_length
+        self.max_retries = max_retries
+        self.max_retry_after = max_retry_after
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.dropped_count = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._consumer_task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._consumer_task is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._session = aiohttp.ClientSession(timeout=self.timeout)
+        self._consumer_task = asyncio.create_task(self._consume())
+
+    async def stop(self):
+        if self._consumer_task is None:
+            return
+        self._consumer_task.cancel()
+        try:
+            await self._consumer_task
+        except asyncio.CancelledError:
+            pass
+
+        remaining = []
+        while not self._queue.empty():
+            remaining.append(self._queue.get_nowait())
+        if remaining:
+            await self._flush(remaining)
+
+        await self._session.close()
+        self._consumer_task = None
+        self._session = None
+        self._queue = None
+
+    def enqueue(self, message: SlackMessage) -> bool:
+        if self._queue is None:
+            logger.warning("slack log shipper is not started. message dropped")
+            return False
+        try:
+            self._queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            self.dropped_count += 1
+            if self.dropped_count % 100 == 1:
+                logger.warning(
+                    f"slack log queue is full. dropped count = {self.dropped_count}"
+                )
+            return False
+
+    async def _consume(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self._flush(batch)
+            except Exception as e:
+                logger.error(f"failed to flush slack logs :: {e}")
+
+    async def _flush(self, messages: List[SlackMessage]):
+        grouped: Dict[Tuple[str, str, str], List[str]] = {}
+        for message in messages:
+            key = (message.channel, message.sender_name, message.icon_emoji)
+            grouped.setdefault(key, []).append(message.message)
+
+        for (channel, sender_name, icon_emoji), texts in grouped.items():
+            for text in self._split_texts(texts):
+                await self._post(
+                    {
+                        "username": sender_name,
+                        "channel": channel,
+                        "icon_emoji": icon_emoji,
+                        "text": text,
+                    }
+                )
+
+    def _split_texts(self, texts: List[str]) -> List[str]:
+        chunks, current = [], ""
+        for text in texts:
+            text = text[: self.max_text_length]
+            if current and len(current) + len(text) + 1 > self.max_text_length:
+                chunks.append(current)
+                current = ""
+            current = f"{current}\n{text}" if current else text
+        if current:
+            chunks.append(current)
+        return chunks
+
+    async def _post(self, payload: dict):
+        for attempt in range(self.max_retries + 1):
+            retry_after = 2**attempt
+            try:
+                async with self._session.post(
+                    self.webhook_url, data=json.dumps(payload)
+                ) as response:
+                    if response.status == 200:
+                        return
+                    if response.status == 429:
+                        # 헤더가 없거나 해석할 수 없으면 backoff 값으로, 너무 길면 max_retry_after 까지만 기다린다
+                        header_retry_after = parse_retry_after(
+                            response.headers.get("Retry-After", "")
+                        )
+                        if header_retry_after is not None:
+                            retry_after = min(header_retry_after, self.max_retry_after)
+                    elif response.status < 500:
+                        logger.error(
+                            f"slack webhook rejected message :: {response.status} {await response.text()}"
+                        )
+                        return
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning(f"slack webhook request failed :: {e}")
+
+            if attempt < self.max_retries:
+                await asyncio.sleep(retry_after)
+
+        logger.error(f"failed to send slack message to {payload['channel']}")
+
+
+slack_log_shipper = SlackLogShipper(webhook_url=webhook_rul)
+
+
+def send_slack_message(sender_name: str, channel: str, icon_emoji: str, message: str):
+    """
+    슬랙 메시지 전송 요청 (큐에 넣기만 하고 바로 리턴)
+    """
+    slack_log_shipper.enqueue(
+        SlackMessage(
+            sender_name=sender_name,
+            channel=channel,
+            icon_emoji=icon_emoji,
+            message=message,
+        )
     )
@@ -0,0 +1,121 @@
+"""
+PublicKeyCache 테스트 (로컬 aiohttp stub 서버로 OAuth 제공자 공개키 API를 흉내낸다)
+- 실행: python -m unittest tests.test_oauth_client
+"""
+import asyncio
+import time
+import unittest
+
+import aiohttp
+from aiohttp import web
+
+from core.client.oauth_client import PublicKeyCache
+
+
+class StubKeyServer:
+    def __init__(self):
+        self.keys = {"kid-1": "key-1"}
+        self.status = 200
+        self.delay = 0.0
+        self.request_count = 0
+        self._runner = None
+        self.url = None
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.request_count += 1
+        await asyncio.sleep(self.delay)
+        if self.status != 200:
+            return web.Response(status=self.status)
+        return web.json_response(self.keys)
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/keys", self.handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/keys"
+
+    async def stop(self):
+        await self._runner.cleanup()
+
+
+class PublicKeyCacheTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = StubKeyServer()
+        await self.server.start()
+        self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5))
+
+    async def asyncTearDown(self):
+        await self.session.close()
+        await self.server.stop()
+
+    def build_cache(self, **kwargs) -> PublicKeyCache:
+        return PublicKeyCache(self.server.url, lambda keys: keys, **kwargs)
+
+    async def test_fetch_once_within_ttl(self):
+        cache = self.build_cache()
+        results = await asyncio.gather(
+            *[cache.get_key(self.session, "kid-1") for _ in range(20)]
+        )
+        self.assertEqual(results, ["key-1"] * 20)
+        self.assertEqual(self.server.request_count, 1)
+
+    async def test_unknown_kid_refetch_is_throttled(self):
+        cache = self.build_cache(min_refresh_interval=60)
+        await cache.get_key(self.session, "kid-1")
+        self.assertIsNone(await cache.get_key(self.session, "kid-unknown"))
+        self.assertEqual(self.server.request_count, 1)
+
+    async def test_failed_refresh_serves_stale_keys_without_waiting(self):
+        cache = self.build_cache(ttl=0, min_refresh_interval=0.5)
+        await cache.get_key(self.session, "kid-1")
+        await asyncio.sleep(0.55)
+
+        # 제공자 장애 : 느리게 500을 응답
+        self.server.status, self.server.delay = 500, 0.2
+        started_at = time.monotonic()
+        results = await asyncio.gather(
+            *[cache.get_key(self.session, "kid-1") for _ in range(20)]
+        )
+        elapsed = time.monotonic() - started_at
+
+        self.assertEqual(results, ["key-1"] * 20)
+        # 동시 요청 중 한번만 받기를 시도하고, 나머지는 줄 서지 않고 기존 키를 쓴다
+        self.assertEqual(self.server.request_count, 2)
+        self.assertLess(elapsed, 0.2 * 2)
+
+        # 실패 직후 요청은 락을 잡지 않고 바로 기존 키를 쓴다
+        started_at = time.monotonic()
+        self.assertEqual(await cache.get_key(self.session, "kid-1"), "key-1")
+        self.assertLess(time.monotonic() - started_at, 0.1)
+        self.assertEqual(self.server.request_count, 2)
+
+    async def test_refresh_again_after_min_refresh_interval(self):
+        cache = self.build_cache(ttl=0, min_refresh_interval=0.1)
+        await cache.get_key(self.session, "kid-1")
+
+        self.server.status = 500
+        self.assertEqual(await cache.get_key(self.session, "kid-1"), "key-1")
+        self.assertEqual(self.server.request_count, 1)
+
+        await asyncio.sleep(0.15)
+        self.assertEqual(await cache.get_key(self.session, "kid-1"), "key-1")
+        self.assertEqual(self.server.request_count, 2)
+
+        await asyncio.sleep(0.15)
+        self.server.status, self.server.keys = 200, {"kid-2": "key-2"}
+        self.assertEqual(await cache.get_key(self.session, "kid-2"), "key-2")
+        self.assertEqual(self.server.request_count, 3)
+
+    async def test_first_fetch_failure_raises(self):
+        self.server.status = 500
+        cache = self.build_cache()
+        with self.assertRaises(aiohttp.ClientError):
+            await cache.get_key(self.session, "kid-1")
+
+
+if __name__ == "__main__":
+    unittest.main()